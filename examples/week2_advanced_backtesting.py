@@ -238,9 +238,9 @@ def main():
     print("="*60)
     
     # Use best performing strategy for detailed report
-    best_strategy_name = max(multi_results.keys(), 
-                           key=lambda x: multi_results[x].sharpe_ratio)
-    best_result = multi_results[best_strategy_name]
+    best_strategy_name, best_result = max(
+        multi_results.items(), key=lambda item: item[1].sharpe_ratio
+    )
     
     print(f"\n📄 Generating report for best strategy: {best_strategy_name}")
     
@@ -49,6 +49,8 @@ def fetch_data(symbols: tuple, days: int, provider: str):
                 
         except Exception as e:
             click.echo(f"❌ Error: {str(e)}")
+        finally:
+            await engine.close()
     
     asyncio.run(_fetch_data())
 
@@ -105,6 +107,8 @@ def backtest(symbols: tuple, days: int, strategy: str, short_ma: int, long_ma: i
             
         except Exception as e:
             click.echo(f"❌ Backtest failed: {str(e)}")
+        finally:
+            await engine.close()
     
     asyncio.run(_backtest())
 
@@ -143,6 +147,7 @@ def paper_trade(symbols: tuple, duration: int, strategy: str):
             click.echo(f"Cash: ${portfolio['cash']:,.2f}")
             click.echo(f"Positions Value: ${portfolio['positions_value']:,.2f}")
             click.echo(f"Open Positions: {portfolio['num_positions']}")
+            await engine.close()
     
     asyncio.run(_paper_trade())
 
@@ -165,6 +170,8 @@ def prices(symbols: tuple):
                 
         except Exception as e:
             click.echo(f"❌ Error: {str(e)}")
+        finally:
+            await engine.close()
     
     asyncio.run(_get_prices())
 
@@ -786,9 +786,9 @@ def week2_demo(symbol, days, quick):
         click.echo("="*50)
         
         # Use best performing strategy
-        best_strategy_name = max(multi_results.keys(), 
-                               key=lambda x: multi_results[x].sharpe_ratio)
-        best_result = multi_results[best_strategy_name]
+        best_strategy_name, best_result = max(
+            multi_results.items(), key=lambda item: item[1].sharpe_ratio
+        )
         
         click.echo(f"\n📄 Generating comprehensive report for: {best_strategy_name}")
         
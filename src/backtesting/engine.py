@@ -14,9 +14,20 @@ from typing import Dict, List, Optional, Any, Tuple, Callable
 from datetime import datetime, date, timedelta
 from dataclasses import dataclass, field
 import logging
-from concurrent.futures import ThreadPoolExecutor
-import warnings
-warnings.filterwarnings('ignore')
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Signed direction of each trade action: +1 adds to a position, -1 reduces it
+TRADE_SIDES = {'buy': 1, 'sell': -1}
+
+# Fractions of the replay at which a progress callback is invoked
+PROGRESS_FRACTIONS = (0.25, 0.5, 0.75)
 
 @dataclass
 class BacktestConfig:
@@ -52,6 +63,16 @@ class BacktestResult:
     trade_history: pd.DataFrame = field(default_factory=pd.DataFrame)
     metrics: Dict[str, Any] = field(default_factory=dict)
 
+@dataclass(frozen=True)
+class PreparedData:
+    """Filtered market data and replay indexes, shared by every strategy run"""
+    data: pd.DataFrame
+    days64: np.ndarray         # datetime64[D] day of each row
+    dates64: np.ndarray        # sorted unique replay days
+    sym_codes: np.ndarray      # categorical symbol code of each row
+    sym_names: pd.Index        # symbol name for each code
+    close_prices: np.ndarray
+
 class BacktestEngine:
     """
     Advanced backtesting engine with historical replay capabilities
@@ -67,7 +88,8 @@ class BacktestEngine:
         data: pd.DataFrame,
         start_date: Optional[date] = None,
         end_date: Optional[date] = None,
-        symbols: Optional[List[str]] = None
+        symbols: Optional[List[str]] = None,
+        progress_callback: Optional[Callable[[float, np.ndarray], None]] = None
     ) -> BacktestResult:
         """
         Run a comprehensive backtest
@@ -78,23 +100,86 @@ class BacktestEngine:
             start_date: Start date for backtest
             end_date: End date for backtest  
             symbols: List of symbols to trade
+            progress_callback: Called at 25%, 50% and 75% of the replay with
+                the completed fraction and the portfolio values so far; an
+                exception raised by the callback aborts the backtest
             
         Returns:
             BacktestResult with comprehensive metrics
         """
-        self.logger.info(f"Starting backtest for strategy: {strategy.name}")
+        return self.run_backtest_prepared(
+            strategy, self.prepare(data, start_date, end_date, symbols), progress_callback
+        )
+    
+    def prepare(
+        self,
+        data: pd.DataFrame,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        symbols: Optional[List[str]] = None
+    ) -> PreparedData:
+        """
+        Filter market data and build the replay indexes once
         
-        # Prepare data
+        The result can be passed to ``run_backtest_prepared`` any number of
+        times, e.g. to evaluate many strategies over the same period.
+        
+        Raises:
+            ValueError: If no data is left after filtering
+        """
+        # Categorical symbols compare and group on integer codes
+        if not isinstance(data['symbol'].dtype, pd.CategoricalDtype):
+            data = data.assign(symbol=data['symbol'].astype('category'))
+        days64 = _trading_days(data['timestamp'])
+        mask = np.ones(len(data), dtype=bool)
         if start_date:
-            data = data[data['timestamp'].dt.date >= start_date]
+            mask &= days64 >= np.datetime64(start_date, 'D')
         if end_date:
-            data = data[data['timestamp'].dt.date <= end_date]
+            mask &= days64 <= np.datetime64(end_date, 'D')
         if symbols:
-            data = data[data['symbol'].isin(symbols)]
+            mask &= data['symbol'].isin(symbols).to_numpy()
+        if not mask.all():
+            data = data[mask]
+            days64 = days64[mask]
             
         if data.empty:
             raise ValueError("No data available for backtesting")
         
+        return PreparedData(
+            data=data,
+            days64=days64,
+            dates64=np.unique(days64),  # sorted by np.unique
+            sym_codes=data['symbol'].cat.codes.to_numpy(),
+            sym_names=data['symbol'].cat.categories,
+            close_prices=data['close_price'].to_numpy()
+        )
+    
+    def run_backtest_prepared(
+        self,
+        strategy,
+        prepared: PreparedData,
+        progress_callback: Optional[Callable[[float, np.ndarray], None]] = None
+    ) -> BacktestResult:
+        """
+        Run a backtest against data already filtered by ``prepare``
+        
+        Args:
+            strategy: Strategy instance to test
+            prepared: Prepared market data
+            progress_callback: See ``run_backtest``
+            
+        Returns:
+            BacktestResult with comprehensive metrics
+        """
+        self.logger.info(f"Starting backtest for strategy: {strategy.name}")
+        
+        data = prepared.data
+        days64 = prepared.days64
+        dates64 = prepared.dates64
+        sym_codes = prepared.sym_codes
+        sym_names = prepared.sym_names
+        close_prices = prepared.close_prices
+        
         # Initialize tracking variables
         portfolio_value = self.config.initial_capital
         cash = self.config.initial_capital
@@ -102,23 +187,23 @@ class BacktestEngine:
         portfolio_history = []
         trade_history = []
         
-        # Get unique dates for iteration
-        dates = sorted(data['timestamp'].dt.date.unique())
+        # Replay positions after which progress is reported
+        checkpoints = (
+            {int(len(dates64) * fraction) for fraction in PROGRESS_FRACTIONS}
+            if progress_callback is not None else set()
+        )
         
         # Historical replay - day by day
-        for current_date in dates:
+        for day_index, current_date64 in enumerate(dates64):
             # Get data up to current date
-            historical_data = data[data['timestamp'].dt.date <= current_date]
-            current_day_data = data[data['timestamp'].dt.date == current_date]
+            historical_data = data[days64 <= current_date64]
+            day_mask = days64 == current_date64
             
-            if current_day_data.empty:
-                continue
-                
-            # Update current prices for portfolio valuation
-            current_prices = {}
-            for symbol in current_day_data['symbol'].unique():
-                symbol_data = current_day_data[current_day_data['symbol'] == symbol]
-                current_prices[symbol] = symbol_data['close_price'].iloc[-1]
+            # Update current prices for portfolio valuation: last close per
+            # symbol, found as the first occurrence in the reversed day
+            day_codes, last_idx = np.unique(sym_codes[day_mask][::-1], return_index=True)
+            day_closes = close_prices[day_mask][::-1][last_idx]
+            current_prices = dict(zip(sym_names[day_codes], day_closes))
             
             # Calculate portfolio value
             positions_value = sum(
@@ -138,7 +223,7 @@ class BacktestEngine:
                 # Execute signals
                 for signal in signals:
                     trade_result = self._execute_trade(
-                        signal, cash, positions, current_prices, current_date
+                        signal, cash, positions, current_prices, current_date64.item()
                     )
                     
                     if trade_result:
@@ -147,24 +232,30 @@ class BacktestEngine:
                         trade_history.append(trade_result['trade_record'])
                         
             except Exception as e:
-                self.logger.warning(f"Error generating signals for {current_date}: {e}")
+                self.logger.warning(f"Error generating signals for {current_date64}: {e}")
             
             # Record daily portfolio state
             portfolio_history.append({
-                'date': current_date,
                 'portfolio_value': portfolio_value,
                 'cash': cash,
                 'positions_value': positions_value,
                 'num_positions': len(positions)
             })
+            
+            if day_index + 1 in checkpoints:
+                progress_callback(
+                    (day_index + 1) / len(dates64),
+                    np.array([row['portfolio_value'] for row in portfolio_history])
+                )
         
         # Calculate final metrics
         result = self._calculate_results(
             strategy.name,
-            dates[0] if dates else start_date,
-            dates[-1] if dates else end_date,
+            dates64[0].item(),
+            dates64[-1].item(),
             portfolio_history,
-            trade_history
+            trade_history,
+            dates64
         )
         
         self.logger.info(f"Backtest completed. Final return: {result.total_return:.2f}%")
@@ -187,28 +278,25 @@ class BacktestEngine:
         symbol = signal['symbol']
         action = signal['action']
         
-        if symbol not in current_prices:
+        side = TRADE_SIDES.get(action)
+        if side is None or symbol not in current_prices:
             return None
             
         price = current_prices[symbol]
         
-        # Apply slippage
-        if action == 'buy':
-            execution_price = price * (1 + self.config.slippage)
-        else:
-            execution_price = price * (1 - self.config.slippage)
+        # Apply slippage against the direction of the trade
+        execution_price = price * (1 + side * self.config.slippage)
         
         # Determine quantity
+        held_quantity = positions[symbol]['quantity'] if symbol in positions else 0
         if 'quantity' in signal:
             quantity = signal['quantity']
-        else:
+        elif side > 0:
             # Calculate quantity based on position size
-            position_size = signal.get('position_size', 0.1)
-            if action == 'buy':
-                max_value = cash * position_size
-                quantity = int(max_value / execution_price)
-            else:
-                quantity = positions.get(symbol, {}).get('quantity', 0)
+            max_value = cash * signal.get('position_size', 0.1)
+            quantity = int(max_value / execution_price)
+        else:
+            quantity = held_quantity
         
         if quantity <= 0:
             return None
@@ -217,44 +305,35 @@ class BacktestEngine:
         trade_value = quantity * execution_price
         commission = trade_value * self.config.commission
         
+        # Buys spend cash, sells raise it; commission is always paid
+        cash_delta = -side * trade_value - commission
+        if side > 0 and cash + cash_delta < 0:
+            return None  # Insufficient funds
+        if side < 0 and held_quantity < quantity:
+            return None  # Insufficient shares
+        
         # Execute trade
-        new_cash = cash
+        new_cash = cash + cash_delta
         new_positions = positions.copy()
-        
-        if action == 'buy':
-            total_cost = trade_value + commission
-            if total_cost <= cash:
-                new_cash -= total_cost
-                
-                if symbol in new_positions:
-                    # Update existing position
-                    old_qty = new_positions[symbol]['quantity']
-                    old_avg = new_positions[symbol]['avg_price']
-                    new_qty = old_qty + quantity
-                    new_avg = ((old_qty * old_avg) + trade_value) / new_qty
-                    
-                    new_positions[symbol] = {
-                        'quantity': new_qty,
-                        'avg_price': new_avg
-                    }
-                else:
-                    # New position
-                    new_positions[symbol] = {
-                        'quantity': quantity,
-                        'avg_price': execution_price
-                    }
-            else:
-                return None  # Insufficient funds
-                
-        elif action == 'sell':
-            if symbol in new_positions and new_positions[symbol]['quantity'] >= quantity:
-                new_cash += trade_value - commission
-                new_positions[symbol]['quantity'] -= quantity
-                
-                if new_positions[symbol]['quantity'] == 0:
-                    del new_positions[symbol]
-            else:
-                return None  # Insufficient shares
+        new_qty = held_quantity + side * quantity
+        
+        if new_qty == 0:
+            del new_positions[symbol]
+        elif side > 0 and held_quantity > 0:
+            # Update existing position
+            old_avg = positions[symbol]['avg_price']
+            new_positions[symbol] = {
+                'quantity': new_qty,
+                'avg_price': ((held_quantity * old_avg) + trade_value) / new_qty
+            }
+        elif side > 0:
+            # New position
+            new_positions[symbol] = {
+                'quantity': new_qty,
+                'avg_price': execution_price
+            }
+        else:
+            new_positions[symbol] = {**positions[symbol], 'quantity': new_qty}
         
         # Create trade record
         trade_record = {
@@ -282,7 +361,8 @@ class BacktestEngine:
         start_date: date,
         end_date: date,
         portfolio_history: List[Dict],
-        trade_history: List[Dict]
+        trade_history: List[Dict],
+        dates64: np.ndarray
     ) -> BacktestResult:
         """Calculate comprehensive backtest results"""
         
@@ -306,9 +386,10 @@ class BacktestEngine:
             )
         
         # Convert to DataFrames
-        portfolio_df = pd.DataFrame(portfolio_history)
-        portfolio_df['date'] = pd.to_datetime(portfolio_df['date'])
-        portfolio_df = portfolio_df.set_index('date')
+        portfolio_df = pd.DataFrame(
+            portfolio_history,
+            index=pd.DatetimeIndex(dates64.astype('datetime64[ns]'), name='date')
+        )
         
         trade_df = pd.DataFrame(trade_history) if trade_history else pd.DataFrame()
         
@@ -322,19 +403,18 @@ class BacktestEngine:
         years = days / 365.25
         annual_return = ((final_value / initial_value) ** (1 / years) - 1) * 100 if years > 0 else 0
         
-        # Risk metrics
-        daily_returns = portfolio_df['portfolio_value'].pct_change().dropna()
-        volatility = daily_returns.std() * np.sqrt(252) * 100  # Annualized
+        # Risk metrics: daily return moments, best/worst day and max drawdown
+        mean_return, std_return, max_dd, best_day, worst_day = _daily_return_stats(
+            portfolio_df['portfolio_value'].to_numpy(dtype=np.float64)
+        )
+        volatility = std_return * np.sqrt(252) * 100  # Annualized
         
         # Sharpe ratio
-        excess_returns = daily_returns - (self.config.risk_free_rate / 252)
-        sharpe_ratio = (excess_returns.mean() / daily_returns.std() * np.sqrt(252)) if daily_returns.std() > 0 else 0
+        excess_mean = mean_return - (self.config.risk_free_rate / 252)
+        sharpe_ratio = (excess_mean / std_return * np.sqrt(252)) if std_return > 0 else 0
         
         # Maximum drawdown
-        cumulative = (1 + daily_returns).cumprod()
-        rolling_max = cumulative.expanding().max()
-        drawdown = (cumulative - rolling_max) / rolling_max
-        max_drawdown = drawdown.min() * 100
+        max_drawdown = max_dd * 100
         
         # Calmar ratio
         calmar_ratio = annual_return / abs(max_drawdown) if max_drawdown != 0 else 0
@@ -419,10 +499,10 @@ class BacktestEngine:
                 'days_traded': days,
                 'years': years,
                 'total_commission': trade_df['commission'].sum() if not trade_df.empty else 0,
-                'avg_daily_return': daily_returns.mean() * 100,
-                'return_std': daily_returns.std() * 100,
-                'best_day': daily_returns.max() * 100,
-                'worst_day': daily_returns.min() * 100
+                'avg_daily_return': mean_return * 100,
+                'return_std': std_return * 100,
+                'best_day': best_day * 100,
+                'worst_day': worst_day * 100
             }
         )
     
@@ -449,27 +529,178 @@ class BacktestEngine:
         """
         results = {}
         
+        # Filter and index the data once for all strategies
+        try:
+            prepared = self.prepare(data, start_date, end_date)
+        except ValueError as e:
+            self.logger.error(f"Cannot run backtests: {e}")
+            return results
+        
         if parallel:
-            with ThreadPoolExecutor(max_workers=4) as executor:
-                futures = {
-                    executor.submit(
-                        self.run_backtest, strategy, data, start_date, end_date
-                    ): strategy.name
-                    for strategy in strategies
-                }
-                
-                for future in futures:
-                    try:
-                        result = future.result()
-                        results[futures[future]] = result
-                    except Exception as e:
-                        self.logger.error(f"Strategy {futures[future]} failed: {e}")
+            # Share the market data once instead of pickling it per strategy
+            blocks, layout = _share_frame(prepared.data)
+            try:
+                with ProcessPoolExecutor(
+                    max_workers=4,
+                    initializer=_attach_shared_frame,
+                    initargs=(layout,)
+                ) as executor:
+                    futures = {
+                        executor.submit(_run_backtest_in_worker, self.config, strategy): strategy.name
+                        for strategy in strategies
+                    }
+                    
+                    for future in futures:
+                        try:
+                            result = future.result()
+                            results[futures[future]] = result
+                        except Exception as e:
+                            self.logger.error(f"Strategy {futures[future]} failed: {e}")
+            finally:
+                for block in blocks:
+                    block.close()
+                    block.unlink()
         else:
             for strategy in strategies:
                 try:
-                    result = self.run_backtest(strategy, data, start_date, end_date)
+                    result = self.run_backtest_prepared(strategy, prepared)
                     results[strategy.name] = result
                 except Exception as e:
                     self.logger.error(f"Strategy {strategy.name} failed: {e}")
         
         return results
+
+def _trading_days(timestamps: pd.Series) -> np.ndarray:
+    """
+    Calendar day of each timestamp as a datetime64[D] array
+    
+    Timezone-aware timestamps are taken in their local wall time so the
+    result matches ``Series.dt.date`` without boxing Python date objects.
+    """
+    if isinstance(timestamps.dtype, pd.DatetimeTZDtype):
+        timestamps = timestamps.dt.tz_localize(None)
+    return timestamps.to_numpy().astype('datetime64[D]')
+
+def _fused_return_stats(values: np.ndarray) -> Tuple[float, float, float, float, float]:
+    """
+    Single pass over portfolio values computing daily return statistics
+    
+    Returns:
+        Tuple of (mean, sample std, max drawdown, best, worst) daily return,
+        all NaN when there are no returns
+    """
+    n = 0
+    mean = 0.0
+    m2 = 0.0
+    cumulative = 1.0
+    peak = -np.inf
+    max_dd = 0.0
+    best = -np.inf
+    worst = np.inf
+    
+    for i in range(1, values.shape[0]):
+        r = values[i] / values[i - 1] - 1.0
+        if np.isnan(r):
+            continue
+        
+        # Welford update keeps the variance stable in one pass
+        n += 1
+        delta = r - mean
+        mean += delta / n
+        m2 += delta * (r - mean)
+        
+        cumulative *= 1.0 + r
+        peak = max(peak, cumulative)
+        max_dd = min(max_dd, (cumulative - peak) / peak)
+        best = max(best, r)
+        worst = min(worst, r)
+    
+    if n == 0:
+        return np.nan, np.nan, np.nan, np.nan, np.nan
+    std = np.sqrt(m2 / (n - 1)) if n > 1 else np.nan
+    return mean, std, max_dd, best, worst
+
+if NUMBA_AVAILABLE:
+    _fused_return_stats = njit(cache=True)(_fused_return_stats)
+
+def _daily_return_stats(values: np.ndarray) -> Tuple[float, float, float, float, float]:
+    """Daily return statistics, fused in one compiled loop when numba is available"""
+    if NUMBA_AVAILABLE:
+        return _fused_return_stats(values)
+    
+    returns = values[1:] / values[:-1] - 1.0
+    returns = returns[~np.isnan(returns)]
+    if returns.size == 0:
+        return np.nan, np.nan, np.nan, np.nan, np.nan
+    
+    cumulative = np.cumprod(1.0 + returns)
+    peak = np.maximum.accumulate(cumulative)
+    std = returns.std(ddof=1) if returns.size > 1 else np.nan
+    return returns.mean(), std, ((cumulative - peak) / peak).min(), returns.max(), returns.min()
+
+# Market data attached from shared memory, prepared once per worker process
+_worker_data: Optional[PreparedData] = None
+_worker_blocks: List[shared_memory.SharedMemory] = []
+
+def _share_frame(data: pd.DataFrame) -> Tuple[List[shared_memory.SharedMemory], List[Tuple]]:
+    """
+    Copy each column of a DataFrame into its own shared memory block
+    
+    Numeric and naive datetime columns are shared as-is, timezone-aware
+    timestamps as UTC datetime64 and everything else (e.g. symbols) as
+    integer codes into a small table of unique values.
+    
+    Returns:
+        Tuple of (blocks owned by the caller, picklable column layout)
+    """
+    blocks = []
+    layout = []
+    
+    for column in data.columns:
+        series = data[column]
+        meta = None
+        
+        if isinstance(series.dtype, pd.DatetimeTZDtype):
+            meta = ('tz', str(series.dt.tz))
+            values = series.dt.tz_convert('UTC').dt.tz_localize(None).to_numpy()
+        elif series.dtype.kind in 'biufmM':
+            values = series.to_numpy()
+        else:
+            codes, uniques = pd.factorize(series)
+            meta = ('codes', uniques)
+            values = codes
+        
+        values = np.ascontiguousarray(values)
+        block = shared_memory.SharedMemory(create=True, size=max(values.nbytes, 1))
+        np.ndarray(values.shape, dtype=values.dtype, buffer=block.buf)[:] = values
+        
+        blocks.append(block)
+        layout.append((column, block.name, values.dtype.str, values.shape, meta))
+    
+    return blocks, layout
+
+def _attach_shared_frame(layout: List[Tuple]):
+    """Process pool initializer: rebuild the shared DataFrame as read-only views"""
+    global _worker_data
+    
+    columns = {}
+    for column, name, dtype, shape, meta in layout:
+        block = shared_memory.SharedMemory(name=name)
+        _worker_blocks.append(block)
+        
+        values = np.ndarray(shape, dtype=dtype, buffer=block.buf)
+        values.flags.writeable = False
+        
+        if meta is None:
+            columns[column] = values
+        elif meta[0] == 'tz':
+            columns[column] = pd.DatetimeIndex(values).tz_localize('UTC').tz_convert(meta[1])
+        else:
+            columns[column] = pd.Index(meta[1]).take(values, allow_fill=True, fill_value=np.nan)
+    
+    data = pd.DataFrame(columns, copy=False)
+    _worker_data = BacktestEngine().prepare(data)
+
+def _run_backtest_in_worker(config: BacktestConfig, strategy) -> BacktestResult:
+    """Run one backtest in a pool worker against the shared market data"""
+    return BacktestEngine(config).run_backtest_prepared(strategy, _worker_data)
@@ -13,21 +13,47 @@ import pandas as pd
 import numpy as np
 from typing import Dict, List, Optional, Tuple, Any
 from datetime import date, timedelta
+from collections import OrderedDict
 import logging
+import math
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+try:
+    import bottleneck as bn
+    BOTTLENECK_AVAILABLE = True
+except ImportError:
+    BOTTLENECK_AVAILABLE = False
+
+TRADING_DAYS_PER_YEAR = 252
+SQRT_TRADING_DAYS = math.sqrt(TRADING_DAYS_PER_YEAR)
 
 class PerformanceMetrics:
     """Calculate comprehensive performance metrics for backtesting results"""
     
-    def __init__(self, risk_free_rate: float = 0.02):
+    def __init__(self, risk_free_rate: float = 0.02, cache_size: int = 0):
         """
         Initialize performance metrics calculator
         
         Args:
             risk_free_rate: Annual risk-free rate for Sharpe ratio calculation
+            cache_size: Number of metric results to keep for repeated calls on
+                the same inputs (0 disables caching). Inputs are recognised by
+                a hash of their contents.
         """
         self.risk_free_rate = risk_free_rate
+        self.cache_size = cache_size
+        self._cache: OrderedDict = OrderedDict()
         self.logger = logging.getLogger(__name__)
     
+    def clear_cache(self):
+        """Drop all cached metric results"""
+        self._cache.clear()
+    
     def calculate_all_metrics(
         self,
         portfolio_values: pd.Series,
@@ -49,40 +75,92 @@ class PerformanceMetrics:
         Returns:
             Dictionary with all calculated metrics
         """
+        if self.cache_size <= 0 or portfolio_values.empty:
+            return self._calculate_all_metrics(
+                portfolio_values, trades, benchmark_values, start_date, end_date
+            )
+        
+        try:
+            key = (
+                _content_digest(portfolio_values), _content_digest(trades),
+                _content_digest(benchmark_values), start_date, end_date, self.risk_free_rate
+            )
+        except TypeError:
+            # Unhashable cell values (e.g. dicts in the trade history)
+            return self._calculate_all_metrics(
+                portfolio_values, trades, benchmark_values, start_date, end_date
+            )
+        cached = self._cache.get(key)
+        if cached is not None:
+            self._cache.move_to_end(key)
+            return dict(cached)
+        
+        metrics = self._calculate_all_metrics(
+            portfolio_values, trades, benchmark_values, start_date, end_date
+        )
+        self._cache[key] = dict(metrics)
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return metrics
+    
+    def _calculate_all_metrics(
+        self,
+        portfolio_values: pd.Series,
+        trades: pd.DataFrame,
+        benchmark_values: Optional[pd.Series],
+        start_date: Optional[date],
+        end_date: Optional[date]
+    ) -> Dict[str, Any]:
+        """Calculate all performance metrics without consulting the cache"""
         metrics = {}
         
-        # Basic return metrics
-        metrics.update(self._calculate_return_metrics(portfolio_values, start_date, end_date))
+        # Daily returns and drawdown statistics come from a single pass over
+        # the portfolio values and are shared by every portfolio-based metric
+        # group; decide up front which groups have enough data to be computed
+        values = portfolio_values.to_numpy(dtype=np.float64)
+        n_values = values.size
+        if n_values > 0:
+            returns, drawdown_stats = _returns_and_drawdown(values)
+        else:
+            returns, drawdown_stats = np.empty(0), None
+        n_returns = returns.size
         
-        # Risk metrics
-        metrics.update(self._calculate_risk_metrics(portfolio_values))
+        if n_values > 0:
+            # Basic return metrics
+            metrics.update(self._calculate_return_metrics(portfolio_values, start_date, end_date, returns))
         
-        # Drawdown metrics
-        metrics.update(self._calculate_drawdown_metrics(portfolio_values))
+        if n_returns >= 2:
+            # Risk metrics
+            metrics.update(self._calculate_risk_metrics(portfolio_values, returns))
+        
+        if n_values > 0:
+            # Drawdown metrics
+            metrics.update(self._calculate_drawdown_metrics(portfolio_values, returns, drawdown_stats))
         
         # Trade-based metrics
         if not trades.empty:
             metrics.update(self._calculate_trade_metrics(trades))
         
         # Benchmark comparison
-        if benchmark_values is not None:
+        if benchmark_values is not None and n_values > 0 and not benchmark_values.empty:
             metrics.update(self._calculate_benchmark_metrics(portfolio_values, benchmark_values))
         
-        # Advanced risk metrics
-        metrics.update(self._calculate_advanced_risk_metrics(portfolio_values))
+        if n_returns >= 10:
+            # Advanced risk metrics
+            metrics.update(self._calculate_advanced_risk_metrics(portfolio_values, returns))
         
-        return metrics
+        # Unwrap NumPy scalars so consumers serialize native floats and ints
+        return {key: value.item() if isinstance(value, np.generic) else value
+                for key, value in metrics.items()}
     
     def _calculate_return_metrics(
         self, 
         portfolio_values: pd.Series,
         start_date: Optional[date] = None,
-        end_date: Optional[date] = None
+        end_date: Optional[date] = None,
+        returns: Optional[np.ndarray] = None
     ) -> Dict[str, float]:
-        """Calculate return-based metrics"""
-        if portfolio_values.empty:
-            return {}
-        
+        """Calculate return-based metrics (needs at least one value)"""
         initial_value = portfolio_values.iloc[0]
         final_value = portfolio_values.iloc[-1]
         
@@ -90,53 +168,65 @@ class PerformanceMetrics:
         total_return = (final_value - initial_value) / initial_value
         
         # Calculate returns
-        returns = portfolio_values.pct_change().dropna()
+        if returns is None:
+            returns = portfolio_values.pct_change().dropna().to_numpy(dtype=np.float64)
         
         # Annualized return (CAGR)
         if start_date and end_date:
             days = (end_date - start_date).days
             years = days / 365.25
         else:
-            years = len(portfolio_values) / 252  # Approximate trading days per year
+            years = len(portfolio_values) / TRADING_DAYS_PER_YEAR  # Approximate
         
         if years > 0:
             annual_return = (final_value / initial_value) ** (1 / years) - 1
         else:
             annual_return = 0
         
+        r = returns
+        mean = _mean(r) if r.size > 0 else np.nan
+        std = _std(r) if r.size > 1 else np.nan
+        
         # Volatility (annualized)
-        volatility = returns.std() * np.sqrt(252) if len(returns) > 1 else 0
+        volatility = std * SQRT_TRADING_DAYS if r.size > 1 else 0
         
         return {
             'total_return': total_return,
             'annual_return': annual_return,
             'volatility': volatility,
-            'daily_returns_mean': returns.mean(),
-            'daily_returns_std': returns.std()
+            'daily_returns_mean': mean,
+            'daily_returns_std': std
         }
     
-    def _calculate_risk_metrics(self, portfolio_values: pd.Series) -> Dict[str, float]:
-        """Calculate risk-adjusted metrics"""
-        returns = portfolio_values.pct_change().dropna()
+    def _calculate_risk_metrics(
+        self,
+        portfolio_values: pd.Series,
+        returns: Optional[np.ndarray] = None
+    ) -> Dict[str, float]:
+        """Calculate risk-adjusted metrics (needs at least two returns)"""
+        if returns is None:
+            returns = portfolio_values.pct_change().dropna().to_numpy(dtype=np.float64)
         
-        if len(returns) < 2:
-            return {}
+        r = returns
+        mean = _mean(r)
+        std = _std(r)
+        excess_annual = mean * TRADING_DAYS_PER_YEAR - self.risk_free_rate
+        std_annual = std * SQRT_TRADING_DAYS
         
         # Sharpe Ratio
-        excess_returns = returns.mean() - (self.risk_free_rate / 252)
-        sharpe_ratio = (excess_returns / returns.std() * np.sqrt(252)) if returns.std() != 0 else 0
-        
-        # Sortino Ratio (downside deviation)
-        downside_returns = returns[returns < 0]
-        if len(downside_returns) > 0:
-            downside_deviation = downside_returns.std() * np.sqrt(252)
-            sortino_ratio = (returns.mean() * 252 - self.risk_free_rate) / downside_deviation
+        sharpe_ratio = excess_annual / std_annual if std != 0 else 0
+        
+        # Sortino Ratio (downside deviation below a zero target, over all periods)
+        downside = np.minimum(r, 0.0)
+        downside_deviation = np.sqrt(np.mean(downside * downside)) * SQRT_TRADING_DAYS
+        if downside_deviation > 0:
+            sortino_ratio = excess_annual / downside_deviation
         else:
             sortino_ratio = float('inf')
         
         # Information Ratio (assuming benchmark is risk-free rate)
-        tracking_error = returns.std() * np.sqrt(252)
-        information_ratio = (returns.mean() * 252 - self.risk_free_rate) / tracking_error if tracking_error != 0 else 0
+        tracking_error = std_annual
+        information_ratio = excess_annual / tracking_error if tracking_error != 0 else 0
         
         return {
             'sharpe_ratio': sharpe_ratio,
@@ -144,116 +234,81 @@ class PerformanceMetrics:
             'information_ratio': information_ratio
         }
     
-    def _calculate_drawdown_metrics(self, portfolio_values: pd.Series) -> Dict[str, float]:
-        """Calculate drawdown-related metrics"""
-        if portfolio_values.empty:
-            return {}
-        
-        # Calculate running maximum
-        running_max = portfolio_values.expanding().max()
-        
-        # Calculate drawdown
-        drawdown = (portfolio_values - running_max) / running_max
+    def _calculate_drawdown_metrics(
+        self,
+        portfolio_values: pd.Series,
+        returns: Optional[np.ndarray] = None,
+        drawdown_stats: Optional[Tuple[float, float, int, float, int]] = None
+    ) -> Dict[str, float]:
+        """Calculate drawdown-related metrics (needs at least one value)"""
+        if returns is None or drawdown_stats is None:
+            returns, drawdown_stats = _returns_and_drawdown(portfolio_values.to_numpy(dtype=np.float64))
         
-        # Maximum drawdown
-        max_drawdown = drawdown.min()
+        # Drawdown level and duration statistics
+        (max_drawdown, avg_drawdown, max_drawdown_duration,
+         avg_drawdown_duration, num_drawdown_periods) = drawdown_stats
         
         # Calmar ratio (annual return / max drawdown)
-        returns = portfolio_values.pct_change().dropna()
-        if len(returns) > 0:
-            annual_return = returns.mean() * 252
+        if returns.size > 0:
+            annual_return = _mean(returns) * TRADING_DAYS_PER_YEAR
             calmar_ratio = annual_return / abs(max_drawdown) if max_drawdown != 0 else 0
         else:
             calmar_ratio = 0
         
-        # Average drawdown
-        negative_drawdowns = drawdown[drawdown < 0]
-        avg_drawdown = negative_drawdowns.mean() if len(negative_drawdowns) > 0 else 0
-        
-        # Drawdown duration
-        in_drawdown = drawdown < 0
-        drawdown_periods = []
-        current_period = 0
-        
-        for is_in_dd in in_drawdown:
-            if is_in_dd:
-                current_period += 1
-            else:
-                if current_period > 0:
-                    drawdown_periods.append(current_period)
-                current_period = 0
-        
-        # Add final period if still in drawdown
-        if current_period > 0:
-            drawdown_periods.append(current_period)
-        
-        max_drawdown_duration = max(drawdown_periods) if drawdown_periods else 0
-        avg_drawdown_duration = np.mean(drawdown_periods) if drawdown_periods else 0
-        
         return {
             'max_drawdown': max_drawdown,
             'avg_drawdown': avg_drawdown,
             'calmar_ratio': calmar_ratio,
             'max_drawdown_duration': max_drawdown_duration,
             'avg_drawdown_duration': avg_drawdown_duration,
-            'num_drawdown_periods': len(drawdown_periods)
+            'num_drawdown_periods': num_drawdown_periods
         }
     
     def _calculate_trade_metrics(self, trades: pd.DataFrame) -> Dict[str, Any]:
-        """Calculate trade-based performance metrics"""
-        if trades.empty:
-            return {}
-        
+        """Calculate trade-based performance metrics (needs at least one trade)"""
         # Ensure we have required columns
         required_cols = ['pnl', 'entry_date', 'exit_date']
         if not all(col in trades.columns for col in required_cols):
             return {}
         
-        total_trades = len(trades)
-        winning_trades = len(trades[trades['pnl'] > 0])
-        losing_trades = len(trades[trades['pnl'] < 0])
+        # Classify each trade once and reuse the masks for every statistic
+        pnl = trades['pnl'].to_numpy(dtype=np.float64)
+        win_mask = pnl > 0
+        loss_mask = pnl < 0
+        
+        total_trades = len(pnl)
+        winning_trades = int(win_mask.sum())
+        losing_trades = int(loss_mask.sum())
         
         # Win rate
         win_rate = winning_trades / total_trades if total_trades > 0 else 0
         
-        # Profit factor
-        gross_profit = trades[trades['pnl'] > 0]['pnl'].sum()
-        gross_loss = abs(trades[trades['pnl'] < 0]['pnl'].sum())
+        # Profit factor; dot products with the masks sum each side without
+        # materializing filtered copies (NaN P&L is zeroed so it cannot
+        # poison the products, matching the masks which never select it)
+        weights = np.nan_to_num(pnl) if np.isnan(pnl).any() else pnl
+        gross_profit = np.dot(weights, win_mask)
+        gross_loss = -np.dot(weights, loss_mask)
         profit_factor = gross_profit / gross_loss if gross_loss != 0 else float('inf')
         
         # Average trade metrics
-        avg_win = trades[trades['pnl'] > 0]['pnl'].mean() if winning_trades > 0 else 0
-        avg_loss = trades[trades['pnl'] < 0]['pnl'].mean() if losing_trades > 0 else 0
-        avg_trade = trades['pnl'].mean()
+        avg_win = gross_profit / winning_trades if winning_trades > 0 else 0
+        avg_loss = -gross_loss / losing_trades if losing_trades > 0 else 0
+        avg_trade = _mean(pnl)
         
         # Trade duration
         trades_with_dates = trades.dropna(subset=['entry_date', 'exit_date'])
         if not trades_with_dates.empty:
-            durations = (pd.to_datetime(trades_with_dates['exit_date']) - 
-                        pd.to_datetime(trades_with_dates['entry_date'])).dt.days
-            avg_trade_duration = durations.mean()
-            max_trade_duration = durations.max()
+            durations = (_calendar_days(trades_with_dates['exit_date']) -
+                         _calendar_days(trades_with_dates['entry_date'])).astype(np.int64)
+            avg_trade_duration = _mean(durations)
+            max_trade_duration = _max(durations)
         else:
             avg_trade_duration = 0
             max_trade_duration = 0
         
         # Consecutive wins/losses
-        pnl_signs = np.sign(trades['pnl'].values)
-        consecutive_sequences = []
-        current_seq = 1
-        
-        for i in range(1, len(pnl_signs)):
-            if pnl_signs[i] == pnl_signs[i-1]:
-                current_seq += 1
-            else:
-                consecutive_sequences.append((pnl_signs[i-1], current_seq))
-                current_seq = 1
-        
-        if len(pnl_signs) > 0:
-            consecutive_sequences.append((pnl_signs[-1], current_seq))
-        
-        max_consecutive_wins = max([seq[1] for seq in consecutive_sequences if seq[0] > 0], default=0)
-        max_consecutive_losses = max([seq[1] for seq in consecutive_sequences if seq[0] < 0], default=0)
+        max_consecutive_wins, max_consecutive_losses = _consecutive_runs(pnl)
         
         return {
             'total_trades': total_trades,
@@ -277,54 +332,47 @@ class PerformanceMetrics:
         portfolio_values: pd.Series, 
         benchmark_values: pd.Series
     ) -> Dict[str, float]:
-        """Calculate metrics relative to benchmark"""
-        if portfolio_values.empty or benchmark_values.empty:
+        """Calculate metrics relative to benchmark (needs both series non-empty)"""
+        # Align series once, keeping only dates where both have a value
+        aligned = pd.concat([portfolio_values, benchmark_values], axis=1, join='inner').dropna()
+        if len(aligned) < 2:
             return {}
         
-        # Align series
-        common_index = portfolio_values.index.intersection(benchmark_values.index)
-        if len(common_index) < 2:
-            return {}
-        
-        portfolio_aligned = portfolio_values.loc[common_index]
-        benchmark_aligned = benchmark_values.loc[common_index]
-        
         # Calculate returns
-        portfolio_returns = portfolio_aligned.pct_change().dropna()
-        benchmark_returns = benchmark_aligned.pct_change().dropna()
+        values = aligned.to_numpy(dtype=np.float64)
+        portfolio_returns = np.diff(values[:, 0]) / values[:-1, 0]
+        benchmark_returns = np.diff(values[:, 1]) / values[:-1, 1]
         
-        if len(portfolio_returns) != len(benchmark_returns):
-            return {}
-        
-        # Alpha and Beta
-        covariance = np.cov(portfolio_returns, benchmark_returns)[0][1]
-        benchmark_variance = np.var(benchmark_returns)
+        # Alpha and Beta from sample (ddof=1) covariance and variance
+        portfolio_mean, benchmark_mean, benchmark_variance, covariance = _mean_var_cov(
+            portfolio_returns, benchmark_returns
+        )
         
-        if benchmark_variance != 0:
+        if benchmark_variance != 0 and not np.isnan(benchmark_variance):
             beta = covariance / benchmark_variance
-            alpha = portfolio_returns.mean() - beta * benchmark_returns.mean()
+            alpha = portfolio_mean - beta * benchmark_mean
         else:
             beta = 0
             alpha = 0
         
         # Tracking error
         excess_returns = portfolio_returns - benchmark_returns
-        tracking_error = excess_returns.std() * np.sqrt(252)
+        tracking_error = _std(excess_returns) * SQRT_TRADING_DAYS if excess_returns.size > 1 else np.nan
         
         # Information ratio
-        info_ratio = excess_returns.mean() * 252 / tracking_error if tracking_error != 0 else 0
+        info_ratio = _mean(excess_returns) * TRADING_DAYS_PER_YEAR / tracking_error if tracking_error != 0 else 0
         
         # Up/Down capture ratios
         up_market = benchmark_returns > 0
         down_market = benchmark_returns < 0
         
-        up_capture = (portfolio_returns[up_market].mean() / 
-                     benchmark_returns[up_market].mean()) if up_market.any() else 0
-        down_capture = (portfolio_returns[down_market].mean() / 
-                       benchmark_returns[down_market].mean()) if down_market.any() else 0
+        up_capture = (_mean(portfolio_returns[up_market]) / 
+                     _mean(benchmark_returns[up_market])) if up_market.any() else 0
+        down_capture = (_mean(portfolio_returns[down_market]) / 
+                       _mean(benchmark_returns[down_market])) if down_market.any() else 0
         
         return {
-            'alpha': alpha * 252,  # Annualized
+            'alpha': alpha * TRADING_DAYS_PER_YEAR,  # Annualized
             'beta': beta,
             'tracking_error': tracking_error,
             'information_ratio_vs_benchmark': info_ratio,
@@ -332,27 +380,36 @@ class PerformanceMetrics:
             'down_capture_ratio': down_capture
         }
     
-    def _calculate_advanced_risk_metrics(self, portfolio_values: pd.Series) -> Dict[str, float]:
-        """Calculate advanced risk metrics"""
-        returns = portfolio_values.pct_change().dropna()
+    def _calculate_advanced_risk_metrics(
+        self,
+        portfolio_values: pd.Series,
+        returns: Optional[np.ndarray] = None
+    ) -> Dict[str, float]:
+        """
+        Calculate advanced risk metrics (needs at least ten returns)
         
-        if len(returns) < 10:
-            return {}
+        VaR, CVaR and the tail ratio are computed in float32, which halves
+        the memory the quantile selection works over on long intraday
+        series; they are reported with float32 precision.
+        """
+        if returns is None:
+            returns = portfolio_values.pct_change().dropna().to_numpy(dtype=np.float64)
+        
+        r = returns
+        r32 = r.astype(np.float32)
         
-        # Value at Risk (VaR)
-        var_95 = np.percentile(returns, 5)
-        var_99 = np.percentile(returns, 1)
+        # Value at Risk (VaR); one quantile call sorts the returns once
+        var_99, var_95, upper_95 = np.quantile(r32, [0.01, 0.05, 0.95])
         
         # Conditional Value at Risk (CVaR/Expected Shortfall)
-        cvar_95 = returns[returns <= var_95].mean()
-        cvar_99 = returns[returns <= var_99].mean()
+        cvar_95 = _mean(r32[r32 <= var_95])
+        cvar_99 = _mean(r32[r32 <= var_99])
         
-        # Skewness and Kurtosis
-        skewness = returns.skew()
-        kurtosis = returns.kurtosis()
+        # Skewness and Kurtosis; the higher moments stay in float64
+        skewness, kurtosis = _sample_skew_kurtosis(r)
         
         # Tail ratio
-        tail_ratio = abs(np.percentile(returns, 95)) / abs(np.percentile(returns, 5))
+        tail_ratio = abs(upper_95) / abs(var_95)
         
         return {
             'var_95': var_95,
@@ -363,3 +420,220 @@ class PerformanceMetrics:
             'kurtosis': kurtosis,
             'tail_ratio': tail_ratio
         }
+
+def _returns_drawdown_kernel(values: np.ndarray):
+    """
+    Single pass over portfolio values computing returns and drawdown statistics
+    
+    Returns:
+        Tuple of (returns with NaN dropped, max drawdown, average drawdown,
+        max duration, average duration, number of drawdown periods)
+    """
+    returns = np.empty(max(values.shape[0] - 1, 0))
+    n_returns = 0
+    running_max = np.nan
+    max_drawdown = np.nan
+    drawdown_sum = 0.0
+    drawdown_count = 0
+    current_period = 0
+    max_period = 0
+    period_total = 0
+    num_periods = 0
+    
+    for i in range(values.shape[0]):
+        value = values[i]
+        
+        # Period return, dropping NaN like pct_change().dropna()
+        if i > 0:
+            period_return = value / values[i - 1] - 1.0
+            if not np.isnan(period_return):
+                returns[n_returns] = period_return
+                n_returns += 1
+        
+        # NaN values neither raise the peak nor count as drawdown
+        if np.isnan(running_max) or value > running_max:
+            running_max = value
+        drawdown = (value - running_max) / running_max
+        
+        if drawdown < 0:
+            drawdown_sum += drawdown
+            drawdown_count += 1
+            current_period += 1
+        elif current_period > 0:
+            period_total += current_period
+            num_periods += 1
+            max_period = max(max_period, current_period)
+            current_period = 0
+        
+        if not np.isnan(drawdown) and (np.isnan(max_drawdown) or drawdown < max_drawdown):
+            max_drawdown = drawdown
+    
+    # Add final period if still in drawdown
+    if current_period > 0:
+        period_total += current_period
+        num_periods += 1
+        max_period = max(max_period, current_period)
+    
+    avg_drawdown = drawdown_sum / drawdown_count if drawdown_count > 0 else 0.0
+    avg_period = period_total / num_periods if num_periods > 0 else 0.0
+    return returns[:n_returns], max_drawdown, avg_drawdown, max_period, avg_period, num_periods
+
+def _consecutive_kernel(pnl: np.ndarray) -> Tuple[int, int]:
+    """Longest runs of winning and losing trades in one pass"""
+    max_wins = 0
+    max_losses = 0
+    current_run = 0
+    previous_sign = 0
+    
+    for i in range(pnl.shape[0]):
+        # Branchless sign; NaN maps to 0 like a flat trade, and neither
+        # kind of run is counted, so both still break win/loss streaks
+        x = pnl[i]
+        sign = int(x > 0) - int(x < 0)
+        current_run = current_run * int(sign == previous_sign) + 1
+        previous_sign = sign
+        
+        max_wins = max(max_wins, current_run * int(sign > 0))
+        max_losses = max(max_losses, current_run * int(sign < 0))
+    
+    return max_wins, max_losses
+
+def _mean_var_cov_kernel(x: np.ndarray, y: np.ndarray) -> Tuple[float, float, float, float]:
+    """
+    Welford single pass over paired samples
+    
+    Returns:
+        Tuple of (mean of x, mean of y, sample variance of y,
+        sample covariance of x and y); the last two are NaN below two pairs
+    """
+    mean_x = 0.0
+    mean_y = 0.0
+    m2_y = 0.0
+    co_moment = 0.0
+    
+    for i in range(x.shape[0]):
+        n = i + 1
+        dx = x[i] - mean_x
+        dy = y[i] - mean_y
+        mean_x += dx / n
+        mean_y += dy / n
+        # Use the updated y mean so the products stay unbiased
+        m2_y += dy * (y[i] - mean_y)
+        co_moment += dx * (y[i] - mean_y)
+    
+    n = x.shape[0]
+    if n < 2:
+        return mean_x, mean_y, np.nan, np.nan
+    return mean_x, mean_y, m2_y / (n - 1), co_moment / (n - 1)
+
+def _sample_skew_kurtosis(r: np.ndarray) -> Tuple[float, float]:
+    """
+    Bias-corrected sample skewness and excess kurtosis
+    
+    Same estimators as ``Series.skew()``/``Series.kurtosis()``, computed
+    from the central moments of the array; both are 0 for constant input.
+    """
+    n = r.size
+    deviations = r - r.mean()
+    squared = deviations * deviations
+    m2 = squared.mean()
+    if m2 == 0:
+        return 0.0, 0.0
+    m3 = (squared * deviations).mean()
+    m4 = (squared * squared).mean()
+    
+    skewness = np.sqrt(n * (n - 1)) / (n - 2) * m3 / m2 ** 1.5
+    kurtosis = (n - 1) / ((n - 2) * (n - 3)) * ((n + 1) * m4 / (m2 * m2) - 3 * (n - 1))
+    return skewness, kurtosis
+
+def _calendar_days(dates: pd.Series) -> np.ndarray:
+    """Dates as datetime64[D], parsing only when the column is not already datetime"""
+    if not pd.api.types.is_datetime64_any_dtype(dates):
+        dates = pd.to_datetime(dates)
+    if dates.dt.tz is not None:
+        dates = dates.dt.tz_localize(None)
+    return dates.to_numpy().astype('datetime64[D]')
+
+def _content_digest(obj) -> Optional[Tuple[int, int]]:
+    """Row count and hash of a Series/DataFrame's index and values (None stays None)"""
+    if obj is None:
+        return None
+    hashed = pd.util.hash_pandas_object(obj, index=True).to_numpy()
+    columns = tuple(obj.columns) if isinstance(obj, pd.DataFrame) else obj.name
+    return len(hashed), hash((columns, hashed.tobytes()))
+
+def _mean(a: np.ndarray) -> float:
+    """Arithmetic mean ignoring NaNs, using bottleneck when it is available"""
+    return bn.nanmean(a) if BOTTLENECK_AVAILABLE else np.nanmean(a)
+
+def _std(a: np.ndarray) -> float:
+    """Sample standard deviation (ddof=1) ignoring NaNs, using bottleneck when it is available"""
+    return bn.nanstd(a, ddof=1) if BOTTLENECK_AVAILABLE else np.nanstd(a, ddof=1)
+
+def _max(a: np.ndarray) -> float:
+    """Maximum ignoring NaNs, using bottleneck when it is available"""
+    return bn.nanmax(a) if BOTTLENECK_AVAILABLE else np.nanmax(a)
+
+if NUMBA_AVAILABLE:
+    # NumPy error model: a zero value yields inf/NaN returns as in pandas
+    _returns_drawdown_kernel = njit(cache=True, error_model='numpy')(_returns_drawdown_kernel)
+    _consecutive_kernel = njit(cache=True)(_consecutive_kernel)
+    _mean_var_cov_kernel = njit(cache=True)(_mean_var_cov_kernel)
+
+def _returns_and_drawdown(
+    values: np.ndarray
+) -> Tuple[np.ndarray, Tuple[float, float, int, float, int]]:
+    """Period returns and drawdown statistics, compiled with numba when it is available"""
+    if NUMBA_AVAILABLE:
+        returns, *drawdown_stats = _returns_drawdown_kernel(values)
+        return returns, tuple(drawdown_stats)
+    
+    with np.errstate(divide='ignore', invalid='ignore'):
+        returns = values[1:] / values[:-1] - 1
+    returns = returns[~np.isnan(returns)]
+    
+    # Running maximum (fmax skips NaN like expanding().max())
+    running_max = np.fmax.accumulate(values)
+    drawdown = (values - running_max) / running_max
+    
+    negative_drawdowns = drawdown[drawdown < 0]
+    avg_drawdown = _mean(negative_drawdowns) if negative_drawdowns.size else 0
+    
+    # Durations are the run lengths of the in-drawdown mask, taken from
+    # the +1/-1 transitions of the zero-padded mask
+    in_drawdown = (drawdown < 0).astype(np.int8)
+    transitions = np.diff(np.concatenate(([0], in_drawdown, [0])))
+    periods = np.flatnonzero(transitions == -1) - np.flatnonzero(transitions == 1)
+    avg_period = _mean(periods) if periods.size else 0
+    
+    return returns, (np.nanmin(drawdown), avg_drawdown, periods.max(initial=0), avg_period, periods.size)
+
+def _mean_var_cov(x: np.ndarray, y: np.ndarray) -> Tuple[float, float, float, float]:
+    """Means, variance of y and covariance, compiled with numba when it is available"""
+    if NUMBA_AVAILABLE:
+        return _mean_var_cov_kernel(x, y)
+    
+    # Plain means so NaN propagates into every output, as in the kernel
+    n = x.size
+    mean_x = x.mean() if n else 0.0
+    mean_y = y.mean() if n else 0.0
+    if n < 2:
+        return mean_x, mean_y, np.nan, np.nan
+    
+    deviations_y = y - mean_y
+    return (mean_x, mean_y, np.dot(deviations_y, deviations_y) / (n - 1),
+            np.dot(x - mean_x, deviations_y) / (n - 1))
+
+def _consecutive_runs(pnl: np.ndarray) -> Tuple[int, int]:
+    """Longest winning and losing streaks, compiled with numba when it is available"""
+    if NUMBA_AVAILABLE:
+        return _consecutive_kernel(pnl)
+    
+    # Split the sign sequence into runs at every sign change
+    signs = np.sign(pnl)
+    change_points = np.flatnonzero(np.diff(signs) != 0) + 1
+    bounds = np.concatenate(([0], change_points, [len(signs)]))
+    run_lengths = np.diff(bounds)
+    run_signs = signs[bounds[:-1]]
+    
+    return run_lengths[run_signs > 0].max(initial=0), run_lengths[run_signs < 0].max(initial=0)
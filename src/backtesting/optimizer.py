@@ -11,22 +11,102 @@ This module provides sophisticated parameter optimization capabilities including
 
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Optional, Tuple, Any, Callable, Union
+from typing import Dict, List, Optional, Tuple, Any, Callable, Union, Iterator, Sequence
 from datetime import date, timedelta
 import logging
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from itertools import product
+import os
+import bisect
+import numbers
+import dataclasses
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, as_completed
 import warnings
-warnings.filterwarnings('ignore')
 
 try:
-    from skopt import gp_minimize
+    from skopt import Optimizer, dump as skopt_dump, load as skopt_load
     from skopt.space import Real, Integer, Categorical
     SKOPT_AVAILABLE = True
 except ImportError:
     SKOPT_AVAILABLE = False
 
-from .engine import BacktestEngine, BacktestConfig
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+from .engine import (
+    BacktestEngine, BacktestConfig, BacktestResult, PreparedData, _daily_return_stats, _trading_days
+)
+
+# Completed evaluations required before early stopping starts pruning
+EARLY_STOP_MIN_COMPLETED = 5
+
+# Metrics that can be evaluated on a partial replay for early stopping
+RUNNING_METRICS = ('sharpe_ratio', 'total_return', 'max_drawdown')
+
+class EarlyStopped(Exception):
+    """Raised from a progress callback to abandon an unpromising backtest"""
+
+class ParameterGrid:
+    """
+    Cartesian product of parameter values, stored as one row of value
+    indices per combination; dicts are built only when a row is accessed
+    """
+    
+    def __init__(self, names: List[str], axes: List[Sequence[Any]]):
+        """
+        Args:
+            names: Parameter names, one per axis
+            axes: Candidate values for each parameter
+        """
+        self.names = names
+        self.axes = axes
+        
+        if axes:
+            grids = np.meshgrid(*[np.arange(len(axis)) for axis in axes], indexing='ij')
+            self.indices = np.stack(grids, axis=-1).reshape(-1, len(axes))
+        else:
+            # A single empty combination, as itertools.product() yields
+            self.indices = np.zeros((1, 0), dtype=np.intp)
+    
+    def __len__(self) -> int:
+        return self.indices.shape[0]
+    
+    def __getitem__(self, i: int) -> Dict[str, Any]:
+        return self.as_dict(i)
+    
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        for i in range(len(self)):
+            yield self.as_dict(i)
+    
+    def as_dict(self, i: int) -> Dict[str, Any]:
+        """Parameter dict for combination ``i``"""
+        row = self.indices[i]
+        return {name: axis[j] for name, axis, j in zip(self.names, self.axes, row)}
+    
+    def as_array(self) -> np.ndarray:
+        """
+        Parameter values as an (n_combinations, n_parameters) array
+        
+        Columns follow ``names``; the array is float64 when every parameter
+        is numeric and object when any takes non-numeric choices.
+        """
+        numeric = all(isinstance(value, numbers.Real) for axis in self.axes for value in axis)
+        dtype = np.float64 if numeric else object
+        
+        columns = []
+        for axis in self.axes:
+            column = np.empty(len(axis), dtype=dtype)
+            for k, value in enumerate(axis):
+                column[k] = value
+            columns.append(column)
+        
+        # Broadcast each axis over the open mesh straight into the output rows
+        out = np.empty(tuple(len(axis) for axis in self.axes) + (len(self.axes),), dtype=dtype)
+        for j, grid in enumerate(np.ix_(*columns)):
+            out[..., j] = grid
+        return out.reshape(len(self), len(self.axes))
 
 class ParameterSpace:
     """Define parameter space for optimization"""
@@ -48,7 +128,7 @@ class ParameterSpace:
             'values': values
         }
     
-    def get_grid_combinations(self) -> List[Dict[str, Any]]:
+    def get_grid_combinations(self) -> ParameterGrid:
         """Generate all parameter combinations for grid search"""
         param_names = list(self.parameters.keys())
         param_values = []
@@ -73,54 +153,177 @@ class ParameterSpace:
             
             param_values.append(values)
         
-        # Generate all combinations
-        combinations = []
-        for combo in product(*param_values):
-            param_dict = dict(zip(param_names, combo))
-            combinations.append(param_dict)
-        
-        return combinations
+        # Combinations are generated as index rows and turned into dicts lazily
+        return ParameterGrid(param_names, param_values)
     
-    def get_random_sample(self, n_samples: int = 100) -> List[Dict[str, Any]]:
-        """Generate random parameter combinations"""
+    def get_random_sample(self, n_samples: int = 100, seed: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Generate distinct random parameter combinations
+        
+        Duplicates are redrawn; after ``10 * n_samples`` draws (e.g. when the
+        space has fewer than ``n_samples`` combinations) the distinct ones
+        found so far are returned.
+        """
+        rng = np.random.default_rng(seed)
+        
+        # Finite spaces: draw distinct grid rows directly, no redraws needed
+        combinations = self._sample_discrete(rng, n_samples)
+        if combinations is not None:
+            return combinations
+        
         combinations = []
+        seen = set()
         
-        for _ in range(n_samples):
+        for _ in range(10 * n_samples):
+            if len(combinations) >= n_samples:
+                break
+            
             param_dict = {}
+            key = []
             
             for param_name, param_info in self.parameters.items():
                 if param_info['type'] == 'range':
                     start, end, _ = param_info['values']
-                    value = np.random.uniform(start, end)
+                    value = float(rng.uniform(start, end))
+                    key.append(value)
                 elif param_info['type'] == 'choice':
-                    value = np.random.choice(param_info['values'])
+                    # Draw an index so choices of any type stay as given
+                    idx = int(rng.integers(len(param_info['values'])))
+                    value = param_info['values'][idx]
+                    key.append(idx)
                 elif param_info['type'] == 'integer':
                     start, end = param_info['values']
-                    value = np.random.randint(start, end + 1)
+                    value = int(rng.integers(start, end + 1))
+                    key.append(value)
                 elif param_info['type'] == 'real':
                     start, end = param_info['values']
-                    value = np.random.uniform(start, end)
+                    value = float(rng.uniform(start, end))
+                    key.append(value)
                 else:
                     value = param_info['values']
                 
                 param_dict[param_name] = value
             
-            combinations.append(param_dict)
+            key = tuple(key)
+            if key not in seen:
+                seen.add(key)
+                combinations.append(param_dict)
         
         return combinations
+    
+    def _sample_discrete(self, rng: np.random.Generator, n_samples: int) -> Optional[List[Dict[str, Any]]]:
+        """Distinct combinations drawn as flat grid indices, or None if any parameter is continuous"""
+        names = list(self.parameters)
+        choices = []
+        for param_info in self.parameters.values():
+            if param_info['type'] in ('range', 'real'):
+                return None
+            elif param_info['type'] == 'choice':
+                choices.append(param_info['values'])
+            elif param_info['type'] == 'integer':
+                start, end = param_info['values']
+                choices.append(range(int(start), int(end) + 1))
+            else:
+                choices.append([param_info['values']])
+        
+        sizes = [len(values) for values in choices]
+        n_total = int(np.prod(sizes, dtype=object)) if sizes else 1
+        if n_total == 0 or n_total > np.iinfo(np.int64).max:
+            return None
+        
+        flat = rng.choice(n_total, size=min(n_samples, n_total), replace=False)
+        rows = np.unravel_index(flat, sizes) if sizes else ()
+        columns = [[values[i] for i in row.tolist()] for values, row in zip(choices, rows)]
+        if not columns:
+            return [{} for _ in range(len(flat))]
+        return [dict(zip(names, combo)) for combo in zip(*columns)]
 
 class ParameterOptimizer:
     """Advanced parameter optimization for trading strategies"""
     
-    def __init__(self, backtesting_engine: BacktestEngine = None):
+    def __init__(self, backtesting_engine: BacktestEngine = None, cache_size: int = 1024):
         """
         Initialize parameter optimizer
         
         Args:
             backtesting_engine: BacktestEngine instance for running backtests
+            cache_size: Number of evaluations kept for identical strategy,
+                parameters, data, period and engine configuration (0 disables
+                caching)
         """
         self.engine = backtesting_engine or BacktestEngine()
         self.logger = logging.getLogger(__name__)
+        self.cache_size = cache_size
+        self._cache: OrderedDict = OrderedDict()
+        # Data hashed for cache keys in the current search and its content digest
+        self._hashed_data: Optional[pd.DataFrame] = None
+        self._data_digest: Optional[int] = None
+        # Last prepared search data, reused while the contents and period match
+        self._prepared: Optional[PreparedData] = None
+        self._prepared_key: Optional[Tuple] = None
+        # Worker pool kept between calls, with the setup it was started with
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._pool_setup: Optional[Tuple] = None
+    
+    def __getstate__(self):
+        # Worker processes get a copy of the optimizer; the cache and pool stay here
+        state = self.__dict__.copy()
+        state['_cache'] = OrderedDict()
+        state['_hashed_data'] = None
+        state['_data_digest'] = None
+        state['_prepared'] = None
+        state['_prepared_key'] = None
+        state['_pool'] = None
+        state['_pool_setup'] = None
+        return state
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def close(self):
+        """Shut down the worker pool, if one is running"""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+            self._pool_setup = None
+    
+    def _get_pool(
+        self,
+        n_jobs: int,
+        initializer: Callable,
+        initargs: Tuple,
+        settings: Optional[Tuple] = None
+    ) -> ProcessPoolExecutor:
+        """
+        Worker pool for ``n_jobs`` processes initialized with ``initargs``
+        
+        The running pool is reused when it was started with the same worker
+        count, initializer, engine settings and argument objects (compared by
+        identity), so repeated searches over the same data skip process
+        start-up; ``_prepare_data`` hands back the same prepared object for
+        unchanged data to keep that identity. Workers hold a pickled copy of
+        the engine, so any change to its config starts a fresh pool.
+        ``settings`` is a snapshot from ``_engine_key`` (taken now if omitted).
+        """
+        if settings is None:
+            settings = self._engine_key()
+        setup = (n_jobs, initializer, settings, initargs)
+        if self._pool is not None and (
+            self._pool_setup[:3] == setup[:3]
+            and len(self._pool_setup[3]) == len(initargs)
+            and all(a is b for a, b in zip(self._pool_setup[3], initargs))
+        ):
+            return self._pool
+        
+        self.close()
+        self._pool = ProcessPoolExecutor(
+            max_workers=n_jobs, initializer=initializer, initargs=initargs
+        )
+        self._pool_setup = setup
+        return self._pool
         
     def grid_search(
         self,
@@ -130,7 +333,8 @@ class ParameterOptimizer:
         optimization_metric: str = 'sharpe_ratio',
         n_jobs: int = 1,
         start_date: Optional[date] = None,
-        end_date: Optional[date] = None
+        end_date: Optional[date] = None,
+        early_stop_quantile: Optional[float] = None
     ) -> Dict[str, Any]:
         """
         Perform grid search optimization
@@ -143,6 +347,9 @@ class ParameterOptimizer:
             n_jobs: Number of parallel jobs
             start_date: Start date for backtesting
             end_date: End date for backtesting
+            early_stop_quantile: If set, abandon a backtest whose running metric
+                at 25/50/75% of the replay falls below this quantile of the
+                completed results (serial evaluation only)
             
         Returns:
             Dictionary with optimization results
@@ -152,14 +359,13 @@ class ParameterOptimizer:
         combinations = parameter_space.get_grid_combinations()
         self.logger.info(f"Testing {len(combinations)} parameter combinations")
         
+        data = self._prepare_data(data, start_date, end_date)
+        
         if n_jobs == 1:
-            results = []
-            for i, params in enumerate(combinations):
-                self.logger.info(f"Testing combination {i+1}/{len(combinations)}: {params}")
-                result = self._evaluate_parameters(
-                    strategy_class, params, data, optimization_metric, start_date, end_date
-                )
-                results.append(result)
+            results = self._serial_optimization(
+                strategy_class, combinations, data, optimization_metric,
+                start_date, end_date, early_stop_quantile
+            )
         else:
             results = self._parallel_optimization(
                 strategy_class, combinations, data, optimization_metric, 
@@ -177,7 +383,8 @@ class ParameterOptimizer:
         optimization_metric: str = 'sharpe_ratio',
         n_jobs: int = 1,
         start_date: Optional[date] = None,
-        end_date: Optional[date] = None
+        end_date: Optional[date] = None,
+        early_stop_quantile: Optional[float] = None
     ) -> Dict[str, Any]:
         """
         Perform random search optimization
@@ -191,6 +398,7 @@ class ParameterOptimizer:
             n_jobs: Number of parallel jobs
             start_date: Start date for backtesting
             end_date: End date for backtesting
+            early_stop_quantile: See ``grid_search``
             
         Returns:
             Dictionary with optimization results
@@ -199,14 +407,13 @@ class ParameterOptimizer:
         
         combinations = parameter_space.get_random_sample(n_iterations)
         
+        data = self._prepare_data(data, start_date, end_date)
+        
         if n_jobs == 1:
-            results = []
-            for i, params in enumerate(combinations):
-                self.logger.info(f"Testing combination {i+1}/{len(combinations)}: {params}")
-                result = self._evaluate_parameters(
-                    strategy_class, params, data, optimization_metric, start_date, end_date
-                )
-                results.append(result)
+            results = self._serial_optimization(
+                strategy_class, combinations, data, optimization_metric,
+                start_date, end_date, early_stop_quantile
+            )
         else:
             results = self._parallel_optimization(
                 strategy_class, combinations, data, optimization_metric,
@@ -223,7 +430,10 @@ class ParameterOptimizer:
         n_calls: int = 50,
         optimization_metric: str = 'sharpe_ratio',
         start_date: Optional[date] = None,
-        end_date: Optional[date] = None
+        end_date: Optional[date] = None,
+        convergence_tol: Optional[float] = 0.10,
+        checkpoint_path: Optional[str] = None,
+        resume: bool = False
     ) -> Dict[str, Any]:
         """
         Perform Bayesian optimization using Gaussian Process
@@ -232,13 +442,22 @@ class ParameterOptimizer:
             strategy_class: Strategy class to optimize
             parameter_space: ParameterSpace defining optimization space
             data: Historical data for backtesting
-            n_calls: Number of optimization iterations
+            n_calls: Maximum number of optimization iterations
             optimization_metric: Metric to optimize
             start_date: Start date for backtesting
             end_date: End date for backtesting
+            convergence_tol: Stop once the best few objective values agree
+                within this relative tolerance (after a burn-in of
+                max(10, 5 * number of parameters) calls); None runs all calls
+            checkpoint_path: File the evaluated points are saved to after
+                every call
+            resume: Start from the points saved in ``checkpoint_path``, if it
+                exists; ``n_calls`` then counts the new calls only
             
         Returns:
-            Dictionary with optimization results
+            Dictionary with optimization results; ``n_iterations`` counts every
+            evaluated point including resumed ones, ``n_iterations_actual``
+            only the calls made in this run
         """
         if not SKOPT_AVAILABLE:
             raise ImportError("scikit-optimize not available. Install with: pip install scikit-optimize")
@@ -264,6 +483,8 @@ class ParameterOptimizer:
             elif param_info['type'] == 'choice':
                 dimensions.append(Categorical(param_info['values'], name=param_name))
         
+        data = self._prepare_data(data, start_date, end_date)
+        
         def objective(params):
             """Objective function for Bayesian optimization"""
             param_dict = dict(zip(param_names, params))
@@ -273,8 +494,41 @@ class ParameterOptimizer:
             # Return negative value for minimization (we want to maximize our metric)
             return -result['metric_value'] if result['metric_value'] is not None else 1e6
         
-        # Run optimization
-        result = gp_minimize(objective, dimensions, n_calls=n_calls, random_state=42)
+        # Ask/tell loop so the search can stop once it has plateaued
+        optimizer = Optimizer(
+            dimensions, base_estimator='GP', acq_func='gp_hedge',
+            n_initial_points=min(10, n_calls), random_state=42
+        )
+        burn_in = max(10, 5 * len(dimensions))
+        
+        if resume:
+            if checkpoint_path is None:
+                raise ValueError("resume requires a checkpoint_path")
+            if os.path.exists(checkpoint_path):
+                previous = skopt_load(checkpoint_path)
+                optimizer.tell(list(previous.x_iters), list(previous.func_vals))
+                self.logger.info(f"Resuming Bayesian optimization after {len(previous.x_iters)} saved calls")
+        
+        # skopt warns each time it re-proposes an evaluated point
+        with warnings.catch_warnings():
+            warnings.filterwarnings(
+                'ignore', message='The objective has been evaluated at',
+                category=UserWarning
+            )
+            n_evaluated = 0
+            for _ in range(n_calls):
+                x = optimizer.ask()
+                optimizer.tell(x, objective(x))
+                n_evaluated += 1
+                if checkpoint_path is not None:
+                    _save_checkpoint(optimizer, checkpoint_path)
+                
+                if (convergence_tol is not None and len(optimizer.yi) >= burn_in
+                        and _has_converged(optimizer.yi, convergence_tol)):
+                    self.logger.info(f"Bayesian optimization converged after {len(optimizer.yi)} calls")
+                    break
+        
+        result = optimizer.get_result()
         
         # Process results
         best_params = dict(zip(param_names, result.x))
@@ -291,6 +545,7 @@ class ParameterOptimizer:
                 for x, y in zip(result.x_iters, result.func_vals)
             ],
             'n_iterations': len(result.x_iters),
+            'n_iterations_actual': n_evaluated,
             'optimization_metric': optimization_metric
         }
     
@@ -321,8 +576,20 @@ class ParameterOptimizer:
         """
         self.logger.info("Starting walk-forward analysis")
         
-        # Get unique dates
-        dates = sorted(data['timestamp'].dt.date.unique())
+        # Sort once so that every window is a contiguous block of rows
+        if not data['timestamp'].is_monotonic_increasing:
+            data = data.sort_values('timestamp', kind='stable')
+        # Categorical symbols up front, so the engine can use each window
+        # slice as is instead of copying it to convert them
+        if not isinstance(data['symbol'].dtype, pd.CategoricalDtype):
+            data = data.assign(symbol=data['symbol'].astype('category'))
+        
+        # Get unique dates and the first row of each, so a window of dates
+        # [a, b) maps to rows [day_starts[a], day_starts[b])
+        days64 = _trading_days(data['timestamp'])
+        dates64 = np.unique(days64)
+        dates = dates64.tolist()
+        day_starts = np.append(np.searchsorted(days64, dates64, side='left'), len(days64))
         
         if len(dates) < optimization_window + test_window:
             raise ValueError("Insufficient data for walk-forward analysis")
@@ -344,15 +611,9 @@ class ParameterOptimizer:
             self.logger.info(f"Optimization: {opt_start_date} to {opt_end_date}")
             self.logger.info(f"Testing: {test_start_date} to {test_end_date}")
             
-            # Get data for periods
-            opt_data = data[
-                (data['timestamp'].dt.date >= opt_start_date) &
-                (data['timestamp'].dt.date <= opt_end_date)
-            ]
-            test_data = data[
-                (data['timestamp'].dt.date >= test_start_date) &
-                (data['timestamp'].dt.date <= test_end_date)
-            ]
+            # Test window as a row slice of the sorted data; the optimization
+            # window is not needed while the given parameters are reused
+            test_data = data.iloc[day_starts[test_start_idx]:day_starts[test_end_idx]]
             
             # Use provided parameters for testing (in real implementation, you might re-optimize)
             test_result = self._evaluate_parameters(
@@ -367,16 +628,27 @@ class ParameterOptimizer:
                 'test_result': test_result
             })
         
-        # Analyze walk-forward results
-        metric_values = [r['test_result']['metric_value'] for r in results if r['test_result']['metric_value'] is not None]
+        # Analyze walk-forward results; failed windows are NaN
+        metric_array = np.fromiter(
+            (np.nan if r['test_result']['metric_value'] is None else r['test_result']['metric_value']
+             for r in results),
+            dtype=np.float64, count=len(results)
+        )
+        n_valid = int(np.count_nonzero(~np.isnan(metric_array)))
+        
+        if n_valid:
+            best_period = results[int(np.nanargmax(metric_array))]
+            worst_period = results[int(np.nanargmin(metric_array))]
+        else:
+            best_period = worst_period = results[0]
         
         return {
             'walk_forward_results': results,
-            'average_metric': np.mean(metric_values) if metric_values else 0,
-            'std_metric': np.std(metric_values) if metric_values else 0,
-            'best_period': max(results, key=lambda x: x['test_result']['metric_value'] or -np.inf),
-            'worst_period': min(results, key=lambda x: x['test_result']['metric_value'] or np.inf),
-            'consistency_ratio': len([v for v in metric_values if v > 0]) / len(metric_values) if metric_values else 0
+            'average_metric': np.nanmean(metric_array) if n_valid else 0,
+            'std_metric': np.nanstd(metric_array) if n_valid else 0,
+            'best_period': best_period,
+            'worst_period': worst_period,
+            'consistency_ratio': np.count_nonzero(metric_array > 0) / n_valid if n_valid else 0
         }
     
     def monte_carlo_analysis(
@@ -387,7 +659,9 @@ class ParameterOptimizer:
         n_simulations: int = 1000,
         noise_level: float = 0.001,
         start_date: Optional[date] = None,
-        end_date: Optional[date] = None
+        end_date: Optional[date] = None,
+        seed: Optional[int] = None,
+        n_jobs: int = 1
     ) -> Dict[str, Any]:
         """
         Perform Monte Carlo analysis by adding noise to price data
@@ -400,34 +674,39 @@ class ParameterOptimizer:
             noise_level: Level of noise to add to prices
             start_date: Start date for backtesting
             end_date: End date for backtesting
+            seed: Seed for the noise generator, for reproducible simulations
+            n_jobs: Number of worker processes running simulations
             
         Returns:
             Monte Carlo analysis results
         """
         self.logger.info(f"Starting Monte Carlo analysis with {n_simulations} simulations")
         
-        results = []
+        # Independent noise stream per simulation, so results do not depend
+        # on how simulations are spread over processes
+        seeds = np.random.SeedSequence(seed).spawn(n_simulations)
+        simulation_args = (self, strategy_class, parameters, data, noise_level, start_date, end_date)
         
-        for i in range(n_simulations):
-            if i % 100 == 0:
-                self.logger.info(f"Simulation {i}/{n_simulations}")
-            
-            # Add noise to price data
-            noisy_data = data.copy()
-            price_columns = ['open_price', 'high_price', 'low_price', 'close_price']
-            
-            for col in price_columns:
-                if col in noisy_data.columns:
-                    noise = np.random.normal(0, noise_level, len(noisy_data))
-                    noisy_data[col] = noisy_data[col] * (1 + noise)
-            
-            # Run backtest with noisy data
-            result = self._evaluate_parameters(
-                strategy_class, parameters, noisy_data, 'total_return', start_date, end_date
-            )
-            
-            if result['backtest_result']:
-                results.append(result['backtest_result'])
+        if n_jobs == 1:
+            simulator = _MonteCarloSimulator(*simulation_args)
+            results = []
+            for i, simulation_seed in enumerate(seeds):
+                if i % 100 == 0:
+                    self.logger.info(f"Simulation {i}/{n_simulations}")
+                results.append(simulator.run(simulation_seed))
+        else:
+            results = [None] * n_simulations
+            executor = self._get_pool(n_jobs, _init_monte_carlo_worker, simulation_args)
+            future_to_idx = {
+                executor.submit(_simulate_in_worker, simulation_seed): idx
+                for idx, simulation_seed in enumerate(seeds)
+            }
+            for i, future in enumerate(as_completed(future_to_idx)):
+                results[future_to_idx[future]] = future.result()
+                if i % 100 == 0:
+                    self.logger.info(f"Simulation {i}/{n_simulations}")
+        
+        results = [r for r in results if r]
         
         if not results:
             return {'error': 'No successful simulations'}
@@ -462,24 +741,91 @@ class ParameterOptimizer:
             'probability_sharpe_gt_1': len([s for s in sharpe_ratios if s > 1]) / len(sharpe_ratios) if sharpe_ratios else 0
         }
     
+    def _prepare_data(
+        self,
+        data: pd.DataFrame,
+        start_date: Optional[date],
+        end_date: Optional[date]
+    ) -> Union[pd.DataFrame, PreparedData]:
+        """
+        Filter and index the data once for a whole search, if the engine supports it
+        
+        The contents are hashed at the start of every search, so in-place
+        edits between searches are seen; unchanged data over the same period
+        reuses the previous prepared object (and with it the worker pool).
+        """
+        digest = hash(pd.util.hash_pandas_object(data, index=True).values.tobytes())
+        prepared = data
+        
+        prepare = getattr(self.engine, 'prepare', None)
+        if prepare is not None:
+            prepared_key = (digest, start_date, end_date, id(self.engine))
+            if self._prepared is not None and self._prepared_key == prepared_key:
+                prepared = self._prepared
+            else:
+                try:
+                    prepared = prepare(data, start_date, end_date)
+                    self._prepared = prepared
+                    self._prepared_key = prepared_key
+                except ValueError:
+                    # Leave it to each evaluation to report the problem as before
+                    pass
+        
+        # The raw digest plus the period (both in the cache key) identify the prepared data
+        self._hashed_data = prepared
+        self._data_digest = digest
+        return prepared
+    
     def _evaluate_parameters(
         self,
         strategy_class,
         parameters: Dict[str, Any],
-        data: pd.DataFrame,
+        data: Union[pd.DataFrame, PreparedData],
         optimization_metric: str,
         start_date: Optional[date] = None,
-        end_date: Optional[date] = None
+        end_date: Optional[date] = None,
+        progress_callback: Optional[Callable[[float, np.ndarray], None]] = None,
+        use_cache: bool = True
+    ) -> Dict[str, Any]:
+        """Evaluate a single parameter combination, reusing a cached evaluation if any"""
+        key = None
+        if use_cache:
+            key = self._cache_key(
+                strategy_class, parameters, data, optimization_metric, start_date, end_date
+            )
+            cached = self._cache_lookup(key)
+            if cached is not None:
+                return cached
+        
+        result = self._run_evaluation(
+            strategy_class, parameters, data, optimization_metric,
+            start_date, end_date, progress_callback
+        )
+        self._cache_store(key, result)
+        return result
+    
+    def _run_evaluation(
+        self,
+        strategy_class,
+        parameters: Dict[str, Any],
+        data: Union[pd.DataFrame, PreparedData],
+        optimization_metric: str,
+        start_date: Optional[date],
+        end_date: Optional[date],
+        progress_callback: Optional[Callable[[float, np.ndarray], None]]
     ) -> Dict[str, Any]:
-        """Evaluate a single parameter combination"""
+        """Run the backtest for one parameter combination"""
         try:
             # Create strategy instance with parameters
             strategy = strategy_class(**parameters)
             
-            # Run backtest
-            result = self.engine.run_backtest(
-                strategy, data, start_date, end_date
-            )
+            # Run backtest, reusing the search's prepared data when available
+            if isinstance(data, PreparedData):
+                result = self.engine.run_backtest_prepared(strategy, data, progress_callback)
+            else:
+                result = self.engine.run_backtest(
+                    strategy, data, start_date, end_date, progress_callback=progress_callback
+                )
             
             # Extract optimization metric
             metric_value = getattr(result, optimization_metric, None)
@@ -490,6 +836,15 @@ class ParameterOptimizer:
                 'backtest_result': result
             }
             
+        except EarlyStopped as e:
+            self.logger.debug(f"Pruned parameters {parameters}: {e}")
+            return {
+                'parameters': parameters,
+                'metric_value': None,
+                'backtest_result': None,
+                'pruned': True
+            }
+            
         except Exception as e:
             self.logger.warning(f"Error evaluating parameters {parameters}: {e}")
             return {
@@ -499,36 +854,195 @@ class ParameterOptimizer:
                 'error': str(e)
             }
     
+    def _cache_key(
+        self,
+        strategy_class,
+        parameters: Dict[str, Any],
+        data: Union[pd.DataFrame, PreparedData],
+        optimization_metric: str,
+        start_date: Optional[date],
+        end_date: Optional[date],
+        settings: Optional[Tuple] = None
+    ) -> Optional[Tuple]:
+        """
+        Cache key for an evaluation, or None when caching is off or impossible
+        
+        The data contents are hashed once per object within a search, so a
+        frame edited in place during a search is not detected; call
+        ``clear_cache()`` after such edits. ``settings`` is the engine
+        snapshot the evaluation runs with (the current one if omitted).
+        """
+        if self.cache_size <= 0:
+            return None
+        
+        if self._hashed_data is not data:
+            frame = data.data if isinstance(data, PreparedData) else data
+            self._data_digest = hash(pd.util.hash_pandas_object(frame, index=True).values.tobytes())
+            self._hashed_data = data
+        
+        if settings is None:
+            settings = self._engine_key()
+        key = (strategy_class, tuple(sorted(parameters.items())), self._data_digest,
+               start_date, end_date, optimization_metric, settings)
+        try:
+            hash(key)
+        except TypeError:
+            # Unhashable parameter values
+            return None
+        return key
+    
+    def _cache_lookup(self, key: Optional[Tuple]) -> Optional[Dict[str, Any]]:
+        """Cached evaluation for ``key``, if present"""
+        if key is None or key not in self._cache:
+            return None
+        self._cache.move_to_end(key)
+        return dict(self._cache[key])
+    
+    def _cache_store(self, key: Optional[Tuple], result: Dict[str, Any]):
+        """Remember an evaluation; pruned runs depend on the search state and are skipped"""
+        if key is None or result.get('pruned'):
+            return
+        self._cache[key] = dict(result)
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+    
+    def _engine_key(self) -> Tuple:
+        """Engine identity and current config, as used in pool and cache keys"""
+        return (id(self.engine), _engine_settings(self.engine))
+    
+    def clear_cache(self):
+        """Drop all cached evaluations"""
+        self._cache.clear()
+        self._hashed_data = None
+        self._data_digest = None
+        self._prepared = None
+        self._prepared_key = None
+    
+    def _serial_optimization(
+        self,
+        strategy_class,
+        combinations: Sequence[Dict[str, Any]],
+        data: Union[pd.DataFrame, PreparedData],
+        optimization_metric: str,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        early_stop_quantile: Optional[float] = None
+    ) -> List[Dict[str, Any]]:
+        """Run optimization in this process, optionally pruning weak combinations"""
+        results = []
+        completed = []  # Sorted metric values of finished combinations
+        
+        # Per-combination detail only at DEBUG; otherwise about 100 progress lines
+        log_each = self.logger.isEnabledFor(logging.DEBUG)
+        log_every = max(1, len(combinations) // 100)
+        
+        for i, params in enumerate(combinations):
+            if log_each:
+                self.logger.debug(f"Testing combination {i+1}/{len(combinations)}: {params}")
+            elif i % log_every == 0:
+                self.logger.info(f"Testing combination {i+1}/{len(combinations)}")
+            
+            callback = None
+            if early_stop_quantile is not None:
+                callback = self._early_stop_callback(completed, early_stop_quantile, optimization_metric)
+            
+            result = self._evaluate_parameters(
+                strategy_class, params, data, optimization_metric, start_date, end_date, callback
+            )
+            results.append(result)
+            
+            if result['metric_value'] is not None:
+                bisect.insort(completed, result['metric_value'])
+        
+        return results
+    
+    def _early_stop_callback(
+        self,
+        completed: List[float],
+        quantile: float,
+        optimization_metric: str
+    ) -> Optional[Callable[[float, np.ndarray], None]]:
+        """Progress callback that stops a backtest trailing the completed results"""
+        if len(completed) < EARLY_STOP_MIN_COMPLETED or optimization_metric not in RUNNING_METRICS:
+            return None
+        
+        threshold = completed[min(int(quantile * len(completed)), len(completed) - 1)]
+        initial_capital = self.engine.config.initial_capital
+        risk_free_rate = self.engine.config.risk_free_rate
+        
+        def callback(fraction: float, portfolio_values: np.ndarray):
+            running = _running_metric(
+                portfolio_values, optimization_metric, initial_capital, risk_free_rate
+            )
+            if running < threshold:
+                raise EarlyStopped(
+                    f"{optimization_metric} {running:.4f} below {threshold:.4f} at {fraction:.0%}"
+                )
+        
+        return callback
+    
     def _parallel_optimization(
         self,
         strategy_class,
-        combinations: List[Dict[str, Any]],
-        data: pd.DataFrame,
+        combinations: Sequence[Dict[str, Any]],
+        data: Union[pd.DataFrame, PreparedData],
         optimization_metric: str,
         n_jobs: int,
         start_date: Optional[date] = None,
         end_date: Optional[date] = None
     ) -> List[Dict[str, Any]]:
-        """Run optimization in parallel"""
-        results = []
+        """
+        Run optimization in parallel worker processes
         
-        with ThreadPoolExecutor(max_workers=n_jobs) as executor:
-            # Submit all jobs
-            future_to_params = {
-                executor.submit(
-                    self._evaluate_parameters,
-                    strategy_class, params, data, optimization_metric, start_date, end_date
-                ): params
-                for params in combinations
-            }
+        Backtests are CPU-bound Python code, so each combination runs in its
+        own interpreter; the strategy class must be importable at module level.
+        The data and fixed arguments are handed to each worker once through
+        the pool initializer, so only the parameters cross the queue per job.
+        """
+        # One slot per combination, filled in submission order
+        results: List[Optional[Dict[str, Any]]] = [None] * len(combinations)
+        
+        # One engine snapshot for the pool and every cache key, so results are
+        # stored under the settings the workers actually ran with
+        settings = self._engine_key()
+        
+        # Only combinations without a cached evaluation go to the workers
+        pending = []
+        for idx, params in enumerate(combinations):
+            key = self._cache_key(
+                strategy_class, params, data, optimization_metric, start_date, end_date, settings
+            )
+            cached = self._cache_lookup(key)
+            if cached is not None:
+                results[idx] = cached
+            else:
+                pending.append((idx, params, key))
+        
+        if not pending:
+            return results
+        
+        executor = self._get_pool(
+            n_jobs, _init_worker,
+            (self, strategy_class, data, optimization_metric, start_date, end_date),
+            settings
+        )
+        
+        # Submit all jobs
+        future_to_slot = {
+            executor.submit(_evaluate_in_worker, params): (idx, key)
+            for idx, params, key in pending
+        }
+        
+        # Collect results, reporting progress about 50 times
+        log_every = max(1, len(future_to_slot) // 50)
+        for i, future in enumerate(as_completed(future_to_slot)):
+            idx, key = future_to_slot[future]
+            result = future.result()
+            self._cache_store(key, result)
+            results[idx] = result
             
-            # Collect results
-            for i, future in enumerate(as_completed(future_to_params)):
-                result = future.result()
-                results.append(result)
-                
-                if i % 10 == 0:
-                    self.logger.info(f"Completed {i+1}/{len(combinations)} combinations")
+            if i % log_every == 0:
+                self.logger.info(f"Completed {i+1}/{len(combinations)} combinations")
         
         return results
     
@@ -544,11 +1058,17 @@ class ParameterOptimizer:
         if not successful_results:
             return {'error': 'No successful optimizations'}
         
-        # Find best result
-        best_result = max(successful_results, key=lambda x: x['metric_value'])
-        
-        # Calculate statistics
-        metric_values = [r['metric_value'] for r in successful_results]
+        # Find best result; failed evaluations are NaN and never win
+        metric_array = np.fromiter(
+            (np.nan if r['metric_value'] is None else r['metric_value'] for r in results),
+            dtype=np.float64, count=len(results)
+        )
+        valid_values = metric_array[~np.isnan(metric_array)]
+        if valid_values.size == 0:
+            best_result = successful_results[0]
+            valid_values = np.array([np.nan])
+        else:
+            best_result = results[int(np.nanargmax(metric_array))]
         
         return {
             'best_parameters': best_result['parameters'],
@@ -558,11 +1078,166 @@ class ParameterOptimizer:
                 'total_combinations': len(results),
                 'successful_combinations': len(successful_results),
                 'success_rate': len(successful_results) / len(results),
-                'metric_mean': np.mean(metric_values),
-                'metric_std': np.std(metric_values),
-                'metric_min': np.min(metric_values),
-                'metric_max': np.max(metric_values)
+                'pruned_combinations': sum(1 for r in results if r.get('pruned')),
+                'metric_mean': valid_values.mean(),
+                'metric_std': valid_values.std(),
+                'metric_min': valid_values.min(),
+                'metric_max': valid_values.max()
             },
             'all_results': successful_results,
             'optimization_metric': optimization_metric
         }
+
+def _engine_settings(engine) -> Any:
+    """Current engine configuration as a hashable value for cache keys"""
+    config = getattr(engine, 'config', None)
+    if dataclasses.is_dataclass(config) and not isinstance(config, type):
+        return dataclasses.astuple(config)
+    return config
+
+def _running_metric(
+    portfolio_values: np.ndarray,
+    metric: str,
+    initial_capital: float,
+    risk_free_rate: float
+) -> float:
+    """Value of ``metric`` over a partial replay, computed as BacktestResult does"""
+    if metric == 'total_return':
+        return (portfolio_values[-1] - initial_capital) / initial_capital * 100
+    
+    mean_return, std_return, max_dd, _, _ = _daily_return_stats(portfolio_values)
+    if metric == 'max_drawdown':
+        return max_dd * 100
+    
+    excess_mean = mean_return - risk_free_rate / 252
+    return excess_mean / std_return * np.sqrt(252) if std_return > 0 else 0
+
+def _noise_kernel(prices: np.ndarray, noise_level: float, out: np.ndarray):
+    """Turn standard normal draws held in ``out`` into ``prices * (1 + noise_level * z)``"""
+    for i in range(prices.shape[0]):
+        for j in range(prices.shape[1]):
+            out[i, j] = prices[i, j] * (1.0 + noise_level * out[i, j])
+
+if NUMBA_AVAILABLE:
+    # Serial on purpose: simulations run in parallel across processes, and a
+    # numba thread pool started before forking hangs the interpreter at exit
+    _noise_kernel = njit(cache=True)(_noise_kernel)
+
+def _apply_noise(
+    prices: np.ndarray,
+    noise_level: float,
+    rng: np.random.Generator,
+    out: np.ndarray
+):
+    """Multiplicative Gaussian price noise, applied with numba when it is available"""
+    # Draws always come from ``rng`` so a seed gives the same prices with or without numba
+    rng.standard_normal(out=out)
+    if NUMBA_AVAILABLE:
+        _noise_kernel(prices, noise_level, out)
+        return
+    
+    out *= noise_level
+    out += 1.0
+    out *= prices
+
+class _MonteCarloSimulator:
+    """Runs noisy-price backtests reusing one scratch frame and price buffer"""
+    
+    def __init__(
+        self,
+        optimizer: 'ParameterOptimizer',
+        strategy_class,
+        parameters: Dict[str, Any],
+        data: pd.DataFrame,
+        noise_level: float,
+        start_date: Optional[date],
+        end_date: Optional[date]
+    ):
+        self.optimizer = optimizer
+        self.strategy_class = strategy_class
+        self.parameters = parameters
+        self.noise_level = noise_level
+        self.start_date = start_date
+        self.end_date = end_date
+        
+        # Price block extracted once; each simulation scales it into one buffer
+        self.price_columns = [
+            col for col in ['open_price', 'high_price', 'low_price', 'close_price']
+            if col in data.columns
+        ]
+        self.prices = np.ascontiguousarray(data[self.price_columns].to_numpy(dtype=np.float64))
+        self.noisy_prices = np.empty_like(self.prices)
+        # One scratch frame whose price columns are replaced per simulation;
+        # replacing (not writing into) them keeps ``data`` untouched, so the
+        # other columns need no copy
+        self.noisy_data = data.copy(deep=False)
+    
+    def run(self, seed: np.random.SeedSequence) -> Optional[BacktestResult]:
+        """Backtest on prices perturbed with noise drawn from ``seed``"""
+        _apply_noise(self.prices, self.noise_level, np.random.default_rng(seed), self.noisy_prices)
+        # Whole price block in one assignment rather than column by column
+        self.noisy_data[self.price_columns] = self.noisy_prices
+        
+        # Every simulation is unique, so skip the evaluation cache
+        result = self.optimizer._evaluate_parameters(
+            self.strategy_class, self.parameters, self.noisy_data, 'total_return',
+            self.start_date, self.end_date, use_cache=False
+        )
+        return result['backtest_result']
+
+def _save_checkpoint(optimizer: 'Optimizer', path: str):
+    """Save the points evaluated so far by a Bayesian search"""
+    result = optimizer.get_result()
+    # The fitted models are rebuilt on resume and would grow the file every call
+    result.models = []
+    skopt_dump(result, path, compress=9, store_objective=False)
+
+def _has_converged(values: List[float], tolerance: float, top_k: int = 5) -> bool:
+    """Whether the best ``top_k`` (lowest) objective values agree within ``tolerance``"""
+    if len(values) < top_k:
+        return False
+    
+    best = np.sort(values)[:top_k]
+    spread = best[-1] - best[0]
+    scale = abs(np.median(best))
+    return spread < tolerance * scale if scale > 0 else spread == 0
+
+# Per-process state installed by the parallel optimization pool initializer
+_worker_state: Optional[Dict[str, Any]] = None
+
+def _init_worker(
+    optimizer: ParameterOptimizer,
+    strategy_class,
+    data: Union[pd.DataFrame, PreparedData],
+    optimization_metric: str,
+    start_date: Optional[date],
+    end_date: Optional[date]
+):
+    """Keep the arguments shared by every job in this worker process"""
+    global _worker_state
+    _worker_state = {
+        'optimizer': optimizer,
+        'strategy_class': strategy_class,
+        'data': data,
+        'optimization_metric': optimization_metric,
+        'start_date': start_date,
+        'end_date': end_date
+    }
+
+def _init_monte_carlo_worker(*simulation_args):
+    """Build this worker's Monte Carlo simulator once"""
+    global _worker_state
+    _worker_state = {'simulator': _MonteCarloSimulator(*simulation_args)}
+
+def _simulate_in_worker(seed: np.random.SeedSequence) -> Optional[BacktestResult]:
+    """Run one Monte Carlo simulation with the worker's simulator"""
+    return _worker_state['simulator'].run(seed)
+
+def _evaluate_in_worker(parameters: Dict[str, Any]) -> Dict[str, Any]:
+    """Evaluate one parameter combination against the worker's shared state"""
+    state = _worker_state
+    return state['optimizer']._evaluate_parameters(
+        state['strategy_class'], parameters, state['data'],
+        state['optimization_metric'], state['start_date'], state['end_date'],
+        use_cache=False
+    )
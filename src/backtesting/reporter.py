@@ -15,18 +15,49 @@ from datetime import date, datetime
 import logging
 import json
 import os
+import html
+import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+# matplotlib and seaborn are imported by _ensure_plotting on first use;
+# None until then, so that CSV/JSON-only callers never load them
+PLOTTING_AVAILABLE = None
 
 try:
-    import matplotlib.pyplot as plt
-    import matplotlib.dates as mdates
-    from matplotlib.figure import Figure
-    import seaborn as sns
-    PLOTTING_AVAILABLE = True
+    import orjson
+    ORJSON_AVAILABLE = True
 except ImportError:
-    PLOTTING_AVAILABLE = False
+    ORJSON_AVAILABLE = False
 
 from .metrics import PerformanceMetrics
 
+# Resolution of saved chart images
+PLOT_DPI = 150
+# seaborn reads and sets global rc state while drawing
+_SEABORN_LOCK = threading.Lock()
+
+# Value formatters, with the format spec parsed once
+_format_pct = '{:.2%}'.format
+_format_ratio = '{:.2f}'.format
+_format_money = '${:,.2f}'.format
+
+# Comparison report columns: (column, BacktestResult attribute, display formatter)
+COMPARISON_COLUMNS = [
+    ('Total Return', 'total_return', _format_pct),
+    ('Annual Return', 'annual_return', _format_pct),
+    ('Volatility', 'volatility', _format_pct),
+    ('Sharpe Ratio', 'sharpe_ratio', _format_ratio),
+    ('Max Drawdown', 'max_drawdown', _format_pct),
+    ('Calmar Ratio', 'calmar_ratio', _format_ratio),
+    ('Win Rate', 'win_rate', _format_pct),
+    ('Total Trades', 'total_trades', None),
+    ('Final Value', 'final_value', _format_money),
+]
+
+# Rows formatted per batch when exporting CSV files
+CSV_CHUNK_ROWS = 50_000
+
 class BacktestReporter:
     """Generate comprehensive backtesting reports"""
     
@@ -39,6 +70,8 @@ class BacktestReporter:
         """
         self.output_dir = output_dir
         self.logger = logging.getLogger(__name__)
+        # One reusable figure per plot, created on first use
+        self._figures: Dict[str, 'Figure'] = {}
         
         # Create output directory if it doesn't exist
         os.makedirs(output_dir, exist_ok=True)
@@ -48,7 +81,8 @@ class BacktestReporter:
         backtest_result,
         strategy_name: str,
         include_plots: bool = True,
-        include_trades: bool = True
+        include_trades: bool = True,
+        reuse_existing: bool = False
     ) -> Dict[str, str]:
         """
         Generate a comprehensive backtest report
@@ -58,45 +92,75 @@ class BacktestReporter:
             strategy_name: Name of the strategy
             include_plots: Whether to include plots
             include_trades: Whether to include trade details
+            reuse_existing: Return the files of an earlier reusable report in
+                this directory built from identical inputs instead of
+                regenerating; the new report is indexed for later reuse
             
         Returns:
             Dictionary with file paths of generated reports
         """
+        include_plots = include_plots and _ensure_plotting()
+        
+        # Reports are keyed by a digest of everything that goes into them; it is
+        # also part of every file name, so reports started within the same
+        # second from different inputs never overwrite each other's files
+        digest = _report_digest(backtest_result, strategy_name, include_plots, include_trades)
+        index_file = os.path.join(self.output_dir, f".report_{digest}.json")
+        if reuse_existing and os.path.exists(index_file):
+            with open(index_file) as f:
+                report_files = json.load(f)
+            if all(os.path.exists(path) for path in report_files.values()):
+                self.logger.info(f"Reusing unchanged report for {strategy_name}")
+                return report_files
+        
         self.logger.info(f"Generating full report for {strategy_name}")
         
         report_files = {}
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        base_filename = f"{strategy_name}_{timestamp}"
+        # One clock reading names every file and stamps the HTML
+        generated_at = datetime.now()
+        timestamp = generated_at.strftime("%Y%m%d_%H%M%S")
+        base_filename = f"{strategy_name}_{timestamp}_{digest}"
         
         # Generate HTML report
         html_file = os.path.join(self.output_dir, f"{base_filename}_report.html")
-        self._generate_html_report(backtest_result, html_file, include_plots)
+        self._generate_html_report(backtest_result, html_file, include_plots, generated_at)
         report_files['html'] = html_file
         
-        # Generate CSV exports
-        if include_trades and not backtest_result.trade_history.empty:
-            trades_file = os.path.join(self.output_dir, f"{base_filename}_trades.csv")
-            backtest_result.trade_history.to_csv(trades_file, index=False)
-            report_files['trades_csv'] = trades_file
-        
-        # Portfolio history CSV
-        if not backtest_result.portfolio_history.empty:
-            portfolio_file = os.path.join(self.output_dir, f"{base_filename}_portfolio.csv")
-            backtest_result.portfolio_history.to_csv(portfolio_file, index=False)
-            report_files['portfolio_csv'] = portfolio_file
-        
-        # Metrics JSON
-        metrics_file = os.path.join(self.output_dir, f"{base_filename}_metrics.json")
-        with open(metrics_file, 'w') as f:
-            json.dump(backtest_result.metrics, f, indent=2, default=str)
-        report_files['metrics_json'] = metrics_file
-        
-        # Generate plots if requested
-        if include_plots and PLOTTING_AVAILABLE:
-            plots_dir = os.path.join(self.output_dir, f"{base_filename}_plots")
-            os.makedirs(plots_dir, exist_ok=True)
-            plot_files = self._generate_plots(backtest_result, plots_dir)
-            report_files.update(plot_files)
+        # File exports are written in background threads while the plots render
+        exports = []
+        with ThreadPoolExecutor(max_workers=3) as writers:
+            # Generate CSV exports
+            if include_trades and not backtest_result.trade_history.empty:
+                trades_file = os.path.join(self.output_dir, f"{base_filename}_trades.csv")
+                exports.append(writers.submit(_write_csv, backtest_result.trade_history, trades_file))
+                report_files['trades_csv'] = trades_file
+            
+            # Portfolio history CSV
+            if not backtest_result.portfolio_history.empty:
+                portfolio_file = os.path.join(self.output_dir, f"{base_filename}_portfolio.csv")
+                exports.append(writers.submit(_write_csv, backtest_result.portfolio_history, portfolio_file))
+                report_files['portfolio_csv'] = portfolio_file
+            
+            # Metrics JSON
+            metrics_file = os.path.join(self.output_dir, f"{base_filename}_metrics.json")
+            exports.append(writers.submit(_write_json, backtest_result.metrics, metrics_file))
+            report_files['metrics_json'] = metrics_file
+            
+            # Generate plots if requested
+            if include_plots:
+                plots_dir = os.path.join(self.output_dir, f"{base_filename}_plots")
+                os.makedirs(plots_dir, exist_ok=True)
+                plot_files = self._generate_plots(backtest_result, plots_dir)
+                report_files.update(plot_files)
+        
+        # Surface any export error
+        for future in exports:
+            future.result()
+        
+        # Only callers opting into reuse leave an index behind
+        if reuse_existing:
+            with open(index_file, 'w') as f:
+                json.dump(report_files, f)
         
         self.logger.info(f"Report generated: {report_files}")
         return report_files
@@ -116,33 +180,31 @@ class BacktestReporter:
         Returns:
             Path to generated comparison report
         """
+        generated_at = datetime.now()
         if not output_filename:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            timestamp = generated_at.strftime("%Y%m%d_%H%M%S")
             output_filename = f"strategy_comparison_{timestamp}.html"
         
         output_path = os.path.join(self.output_dir, output_filename)
         
-        # Create comparison DataFrame
-        comparison_data = []
-        for strategy_name, result in backtest_results:
-            row = {
-                'Strategy': strategy_name,
-                'Total Return': f"{result.total_return:.2%}",
-                'Annual Return': f"{result.annual_return:.2%}",
-                'Volatility': f"{result.volatility:.2%}",
-                'Sharpe Ratio': f"{result.sharpe_ratio:.2f}",
-                'Max Drawdown': f"{result.max_drawdown:.2%}",
-                'Calmar Ratio': f"{result.calmar_ratio:.2f}",
-                'Win Rate': f"{result.win_rate:.2%}",
-                'Total Trades': result.total_trades,
-                'Final Value': f"${result.final_value:,.2f}"
+        # Numeric comparison table, formatted column by column for display
+        results = [result for _, result in backtest_results]
+        numeric_df = pd.DataFrame({
+            'Strategy': [strategy_name for strategy_name, _ in backtest_results],
+            **{
+                column: [getattr(result, attribute) for result in results]
+                for column, attribute, _ in COMPARISON_COLUMNS
             }
-            comparison_data.append(row)
-        
-        comparison_df = pd.DataFrame(comparison_data)
+        })
+        comparison_df = numeric_df.copy()
+        # The table is rendered with escape=False, so escape the names here
+        comparison_df['Strategy'] = [html.escape(str(name)) for name in comparison_df['Strategy'].tolist()]
+        for column, _, formatter in COMPARISON_COLUMNS:
+            if formatter is not None:
+                comparison_df[column] = [formatter(value) for value in numeric_df[column].tolist()]
         
         # Generate HTML
-        html_content = self._create_comparison_html(comparison_df, backtest_results)
+        html_content = self._create_comparison_html(comparison_df, numeric_df, backtest_results, generated_at)
         
         with open(output_path, 'w') as f:
             f.write(html_content)
@@ -153,16 +215,18 @@ class BacktestReporter:
         self,
         backtest_result,
         output_path: str,
-        include_plots: bool = True
+        include_plots: bool = True,
+        generated_at: Optional[datetime] = None
     ):
         """Generate comprehensive HTML report"""
+        generated_at = generated_at or datetime.now()
         
-        # Create HTML content
-        html_content = f"""
+        # Collect the sections and write them out in one go
+        parts = [f"""
         <!DOCTYPE html>
         <html>
         <head>
-            <title>Backtest Report - {backtest_result.strategy_name}</title>
+            <title>Backtest Report - {html.escape(str(backtest_result.strategy_name))}</title>
             <style>
                 body {{ font-family: Arial, sans-serif; margin: 40px; }}
                 .header {{ background-color: #f4f4f4; padding: 20px; border-radius: 5px; }}
@@ -182,81 +246,64 @@ class BacktestReporter:
         </head>
         <body>
             <div class="header">
-                <h1>Backtest Report: {backtest_result.strategy_name}</h1>
+                <h1>Backtest Report: {html.escape(str(backtest_result.strategy_name))}</h1>
                 <p><strong>Period:</strong> {backtest_result.start_date} to {backtest_result.end_date}</p>
-                <p><strong>Generated:</strong> {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</p>
+                <p><strong>Generated:</strong> {generated_at:%Y-%m-%d %H:%M:%S}</p>
             </div>
-        """
+        """]
         
         # Add key metrics
-        html_content += self._create_metrics_section(backtest_result)
+        parts.append(self._create_metrics_section(backtest_result))
         
         # Add performance summary
-        html_content += self._create_performance_section(backtest_result)
+        parts.append(self._create_performance_section(backtest_result))
         
         # Add risk metrics
-        html_content += self._create_risk_section(backtest_result)
+        parts.append(self._create_risk_section(backtest_result))
         
         # Add trade analysis
         if not backtest_result.trade_history.empty:
-            html_content += self._create_trade_analysis_section(backtest_result)
+            parts.append(self._create_trade_analysis_section(backtest_result))
         
         # Add plots section placeholder
-        if include_plots and PLOTTING_AVAILABLE:
-            html_content += """
+        if include_plots and _ensure_plotting():
+            parts.append("""
             <div class="section">
                 <h2>📊 Performance Charts</h2>
                 <p>Charts saved separately in plots directory</p>
             </div>
-            """
+            """)
         
-        html_content += """
+        parts.append("""
         </body>
         </html>
-        """
+        """)
         
-        with open(output_path, 'w') as f:
-            f.write(html_content)
+        with open(output_path, 'w', buffering=1 << 20) as f:
+            f.writelines(parts)
     
     def _create_metrics_section(self, backtest_result) -> str:
         """Create key metrics section"""
-        return f"""
-        <div class="section">
-            <h2>📈 Key Performance Metrics</h2>
-            <div class="metrics-grid">
-                <div class="metric-card">
-                    <div class="metric-title">Total Return</div>
-                    <div class="metric-value {'positive' if backtest_result.total_return > 0 else 'negative'}">
-                        {backtest_result.total_return:.2%}
-                    </div>
-                </div>
-                <div class="metric-card">
-                    <div class="metric-title">Annual Return</div>
-                    <div class="metric-value {'positive' if backtest_result.annual_return > 0 else 'negative'}">
-                        {backtest_result.annual_return:.2%}
-                    </div>
-                </div>
-                <div class="metric-card">
-                    <div class="metric-title">Volatility</div>
-                    <div class="metric-value">{backtest_result.volatility:.2%}</div>
-                </div>
-                <div class="metric-card">
-                    <div class="metric-title">Sharpe Ratio</div>
-                    <div class="metric-value {'positive' if backtest_result.sharpe_ratio > 0 else 'negative'}">
-                        {backtest_result.sharpe_ratio:.2f}
-                    </div>
-                </div>
-                <div class="metric-card">
-                    <div class="metric-title">Max Drawdown</div>
-                    <div class="metric-value negative">{backtest_result.max_drawdown:.2%}</div>
-                </div>
-                <div class="metric-card">
-                    <div class="metric-title">Calmar Ratio</div>
-                    <div class="metric-value">{backtest_result.calmar_ratio:.2f}</div>
-                </div>
-            </div>
-        </div>
-        """
+        r = backtest_result
+        # (title, formatted value, value CSS class)
+        cards = [
+            ('Total Return', _format_pct(r.total_return), _sign_class(r.total_return)),
+            ('Annual Return', _format_pct(r.annual_return), _sign_class(r.annual_return)),
+            ('Volatility', _format_pct(r.volatility), None),
+            ('Sharpe Ratio', _format_ratio(r.sharpe_ratio), _sign_class(r.sharpe_ratio)),
+            ('Max Drawdown', _format_pct(r.max_drawdown), 'negative'),
+            ('Calmar Ratio', _format_ratio(r.calmar_ratio), None),
+        ]
+        
+        parts = ['\n        <div class="section">\n            <h2>📈 Key Performance Metrics</h2>\n            <div class="metrics-grid">\n']
+        for title, value, css_class in cards:
+            value_class = f"metric-value {css_class}" if css_class else "metric-value"
+            parts.append(
+                f'                <div class="metric-card"><div class="metric-title">{title}</div>'
+                f'<div class="{value_class}">{value}</div></div>\n'
+            )
+        parts.append('            </div>\n        </div>\n        ')
+        return ''.join(parts)
     
     def _create_performance_section(self, backtest_result) -> str:
         """Create performance summary section"""
@@ -302,9 +349,12 @@ class BacktestReporter:
         if trades.empty:
             return ""
         
-        # Calculate trade statistics
-        winning_trades = trades[trades['pnl'] > 0]
-        losing_trades = trades[trades['pnl'] < 0]
+        # Calculate trade statistics on the P&L array; empty sides show as nan
+        pnl = trades['pnl'].to_numpy(dtype=np.float64)
+        wins = pnl[pnl > 0]
+        losses = pnl[pnl < 0]
+        avg_win, max_win = (wins.mean(), wins.max()) if len(wins) else (np.nan, np.nan)
+        avg_loss, max_loss = (losses.mean(), losses.min()) if len(losses) else (np.nan, np.nan)
         
         return f"""
         <div class="section">
@@ -312,26 +362,30 @@ class BacktestReporter:
             <table>
                 <tr><th>Trade Statistic</th><th>Value</th></tr>
                 <tr><td>Total Trades</td><td>{len(trades)}</td></tr>
-                <tr><td>Winning Trades</td><td>{len(winning_trades)}</td></tr>
-                <tr><td>Losing Trades</td><td>{len(losing_trades)}</td></tr>
-                <tr><td>Win Rate</td><td>{len(winning_trades)/len(trades):.2%}</td></tr>
-                <tr><td>Average Win</td><td class="positive">${winning_trades['pnl'].mean():.2f}</td></tr>
-                <tr><td>Average Loss</td><td class="negative">${losing_trades['pnl'].mean():.2f}</td></tr>
-                <tr><td>Largest Win</td><td class="positive">${winning_trades['pnl'].max():.2f}</td></tr>
-                <tr><td>Largest Loss</td><td class="negative">${losing_trades['pnl'].min():.2f}</td></tr>
+                <tr><td>Winning Trades</td><td>{len(wins)}</td></tr>
+                <tr><td>Losing Trades</td><td>{len(losses)}</td></tr>
+                <tr><td>Win Rate</td><td>{len(wins)/len(trades):.2%}</td></tr>
+                <tr><td>Average Win</td><td class="positive">${avg_win:.2f}</td></tr>
+                <tr><td>Average Loss</td><td class="negative">${avg_loss:.2f}</td></tr>
+                <tr><td>Largest Win</td><td class="positive">${max_win:.2f}</td></tr>
+                <tr><td>Largest Loss</td><td class="negative">${max_loss:.2f}</td></tr>
             </table>
             
             <h3>Recent Trades</h3>
-            {trades.tail(10).to_html(classes='table', table_id='trades-table')}
+            {_df_to_simple_html(trades.tail(10), table_id='trades-table')}
         </div>
         """
     
     def _create_comparison_html(
         self,
         comparison_df: pd.DataFrame,
-        backtest_results: List[Tuple[str, Any]]
+        numeric_df: pd.DataFrame,
+        backtest_results: List[Tuple[str, Any]],
+        generated_at: Optional[datetime] = None
     ) -> str:
         """Create HTML for strategy comparison"""
+        generated_at = generated_at or datetime.now()
+        strategies = numeric_df['Strategy'].map(lambda name: html.escape(str(name)))
         
         html_content = f"""
         <!DOCTYPE html>
@@ -353,7 +407,7 @@ class BacktestReporter:
         <body>
             <div class="header">
                 <h1>Strategy Comparison Report</h1>
-                <p><strong>Generated:</strong> {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</p>
+                <p><strong>Generated:</strong> {generated_at:%Y-%m-%d %H:%M:%S}</p>
                 <p><strong>Strategies Compared:</strong> {len(backtest_results)}</p>
             </div>
             
@@ -364,9 +418,9 @@ class BacktestReporter:
             
             <div class="section">
                 <h2>📈 Analysis Summary</h2>
-                <p>Best performing strategy by total return: <strong>{comparison_df.loc[comparison_df['Total Return'].str.rstrip('%').astype(float).idxmax(), 'Strategy']}</strong></p>
-                <p>Best Sharpe ratio: <strong>{comparison_df.loc[comparison_df['Sharpe Ratio'].astype(float).idxmax(), 'Strategy']}</strong></p>
-                <p>Lowest drawdown: <strong>{comparison_df.loc[comparison_df['Max Drawdown'].str.rstrip('%').astype(float).idxmin(), 'Strategy']}</strong></p>
+                <p>Best performing strategy by total return: <strong>{strategies[numeric_df['Total Return'].idxmax()]}</strong></p>
+                <p>Best Sharpe ratio: <strong>{strategies[numeric_df['Sharpe Ratio'].idxmax()]}</strong></p>
+                <p>Lowest drawdown: <strong>{strategies[numeric_df['Max Drawdown'].idxmin()]}</strong></p>
             </div>
         </body>
         </html>
@@ -376,109 +430,69 @@ class BacktestReporter:
     
     def _generate_plots(self, backtest_result, plots_dir: str) -> Dict[str, str]:
         """Generate performance plots"""
-        if not PLOTTING_AVAILABLE:
+        if not _ensure_plotting():
             return {}
         
-        plot_files = {}
+        # Style applies to these plots only
+        with matplotlib.rc_context(matplotlib.style.library['seaborn-v0_8']):
+            return self._draw_plots(backtest_result, plots_dir)
+    
+    def _draw_plots(self, backtest_result, plots_dir: str) -> Dict[str, str]:
+        """Draw and save the performance plots, each in its own thread"""
+        # name -> (plot function, figure size, arguments after the figure)
+        jobs = {}
+        
+        # Dates parsed and values extracted once for all portfolio plots
+        portfolio_data = backtest_result.portfolio_history
+        if not portfolio_data.empty:
+            dates = pd.to_datetime(portfolio_data['date']).to_numpy()
+            portfolio_values = portfolio_data['portfolio_value'].to_numpy(dtype=np.float64)
+            jobs['portfolio_value'] = (
+                _plot_portfolio_value, (12, 6),
+                (dates, portfolio_values, os.path.join(plots_dir, 'portfolio_value.png'))
+            )
+            jobs['drawdown'] = (
+                _plot_drawdown, (12, 6),
+                (dates, portfolio_values, os.path.join(plots_dir, 'drawdown.png'))
+            )
+            jobs['monthly_heatmap'] = (
+                _plot_monthly_heatmap, (12, 8),
+                (dates, portfolio_values, os.path.join(plots_dir, 'monthly_returns_heatmap.png'))
+            )
         
-        # Set style
-        plt.style.use('seaborn-v0_8')
-        
-        # 1. Portfolio value over time
-        if not backtest_result.portfolio_history.empty:
-            fig, ax = plt.subplots(figsize=(12, 6))
-            portfolio_data = backtest_result.portfolio_history
-            ax.plot(pd.to_datetime(portfolio_data['date']), portfolio_data['portfolio_value'])
-            ax.set_title('Portfolio Value Over Time')
-            ax.set_xlabel('Date')
-            ax.set_ylabel('Portfolio Value ($)')
-            ax.grid(True, alpha=0.3)
-            plt.xticks(rotation=45)
-            plt.tight_layout()
-            
-            portfolio_plot = os.path.join(plots_dir, 'portfolio_value.png')
-            plt.savefig(portfolio_plot, dpi=300, bbox_inches='tight')
-            plt.close()
-            plot_files['portfolio_value'] = portfolio_plot
-        
-        # 2. Drawdown chart
-        if not backtest_result.portfolio_history.empty:
-            fig, ax = plt.subplots(figsize=(12, 6))
-            portfolio_data = backtest_result.portfolio_history
-            portfolio_values = portfolio_data['portfolio_value']
-            running_max = portfolio_values.expanding().max()
-            drawdown = (portfolio_values - running_max) / running_max
-            
-            ax.fill_between(pd.to_datetime(portfolio_data['date']), drawdown, 0, alpha=0.3, color='red')
-            ax.plot(pd.to_datetime(portfolio_data['date']), drawdown, color='red')
-            ax.set_title('Drawdown Over Time')
-            ax.set_xlabel('Date')
-            ax.set_ylabel('Drawdown (%)')
-            ax.grid(True, alpha=0.3)
-            plt.xticks(rotation=45)
-            plt.tight_layout()
-            
-            drawdown_plot = os.path.join(plots_dir, 'drawdown.png')
-            plt.savefig(drawdown_plot, dpi=300, bbox_inches='tight')
-            plt.close()
-            plot_files['drawdown'] = drawdown_plot
-        
-        # 3. Monthly returns heatmap
-        if not backtest_result.portfolio_history.empty:
-            portfolio_data = backtest_result.portfolio_history
-            portfolio_data['date'] = pd.to_datetime(portfolio_data['date'])
-            monthly_returns = portfolio_data.set_index('date')['portfolio_value'].resample('M').last().pct_change().dropna()
-            
-            if len(monthly_returns) > 12:
-                # Create pivot table for heatmap
-                returns_df = monthly_returns.to_frame('returns')
-                returns_df['year'] = returns_df.index.year
-                returns_df['month'] = returns_df.index.month
-                heatmap_data = returns_df.pivot('year', 'month', 'returns')
-                
-                fig, ax = plt.subplots(figsize=(12, 8))
-                sns.heatmap(heatmap_data, annot=True, fmt='.2%', cmap='RdYlGn', center=0, ax=ax)
-                ax.set_title('Monthly Returns Heatmap')
-                plt.tight_layout()
-                
-                heatmap_plot = os.path.join(plots_dir, 'monthly_returns_heatmap.png')
-                plt.savefig(heatmap_plot, dpi=300, bbox_inches='tight')
-                plt.close()
-                plot_files['monthly_heatmap'] = heatmap_plot
-        
-        # 4. Trade distribution
         if not backtest_result.trade_history.empty:
-            trades = backtest_result.trade_history
-            fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(15, 6))
-            
-            # PnL distribution
-            ax1.hist(trades['pnl'], bins=30, alpha=0.7, edgecolor='black')
-            ax1.axvline(x=0, color='red', linestyle='--', alpha=0.7)
-            ax1.set_title('Trade P&L Distribution')
-            ax1.set_xlabel('P&L ($)')
-            ax1.set_ylabel('Frequency')
-            ax1.grid(True, alpha=0.3)
-            
-            # Trade returns
-            if 'return_pct' in trades.columns:
-                ax2.hist(trades['return_pct'], bins=30, alpha=0.7, edgecolor='black')
-                ax2.axvline(x=0, color='red', linestyle='--', alpha=0.7)
-                ax2.set_title('Trade Return Distribution')
-                ax2.set_xlabel('Return (%)')
-                ax2.set_ylabel('Frequency')
-            else:
-                ax2.text(0.5, 0.5, 'Return data not available', ha='center', va='center', transform=ax2.transAxes)
-            
-            ax2.grid(True, alpha=0.3)
-            plt.tight_layout()
-            
-            trade_dist_plot = os.path.join(plots_dir, 'trade_distribution.png')
-            plt.savefig(trade_dist_plot, dpi=300, bbox_inches='tight')
-            plt.close()
-            plot_files['trade_distribution'] = trade_dist_plot
+            jobs['trade_distribution'] = (
+                _plot_trade_distribution, (15, 6),
+                (backtest_result.trade_history, os.path.join(plots_dir, 'trade_distribution.png'))
+            )
+        
+        if not jobs:
+            return {}
+        
+        # Plots share no state, and Agg renders largely outside the GIL
+        with ThreadPoolExecutor(max_workers=len(jobs)) as executor:
+            futures = {
+                name: executor.submit(plot, self._get_figure(name, *size), *args)
+                for name, (plot, size, args) in jobs.items()
+            }
         
+        plot_files = {}
+        for name, future in futures.items():
+            path = future.result()
+            if path:
+                plot_files[name] = path
         return plot_files
     
+    def _get_figure(self, name: str, width: float, height: float) -> 'Figure':
+        """The reusable figure for plot ``name``, cleared and resized"""
+        figure = self._figures.get(name)
+        if figure is None:
+            figure = self._figures[name] = Figure()
+            FigureCanvasAgg(figure)
+        figure.clear()
+        figure.set_size_inches(width, height)
+        return figure
+    
     def export_to_csv(
         self,
         backtest_result,
@@ -506,7 +520,7 @@ class BacktestReporter:
                 self.output_dir, 
                 f"{strategy_name}_portfolio_{timestamp}.csv"
             )
-            backtest_result.portfolio_history.to_csv(portfolio_file, index=False)
+            _write_csv(backtest_result.portfolio_history, portfolio_file)
             exported_files['portfolio'] = portfolio_file
         
         if include_trades and not backtest_result.trade_history.empty:
@@ -514,7 +528,7 @@ class BacktestReporter:
                 self.output_dir,
                 f"{strategy_name}_trades_{timestamp}.csv"
             )
-            backtest_result.trade_history.to_csv(trades_file, index=False)
+            _write_csv(backtest_result.trade_history, trades_file)
             exported_files['trades'] = trades_file
         
         # Export summary metrics
@@ -544,3 +558,170 @@ class BacktestReporter:
         exported_files['summary'] = summary_file
         
         return exported_files
+
+def _ensure_plotting() -> bool:
+    """Import the plotting libraries on first use; whether they are available"""
+    global PLOTTING_AVAILABLE, matplotlib, Figure, FigureCanvasAgg, sns
+    if PLOTTING_AVAILABLE is None:
+        try:
+            import matplotlib
+            # Reports are written to files; no display is needed
+            matplotlib.use('Agg')
+            import matplotlib.style
+            from matplotlib.figure import Figure
+            from matplotlib.backends.backend_agg import FigureCanvasAgg
+            import seaborn as sns
+            PLOTTING_AVAILABLE = True
+        except ImportError:
+            PLOTTING_AVAILABLE = False
+    return PLOTTING_AVAILABLE
+
+def _sign_class(value: float) -> str:
+    """CSS class for a value that is good when positive"""
+    return 'positive' if value > 0 else 'negative'
+
+def _report_digest(backtest_result, strategy_name: str, include_plots: bool, include_trades: bool) -> str:
+    """Short content hash of a report's inputs: result values, metrics and histories"""
+    h = hashlib.blake2b(digest_size=8)
+    scalars = {
+        key: value for key, value in vars(backtest_result).items()
+        if not isinstance(value, pd.DataFrame)
+    }
+    h.update(json.dumps(
+        [strategy_name, include_plots, include_trades, scalars], sort_keys=True, default=str
+    ).encode())
+    for frame in (backtest_result.portfolio_history, backtest_result.trade_history):
+        h.update(pd.util.hash_pandas_object(frame, index=True).to_numpy().tobytes())
+        h.update(repr(list(frame.columns)).encode())
+    return h.hexdigest()
+
+def _write_json(obj: Any, path: str):
+    """Write indented JSON, serialized by orjson when it is installed"""
+    if ORJSON_AVAILABLE:
+        options = orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(obj, option=options, default=str))
+        return
+    
+    with open(path, 'w') as f:
+        json.dump(obj, f, indent=2, default=str)
+
+def _write_csv(df: pd.DataFrame, path: str):
+    """Write a CSV export in bounded batches through one buffered file"""
+    with open(path, 'w', newline='', buffering=1 << 20) as f:
+        df.to_csv(f, index=False, chunksize=CSV_CHUNK_ROWS, lineterminator='\n')
+
+def _df_to_simple_html(df: pd.DataFrame, table_id: str) -> str:
+    """Plain HTML table for a small DataFrame, without pandas' HTML formatter"""
+    formatters = []
+    for dtype in df.dtypes:
+        if pd.api.types.is_float_dtype(dtype):
+            formatters.append('{:.2f}'.format)
+        elif pd.api.types.is_numeric_dtype(dtype):
+            formatters.append(str)
+        else:
+            # Only text columns can contain markup
+            formatters.append(lambda value: html.escape(str(value)))
+    
+    rows = [f'<table class="table" id="{table_id}"><thead><tr>']
+    rows.extend(f'<th>{html.escape(str(column))}</th>' for column in df.columns)
+    rows.append('</tr></thead><tbody>')
+    for row in df.itertuples(index=False, name=None):
+        rows.append('<tr>' + ''.join(
+            f'<td>{formatter(value)}</td>' for formatter, value in zip(formatters, row)
+        ) + '</tr>')
+    rows.append('</tbody></table>')
+    return ''.join(rows)
+
+def _plot_portfolio_value(fig: 'Figure', dates: np.ndarray, values: np.ndarray, path: str) -> str:
+    """Portfolio value over time"""
+    ax = fig.add_subplot()
+    ax.plot(dates, values, rasterized=True)
+    ax.set_title('Portfolio Value Over Time')
+    ax.set_xlabel('Date')
+    ax.set_ylabel('Portfolio Value ($)')
+    ax.grid(True, alpha=0.3)
+    ax.tick_params(axis='x', labelrotation=45)
+    fig.tight_layout()
+    fig.savefig(path, dpi=PLOT_DPI, bbox_inches='tight')
+    return path
+
+def _plot_drawdown(fig: 'Figure', dates: np.ndarray, values: np.ndarray, path: str) -> str:
+    """Drawdown from the running peak over time"""
+    # fmax skips NaN values like expanding().max() did
+    running_max = np.fmax.accumulate(values)
+    drawdown = (values - running_max) / running_max
+    
+    ax = fig.add_subplot()
+    ax.fill_between(dates, drawdown, 0, alpha=0.3, color='red', rasterized=True)
+    ax.plot(dates, drawdown, color='red', rasterized=True)
+    ax.set_title('Drawdown Over Time')
+    ax.set_xlabel('Date')
+    ax.set_ylabel('Drawdown (%)')
+    ax.grid(True, alpha=0.3)
+    ax.tick_params(axis='x', labelrotation=45)
+    fig.tight_layout()
+    fig.savefig(path, dpi=PLOT_DPI, bbox_inches='tight')
+    return path
+
+def _plot_monthly_heatmap(fig: 'Figure', dates: np.ndarray, values: np.ndarray, path: str) -> Optional[str]:
+    """Monthly returns by year and month; None when there are 12 months or fewer"""
+    # Month-end values from one hashed groupby on (year, month)
+    idx = pd.DatetimeIndex(dates)
+    month_end = pd.Series(values).groupby([idx.year.rename('year'), idx.month.rename('month')]).last()
+    monthly_returns = month_end.pct_change().dropna()
+    if len(monthly_returns) <= 12:
+        return None
+    
+    # Years as rows, months as columns, filled straight into a calendar grid
+    years = monthly_returns.index.get_level_values('year').to_numpy()
+    months = monthly_returns.index.get_level_values('month').to_numpy()
+    first_year, last_year = years.min(), years.max()
+    grid = np.full((last_year - first_year + 1, 12), np.nan)
+    grid[years - first_year, months - 1] = monthly_returns.to_numpy()
+    heatmap_data = pd.DataFrame(
+        grid,
+        index=pd.RangeIndex(first_year, last_year + 1, name='year'),
+        columns=pd.RangeIndex(1, 13, name='month')
+    )
+    
+    ax = fig.add_subplot()
+    with _SEABORN_LOCK:
+        sns.heatmap(heatmap_data, annot=True, fmt='.2%', cmap='RdYlGn', center=0, ax=ax)
+    ax.set_title('Monthly Returns Heatmap')
+    fig.tight_layout()
+    fig.savefig(path, dpi=PLOT_DPI, bbox_inches='tight')
+    return path
+
+def _plot_trade_distribution(fig: 'Figure', trades: pd.DataFrame, path: str) -> str:
+    """Histograms of trade P&L and, when available, trade returns"""
+    ax1, ax2 = fig.subplots(1, 2)
+    
+    # PnL distribution
+    _draw_histogram(ax1, trades['pnl'])
+    ax1.axvline(x=0, color='red', linestyle='--', alpha=0.7)
+    ax1.set_title('Trade P&L Distribution')
+    ax1.set_xlabel('P&L ($)')
+    ax1.set_ylabel('Frequency')
+    ax1.grid(True, alpha=0.3)
+    
+    # Trade returns
+    if 'return_pct' in trades.columns:
+        _draw_histogram(ax2, trades['return_pct'])
+        ax2.axvline(x=0, color='red', linestyle='--', alpha=0.7)
+        ax2.set_title('Trade Return Distribution')
+        ax2.set_xlabel('Return (%)')
+        ax2.set_ylabel('Frequency')
+    else:
+        ax2.text(0.5, 0.5, 'Return data not available', ha='center', va='center', transform=ax2.transAxes)
+    
+    ax2.grid(True, alpha=0.3)
+    fig.tight_layout()
+    fig.savefig(path, dpi=PLOT_DPI, bbox_inches='tight')
+    return path
+
+def _draw_histogram(ax, values: pd.Series, bins: int = 30):
+    """Bin with np.histogram and draw the counts as bars"""
+    values = values.to_numpy(dtype=np.float64)
+    counts, edges = np.histogram(values[np.isfinite(values)], bins=bins)
+    ax.bar(edges[:-1], counts, width=np.diff(edges), align='edge', alpha=0.7, edgecolor='black')
@@ -2,38 +2,64 @@
 Configuration management for QuantFlow
 """
 import os
+import sys
+from dataclasses import dataclass, field
 from typing import Optional
 from dotenv import load_dotenv
 
-# Load environment variables
+# Load .env into the process environment (existing variables win), where
+# other libraries also look for their settings
 load_dotenv()
+_ENV = os.environ
 
+def _env_str(key: str, default: Optional[str] = None) -> Optional[str]:
+    """Setting value with any trailing inline comment removed"""
+    raw = _ENV.get(key)
+    if raw is None:
+        return default
+    return raw.partition('#')[0].strip()
+
+def _env_float(key: str, default: str) -> float:
+    return float(_env_str(key, default))
+
+def _env_bool(key: str, default: str) -> bool:
+    return _env_str(key, default).lower() == 'true'
+
+# dataclass(slots=...) needs Python 3.10; older interpreters get a plain frozen dataclass
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(frozen=True, **_SLOTS)
 class Config:
-    """Configuration settings for QuantFlow"""
+    """
+    Configuration settings for QuantFlow (read-only once created)
+    
+    Read settings from the ``config`` instance; on Python 3.10+ the fields
+    are slots, so ``Config.X`` is a descriptor rather than the default.
+    """
     
-    # API Keys
-    ALPHA_VANTAGE_API_KEY: str = os.getenv('ALPHA_VANTAGE_API_KEY', 'demo')
-    BINANCE_API_KEY: Optional[str] = os.getenv('BINANCE_API_KEY')
-    BINANCE_SECRET_KEY: Optional[str] = os.getenv('BINANCE_SECRET_KEY')
+    # API Keys (kept out of repr so logging the config does not leak them)
+    ALPHA_VANTAGE_API_KEY: str = field(default=_ENV.get('ALPHA_VANTAGE_API_KEY', 'demo'), repr=False)
+    BINANCE_API_KEY: Optional[str] = field(default=_ENV.get('BINANCE_API_KEY'), repr=False)
+    BINANCE_SECRET_KEY: Optional[str] = field(default=_ENV.get('BINANCE_SECRET_KEY'), repr=False)
     
     # Database
-    DATABASE_URL: str = os.getenv('DATABASE_URL', 'sqlite:///./data/quantflow.db')
+    DATABASE_URL: str = _ENV.get('DATABASE_URL', 'sqlite:///./data/quantflow.db')
       # Risk Management
-    MAX_POSITION_SIZE: float = float((os.getenv('MAX_POSITION_SIZE', '0.1')).split('#')[0].strip())
-    MAX_DAILY_LOSS: float = float((os.getenv('MAX_DAILY_LOSS', '0.05')).split('#')[0].strip())
-    MAX_DRAWDOWN: float = float((os.getenv('MAX_DRAWDOWN', '0.15')).split('#')[0].strip())
+    MAX_POSITION_SIZE: float = _env_float('MAX_POSITION_SIZE', '0.1')
+    MAX_DAILY_LOSS: float = _env_float('MAX_DAILY_LOSS', '0.05')
+    MAX_DRAWDOWN: float = _env_float('MAX_DRAWDOWN', '0.15')
     
     # Trading
-    PAPER_TRADING: bool = (os.getenv('PAPER_TRADING', 'true')).split('#')[0].strip().lower() == 'true'
-    INITIAL_CAPITAL: float = float((os.getenv('INITIAL_CAPITAL', '100000')).split('#')[0].strip())
+    PAPER_TRADING: bool = _env_bool('PAPER_TRADING', 'true')
+    INITIAL_CAPITAL: float = _env_float('INITIAL_CAPITAL', '100000')
     
     # Data refresh intervals (in seconds)
     REAL_TIME_INTERVAL: int = 1
     HISTORICAL_DATA_REFRESH: int = 3600  # 1 hour
     
     # Logging
-    LOG_LEVEL: str = os.getenv('LOG_LEVEL', 'INFO')
-    LOG_FILE: str = os.getenv('LOG_FILE', './logs/quantflow.log')
+    LOG_LEVEL: str = _ENV.get('LOG_LEVEL', 'INFO')
+    LOG_FILE: str = _ENV.get('LOG_FILE', './logs/quantflow.log')
 
 # Global config instance
 config = Config()
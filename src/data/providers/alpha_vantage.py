@@ -2,31 +2,155 @@
 Alpha Vantage data provider
 """
 import aiohttp
+import numpy as np
 import pandas as pd
-from typing import List, Dict, Any
-from datetime import datetime, date
+from typing import List, Dict, Any, Optional, Tuple
+from datetime import datetime, date, time as dt_time, timedelta
+from zoneinfo import ZoneInfo
+from pathlib import Path
 import asyncio
+import hashlib
+import json
+import logging
+import os
+import time
+from collections import deque
+from operator import attrgetter, itemgetter
 from .base import DataProvider
 
+try:
+    import msgspec
+    MSGSPEC_AVAILABLE = True
+except ImportError:
+    MSGSPEC_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+OVERVIEW_CACHE_TTL = 86400  # company metadata rarely changes
+COMPACT_WINDOW_DAYS = 130  # 'compact' output covers the latest 100 trading days
+MAX_RESPONSE_BYTES = 32 * 1024 * 1024
+MARKET_TZ = ZoneInfo('America/New_York')
+MARKET_CLOSE = dt_time(16, 30)
+_NO_CACHE_MARKERS = (b'"Error Message"', b'"Note"', b'"Information"')
+
+_json_loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+
+if MSGSPEC_AVAILABLE:
+    class _DailyBar(msgspec.Struct, rename={
+        'open': '1. open', 'high': '2. high', 'low': '3. low', 'close': '4. close', 'volume': '5. volume'
+    }):
+        """One TIME_SERIES_DAILY bar"""
+        open: float
+        high: float
+        low: float
+        close: float
+        volume: float
+    
+    class _DailyResponse(msgspec.Struct, rename={
+        'time_series': 'Time Series (Daily)', 'error_message': 'Error Message', 'note': 'Note'
+    }):
+        """TIME_SERIES_DAILY payload (metadata is skipped)"""
+        time_series: Optional[Dict[str, _DailyBar]] = None
+        error_message: Optional[str] = None
+        note: Optional[str] = None
+    
+    # Numeric strings are coerced to float while decoding
+    _DAILY_DECODER = msgspec.json.Decoder(_DailyResponse, strict=False)
+    _bar_values = attrgetter('open', 'high', 'low', 'close', 'volume')
+else:
+    _bar_values = itemgetter('1. open', '2. high', '3. low', '4. close', '5. volume')
+
 class AlphaVantageProvider(DataProvider):
     """Alpha Vantage data provider (free tier: 5 calls/minute)"""
     
-    def __init__(self, api_key: str):
+    def __init__(self, api_key: str, cache_dir: Optional[str] = '~/.quantflow/av_cache'):
         self.api_key = api_key
         self.name = "alpha_vantage"
         self.base_url = "https://www.alphavantage.co/query"
-        self._last_call_time = 0
-        self._call_interval = 12  # 5 calls per minute = 12 seconds between calls
+        self.logger = logging.getLogger(__name__)
+        # Sliding window: at most 5 calls in any 60 seconds
+        self._calls_per_window = 5
+        self._rate_window = 60.0
+        self._call_times: deque = deque(maxlen=self._calls_per_window)
+        # Created on first use so it belongs to the running event loop
+        self._rate_lock: Optional[asyncio.Lock] = None
+        # Connection pool shared by all requests, opened on first use
+        self._session: Optional[aiohttp.ClientSession] = None
+        # Raw JSON responses keyed by request, so quota is spent only on new data
+        self._cache_dir = Path(cache_dir).expanduser() if cache_dir else None
+    
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Shared HTTP session, (re)created when missing or closed"""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=20, limit_per_host=5, ttl_dns_cache=300, keepalive_timeout=60
+                )
+            )
+        return self._session
+    
+    async def aclose(self):
+        """Close the shared HTTP session"""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
     
     async def _rate_limit(self):
-        """Ensure we don't exceed rate limits"""
-        current_time = asyncio.get_event_loop().time()
-        time_since_last_call = current_time - self._last_call_time
+        """Ensure we don't exceed rate limits (wait until the oldest of the last 5 calls is a minute old)"""
+        if self._rate_lock is None:
+            self._rate_lock = asyncio.Lock()
+        async with self._rate_lock:
+            if len(self._call_times) == self._calls_per_window:
+                wait = self._call_times[0] + self._rate_window - time.monotonic()
+                if wait > 0:
+                    await asyncio.sleep(wait)
+            self._call_times.append(time.monotonic())
+    
+    async def _query(self, params: Dict[str, str], ttl: Optional[float] = None) -> bytes:
+        """Run an API call for its raw JSON body, served from the disk cache when ``ttl`` is set"""
+        # Cache files hold the body verbatim; their mtime is set to the expiry time
+        path = self._cache_path(params) if ttl and self._cache_dir else None
+        if path is not None:
+            try:
+                if path.stat().st_mtime > time.time():
+                    return path.read_bytes()
+            except OSError:
+                pass
         
-        if time_since_last_call < self._call_interval:
-            await asyncio.sleep(self._call_interval - time_since_last_call)
+        await self._rate_limit()
+        session = await self._get_session()
+        async with session.get(self.base_url, params=params) as response:
+            if (response.content_length or 0) > MAX_RESPONSE_BYTES:
+                raise ValueError(f"Response of {response.content_length} bytes exceeds the size cap")
+            body = bytearray()
+            async for chunk in response.content.iter_chunked(1 << 16):
+                body += chunk
+                if len(body) > MAX_RESPONSE_BYTES:
+                    raise ValueError("Response exceeds the size cap")
+            body = bytes(body)
+            status = response.status
         
-        self._last_call_time = asyncio.get_event_loop().time()
+        # Error and throttling payloads are never cached
+        if path is not None and status == 200 and not any(marker in body for marker in _NO_CACHE_MARKERS):
+            try:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                tmp = path.with_suffix('.tmp')
+                tmp.write_bytes(body)
+                expires = time.time() + ttl
+                os.utime(tmp, (expires, expires))
+                tmp.replace(path)
+            except OSError:
+                pass
+        return body
+    
+    def _cache_path(self, params: Dict[str, str]) -> Path:
+        """Cache file for a request, independent of the API key"""
+        key = f"{params['function']}|{params['symbol']}|{params.get('outputsize', '')}"
+        return self._cache_dir / f"{hashlib.blake2b(key.encode(), digest_size=16).hexdigest()}.json"
     
     async def get_historical_data(
         self, 
@@ -47,8 +171,6 @@ class AlphaVantageProvider(DataProvider):
         Returns:
             DataFrame with OHLCV data
         """
-        await self._rate_limit()
-        
         # Map interval to Alpha Vantage function
         function_map = {
             '1d': 'TIME_SERIES_DAILY',
@@ -57,60 +179,92 @@ class AlphaVantageProvider(DataProvider):
         
         function = function_map.get(interval, 'TIME_SERIES_DAILY')
         
+        # The full ~20-year history is only needed when the range reaches past the compact window
+        recent_only = (date.today() - start_date).days <= COMPACT_WINDOW_DAYS
         params = {
             'function': function,
             'symbol': symbol,
             'apikey': self.api_key,
-            'outputsize': 'full'  # Get full historical data
+            'outputsize': 'compact' if recent_only else 'full'
         }
         
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(self.base_url, params=params) as response:
-                    data = await response.json()
+            # Daily bars only change after the close
+            body = await self._query(params, ttl=_seconds_until_market_close())
+            error, note, series = _decode_daily(body)
             
             # Check for API errors
-            if 'Error Message' in data:
-                raise ValueError(f"Alpha Vantage API Error: {data['Error Message']}")
+            if error:
+                raise ValueError(f"Alpha Vantage API Error: {error}")
             
-            if 'Note' in data:
-                raise ValueError(f"Alpha Vantage Rate Limit: {data['Note']}")
+            if note:
+                raise ValueError(f"Alpha Vantage Rate Limit: {note}")
             
-            # Extract time series data
-            time_series_key = 'Time Series (Daily)'
-            if time_series_key not in data:
+            if series is None:
                 raise ValueError(f"No time series data found for {symbol}")
             
-            time_series = data[time_series_key]
-            
-            # Convert to DataFrame
-            df_data = []
-            for date_str, values in time_series.items():
-                df_data.append({
-                    'timestamp': pd.to_datetime(date_str),
-                    'open_price': float(values['1. open']),
-                    'high_price': float(values['2. high']),
-                    'low_price': float(values['3. low']),
-                    'close_price': float(values['4. close']),
-                    'volume': float(values['5. volume']),
-                    'symbol': symbol,
-                    'provider': self.name
-                })
-            
-            df = pd.DataFrame(df_data)
-            df = df.sort_values('timestamp').reset_index(drop=True)
-            
-            # Filter by date range
-            df = df[
-                (df['timestamp'].dt.date >= start_date) & 
-                (df['timestamp'].dt.date <= end_date)
-            ]
+            # ISO date keys compare lexicographically, so only in-range bars are kept
+            start_s, end_s = start_date.isoformat(), end_date.isoformat()
+            time_series = {d: bar for d, bar in series.items() if start_s <= d <= end_s}
+            
+            # Convert to DataFrame from typed columns
+            n = len(time_series)
+            timestamps = np.array(list(time_series), dtype='datetime64[ns]')
+            ohlcv = np.array([_bar_values(bar) for bar in time_series.values()], dtype=float).reshape(n, 5)
+            
+            # Alpha Vantage lists the newest bar first
+            order = np.argsort(timestamps, kind='stable')
+            ohlcv = ohlcv[order]
+            df = pd.DataFrame({
+                'timestamp': timestamps[order],
+                'open_price': ohlcv[:, 0],
+                'high_price': ohlcv[:, 1],
+                'low_price': ohlcv[:, 2],
+                'close_price': ohlcv[:, 3],
+                'volume': ohlcv[:, 4],
+                'symbol': pd.Categorical([symbol] * n),
+                'provider': pd.Categorical([self.name] * n)
+            })
             
             return df
             
         except Exception as e:
             raise Exception(f"Error fetching Alpha Vantage data for {symbol}: {str(e)}")
     
+    async def get_historical_data_batch(
+        self,
+        symbols: List[str],
+        start_date: date,
+        end_date: date,
+        interval: str = '1d'
+    ) -> Dict[str, pd.DataFrame]:
+        """
+        Get historical market data for several symbols concurrently
+        
+        Requests queue at the rate limiter while earlier responses are parsed.
+        
+        Args:
+            symbols: Stock symbols
+            start_date: Start date for data
+            end_date: End date for data
+            interval: Data interval ('1d' only for free tier)
+        
+        Returns:
+            Dictionary mapping symbol to DataFrame with OHLCV data
+            (symbols that could not be fetched are logged and omitted)
+        """
+        frames = await asyncio.gather(
+            *(self.get_historical_data(s, start_date, end_date, interval) for s in symbols),
+            return_exceptions=True
+        )
+        result = {}
+        for symbol, df in zip(symbols, frames):
+            if isinstance(df, BaseException):
+                self.logger.warning(f"Skipping {symbol} in batch: {df}")
+            else:
+                result[symbol] = df
+        return result
+    
     async def get_real_time_price(self, symbol: str) -> Dict[str, float]:
         """
         Get current market price using Global Quote
@@ -121,8 +275,6 @@ class AlphaVantageProvider(DataProvider):
         Returns:
             Dictionary with current price data
         """
-        await self._rate_limit()
-        
         params = {
             'function': 'GLOBAL_QUOTE',
             'symbol': symbol,
@@ -130,9 +282,7 @@ class AlphaVantageProvider(DataProvider):
         }
         
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(self.base_url, params=params) as response:
-                    data = await response.json()
+            data = _json_loads(await self._query(params))
             
             # Check for API errors
             if 'Error Message' in data:
@@ -169,40 +319,51 @@ class AlphaVantageProvider(DataProvider):
         Returns:
             Dictionary with symbol information
         """
-        result = {}
+        # Requests are still spaced by _rate_limit; parsing overlaps the waits
+        pairs = await asyncio.gather(*(self._fetch_symbol_info(s) for s in symbols))
+        return dict(pairs)
+    
+    async def _fetch_symbol_info(self, symbol: str):
+        """Fetch company overview for one symbol as a (symbol, info) pair"""
+        params = {
+            'function': 'OVERVIEW',
+            'symbol': symbol,
+            'apikey': self.api_key
+        }
         
-        for symbol in symbols:
-            await self._rate_limit()
+        try:
+            data = _json_loads(await self._query(params, ttl=OVERVIEW_CACHE_TTL))
             
-            params = {
-                'function': 'OVERVIEW',
-                'symbol': symbol,
-                'apikey': self.api_key
+            if 'Error Message' in data:
+                return symbol, {'error': data['Error Message']}
+            
+            if 'Note' in data:
+                return symbol, {'error': 'Rate limit exceeded'}
+            
+            return symbol, {
+                'name': data.get('Name', symbol),
+                'sector': data.get('Sector', 'Unknown'),
+                'industry': data.get('Industry', 'Unknown'),
+                'market_cap': int(data.get('MarketCapitalization', 0)) if data.get('MarketCapitalization') else 0,
+                'currency': data.get('Currency', 'USD'),
+                'exchange': data.get('Exchange', 'Unknown')
             }
             
-            try:
-                async with aiohttp.ClientSession() as session:
-                    async with session.get(self.base_url, params=params) as response:
-                        data = await response.json()
-                
-                if 'Error Message' in data:
-                    result[symbol] = {'error': data['Error Message']}
-                    continue
-                
-                if 'Note' in data:
-                    result[symbol] = {'error': 'Rate limit exceeded'}
-                    continue
-                
-                result[symbol] = {
-                    'name': data.get('Name', symbol),
-                    'sector': data.get('Sector', 'Unknown'),
-                    'industry': data.get('Industry', 'Unknown'),
-                    'market_cap': int(data.get('MarketCapitalization', 0)) if data.get('MarketCapitalization') else 0,
-                    'currency': data.get('Currency', 'USD'),
-                    'exchange': data.get('Exchange', 'Unknown')
-                }
-                
-            except Exception as e:
-                result[symbol] = {'error': str(e)}
-        
-        return result
+        except Exception as e:
+            return symbol, {'error': str(e)}
+
+def _seconds_until_market_close() -> float:
+    """Seconds until the next 16:30 New York close"""
+    now = datetime.now(MARKET_TZ)
+    close = datetime.combine(now.date(), MARKET_CLOSE, tzinfo=MARKET_TZ)
+    if close <= now:
+        close += timedelta(days=1)
+    return (close - now).total_seconds()
+
+def _decode_daily(body: bytes) -> Tuple[Optional[str], Optional[str], Optional[Dict[str, Any]]]:
+    """Error message, rate-limit note and date-keyed bars from a daily series response"""
+    if MSGSPEC_AVAILABLE:
+        response = _DAILY_DECODER.decode(body)
+        return response.error_message, response.note, response.time_series
+    data = _json_loads(body)
+    return data.get('Error Message'), data.get('Note'), data.get('Time Series (Daily)')
@@ -3,16 +3,27 @@ Yahoo Finance data provider
 """
 import yfinance as yf
 import pandas as pd
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Tuple
 from datetime import datetime, date
 import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
 from .base import DataProvider
 
+YF_MAX_WORKERS = 16
+REAL_TIME_INFO_TTL = 1.0  # seconds; quotes must stay fresh
+SYMBOL_INFO_TTL = 3600.0  # seconds; company metadata rarely changes
+
+# Shared by all providers so yfinance calls are not capped by the loop's default executor
+_YF_EXECUTOR = ThreadPoolExecutor(max_workers=YF_MAX_WORKERS, thread_name_prefix='yf')
+
 class YahooFinanceProvider(DataProvider):
     """Yahoo Finance data provider (free tier)"""
     
     def __init__(self):
         self.name = "yahoo_finance"
+        # symbol -> (fetch time, ticker.info); each lookup costs several HTTP requests
+        self._info_cache: Dict[str, Tuple[float, Dict]] = {}
     
     async def get_historical_data(
         self, 
@@ -37,7 +48,7 @@ class YahooFinanceProvider(DataProvider):
             # Run in executor to avoid blocking
             loop = asyncio.get_event_loop()
             data = await loop.run_in_executor(
-                None, 
+                _YF_EXECUTOR, 
                 self._fetch_historical_data, 
                 symbol, start_date, end_date, interval
             )
@@ -45,26 +56,84 @@ class YahooFinanceProvider(DataProvider):
             if data.empty:
                 raise ValueError(f"No data found for symbol {symbol}")
             
-            # Standardize column names
-            data = data.rename(columns={
-                'Open': 'open_price',
-                'High': 'high_price',
-                'Low': 'low_price',
-                'Close': 'close_price',
-                'Volume': 'volume'
-            })
-            
-            # Add metadata
-            data['symbol'] = symbol
-            data['provider'] = self.name
-            data.reset_index(inplace=True)
-            data = data.rename(columns={'Date': 'timestamp'})
-            
-            return data
+            return self._standardize(data, symbol)
             
         except Exception as e:
             raise Exception(f"Error fetching data for {symbol}: {str(e)}")
     
+    async def get_historical_data_batch(
+        self,
+        symbols: List[str],
+        start_date: date,
+        end_date: date,
+        interval: str = '1d'
+    ) -> Dict[str, pd.DataFrame]:
+        """
+        Get historical market data for several symbols in one batched download
+        
+        Args:
+            symbols: Stock symbols
+            start_date: Start date for data
+            end_date: End date for data
+            interval: Data interval ('1d', '1h', '5m', etc.)
+        
+        Returns:
+            Dictionary mapping symbol to DataFrame with OHLCV data
+            (symbols without data are omitted)
+        """
+        try:
+            loop = asyncio.get_event_loop()
+            data = await loop.run_in_executor(
+                _YF_EXECUTOR,
+                self._download_historical_data,
+                symbols, start_date, end_date, interval
+            )
+        except Exception as e:
+            raise Exception(f"Error fetching data for {', '.join(symbols)}: {str(e)}")
+        
+        # A single ticker may come back with flat columns; give it the ticker level
+        if not isinstance(data.columns, pd.MultiIndex) and len(symbols) == 1:
+            data = pd.concat({symbols[0]: data}, axis=1)
+        
+        result = {}
+        for symbol in symbols:
+            if symbol not in data.columns.get_level_values(0):
+                continue
+            symbol_data = data.xs(symbol, axis=1, level=0).rename_axis(columns=None).dropna(how='all')
+            if not symbol_data.empty:
+                result[symbol] = self._standardize(symbol_data, symbol)
+        return result
+    
+    def _download_historical_data(self, symbols: List[str], start_date: date, end_date: date, interval: str) -> pd.DataFrame:
+        """Synchronous batched fetch for executor (yfinance threads the requests)"""
+        return yf.download(
+            tickers=' '.join(symbols),
+            start=start_date,
+            end=end_date,
+            interval=interval,
+            group_by='ticker',
+            threads=True,
+            progress=False
+        )
+    
+    def _standardize(self, data: pd.DataFrame, symbol: str) -> pd.DataFrame:
+        """Rename yfinance columns and add symbol/provider metadata"""
+        data = data.rename(columns={
+            'Open': 'open_price',
+            'High': 'high_price',
+            'Low': 'low_price',
+            'Close': 'close_price',
+            'Volume': 'volume'
+        })
+        
+        # Add metadata
+        data['symbol'] = symbol
+        data['provider'] = self.name
+        data.reset_index(inplace=True)
+        data = data.rename(columns={'Date': 'timestamp'})
+        
+        return data
+    
     def _fetch_historical_data(self, symbol: str, start_date: date, end_date: date, interval: str) -> pd.DataFrame:
         """Synchronous data fetch for executor"""
         ticker = yf.Ticker(symbol)
@@ -88,7 +157,7 @@ class YahooFinanceProvider(DataProvider):
         try:
             loop = asyncio.get_event_loop()
             ticker_data = await loop.run_in_executor(
-                None, 
+                _YF_EXECUTOR, 
                 self._fetch_real_time_price, 
                 symbol
             )
@@ -107,8 +176,7 @@ class YahooFinanceProvider(DataProvider):
     
     def _fetch_real_time_price(self, symbol: str) -> Dict:
         """Synchronous price fetch for executor"""
-        ticker = yf.Ticker(symbol)
-        return ticker.info
+        return self._cached_info(symbol, REAL_TIME_INFO_TTL)
     
     async def get_symbols_info(self, symbols: List[str]) -> Dict[str, Any]:
         """
@@ -120,27 +188,22 @@ class YahooFinanceProvider(DataProvider):
         Returns:
             Dictionary with symbol information
         """
-        result = {}
+        loop = asyncio.get_event_loop()
+        sem = asyncio.Semaphore(YF_MAX_WORKERS)
         
-        for symbol in symbols:
-            try:
-                loop = asyncio.get_event_loop()
-                info = await loop.run_in_executor(
-                    None, 
-                    self._fetch_symbol_info, 
-                    symbol
-                )
-                result[symbol] = info
-                
-            except Exception as e:
-                result[symbol] = {'error': str(e)}
+        async def _one(symbol: str):
+            async with sem:
+                try:
+                    return symbol, await loop.run_in_executor(_YF_EXECUTOR, self._fetch_symbol_info, symbol)
+                except Exception as e:
+                    return symbol, {'error': str(e)}
         
-        return result
+        pairs = await asyncio.gather(*(_one(s) for s in symbols))
+        return dict(pairs)
     
     def _fetch_symbol_info(self, symbol: str) -> Dict:
         """Synchronous symbol info fetch for executor"""
-        ticker = yf.Ticker(symbol)
-        info = ticker.info
+        info = self._cached_info(symbol, SYMBOL_INFO_TTL)
         
         return {
             'name': info.get('longName', symbol),
@@ -150,3 +213,13 @@ class YahooFinanceProvider(DataProvider):
             'currency': info.get('currency', 'USD'),
             'exchange': info.get('exchange', 'Unknown')
         }
+    
+    def _cached_info(self, symbol: str, ttl: float) -> Dict:
+        """ticker.info for symbol, reused while younger than ttl seconds"""
+        now = time.monotonic()
+        hit = self._info_cache.get(symbol)
+        if hit is not None and now - hit[0] < ttl:
+            return hit[1]
+        info = yf.Ticker(symbol).info
+        self._info_cache[symbol] = (now, info)
+        return info
@@ -1,21 +1,25 @@
 """
 Database models and schema for QuantFlow
 """
-from sqlalchemy import create_engine, Column, Integer, String, Float, DateTime, Boolean, Text
+from sqlalchemy import create_engine, event, Column, Index, Integer, String, Float, DateTime, Boolean, Text
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from datetime import datetime
-from typing import Optional
+from typing import Optional, List, Dict, Any
 import os
 
 Base = declarative_base()
 
+MARKET_DATA_BATCH_SIZE = 1000  # rows per executemany round trip
+
 class MarketData(Base):
     """Historical market data storage"""
     __tablename__ = 'market_data'
+    # Serves "bars for a symbol over a date range" as a single index range scan
+    __table_args__ = (Index('ix_market_data_symbol_ts', 'symbol', 'timestamp'),)
     
     id = Column(Integer, primary_key=True)
-    symbol = Column(String(20), nullable=False, index=True)
+    symbol = Column(String(20), nullable=False)
     timestamp = Column(DateTime, nullable=False, index=True)
     open_price = Column(Float, nullable=False)
     high_price = Column(Float, nullable=False)
@@ -54,6 +58,9 @@ class Portfolio(Base):
     total_pnl = Column(Float, default=0.0)
     drawdown = Column(Float, default=0.0)
     created_at = Column(DateTime, default=datetime.utcnow)
+    
+    # "Latest snapshot" lookups become a single index probe
+    __table_args__ = (Index('ix_portfolio_ts_desc', timestamp.desc()),)
 
 class Position(Base):
     """Current position holdings"""
@@ -91,6 +98,7 @@ class DatabaseManager:
         self.database_url = database_url
         self.engine = None
         self.SessionLocal = None
+        self.ReadSession = None
         self._initialize_database()
     
     def _initialize_database(self):
@@ -101,7 +109,11 @@ class DatabaseManager:
             os.makedirs(os.path.dirname(db_path), exist_ok=True)
         
         self.engine = create_engine(self.database_url)
+        if self.database_url.startswith('sqlite'):
+            event.listen(self.engine, 'connect', _set_sqlite_pragmas)
         self.SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=self.engine)
+        # Loaded objects stay usable after commit/close without reload round trips
+        self.ReadSession = sessionmaker(bind=self.engine, autoflush=False, expire_on_commit=False)
         
         # Create all tables
         Base.metadata.create_all(bind=self.engine)
@@ -110,7 +122,31 @@ class DatabaseManager:
         """Get a database session"""
         return self.SessionLocal()
     
+    def get_read_session(self):
+        """Get a session for queries whose results outlive the session"""
+        return self.ReadSession()
+    
+    def get_latest_portfolio_snapshot(self) -> Optional[Portfolio]:
+        """Most recent portfolio snapshot, or None if none are stored"""
+        with self.get_read_session() as session:
+            return session.query(Portfolio).order_by(Portfolio.timestamp.desc()).first()
+    
+    def bulk_insert_market_data(self, rows: List[Dict[str, Any]]):
+        """Insert market data rows with batched executemany in a single transaction"""
+        insert_stmt = MarketData.__table__.insert()
+        with self.engine.begin() as conn:
+            for i in range(0, len(rows), MARKET_DATA_BATCH_SIZE):
+                conn.execute(insert_stmt, rows[i:i + MARKET_DATA_BATCH_SIZE])
+    
     def close(self):
         """Close database connection"""
         if self.engine:
             self.engine.dispose()
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    """Use write-ahead logging, relaxed fsync and memory-mapped reads for SQLite connections"""
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA mmap_size=268435456")  # 256 MiB
+    cursor.close()
@@ -10,18 +10,37 @@ from datetime import datetime
 import websockets
 from dataclasses import dataclass
 
-@dataclass
-class MarketDataMessage:
-    """Standardized market data message"""
-    symbol: str
-    price: float
-    volume: float
-    timestamp: datetime
-    bid: Optional[float] = None
-    ask: Optional[float] = None
-    change: Optional[float] = None
-    change_percent: Optional[float] = None
-    provider: str = "unknown"
+try:
+    import msgspec
+    MSGSPEC_AVAILABLE = True
+except ImportError:
+    MSGSPEC_AVAILABLE = False
+
+if MSGSPEC_AVAILABLE:
+    class MarketDataMessage(msgspec.Struct, gc=False):
+        """Standardized market data message"""
+        symbol: str
+        price: float
+        volume: float
+        timestamp: datetime
+        bid: Optional[float] = None
+        ask: Optional[float] = None
+        change: Optional[float] = None
+        change_percent: Optional[float] = None
+        provider: str = "unknown"
+else:
+    @dataclass
+    class MarketDataMessage:
+        """Standardized market data message"""
+        symbol: str
+        price: float
+        volume: float
+        timestamp: datetime
+        bid: Optional[float] = None
+        ask: Optional[float] = None
+        change: Optional[float] = None
+        change_percent: Optional[float] = None
+        provider: str = "unknown"
 
 class WebSocketClient(ABC):
     """Abstract base class for WebSocket market data clients"""
@@ -31,6 +50,9 @@ class WebSocketClient(ABC):
         self.is_connected = False
         self.websocket = None
         self.message_handlers: List[Callable] = []
+        # Handlers split by kind once at registration, not per message
+        self._sync_handlers: List[Callable] = []
+        self._async_handlers: List[Callable] = []
         self.logger = logging.getLogger(f'{self.__class__.__name__}')
         
     @abstractmethod
@@ -51,6 +73,23 @@ class WebSocketClient(ABC):
     def add_message_handler(self, handler: Callable[[MarketDataMessage], None]):
         """Add handler for incoming messages"""
         self.message_handlers.append(handler)
+        (self._async_handlers if asyncio.iscoroutinefunction(handler) else self._sync_handlers).append(handler)
+    
+    async def _dispatch(self, message: MarketDataMessage):
+        """Deliver message to all handlers; a failing handler does not affect the others"""
+        for handler in self._sync_handlers:
+            try:
+                handler(message)
+            except Exception as e:
+                self.logger.error(f"Error in message handler: {e}")
+        
+        if self._async_handlers:
+            results = await asyncio.gather(
+                *(handler(message) for handler in self._async_handlers), return_exceptions=True
+            )
+            for result in results:
+                if isinstance(result, Exception):
+                    self.logger.error(f"Error in message handler: {result}")
     
     async def start_streaming(self):
         """Start streaming and handle messages"""
@@ -69,12 +108,7 @@ class WebSocketClient(ABC):
                 try:
                     parsed_message = await self.parse_message(message)
                     if parsed_message:
-                        # Notify all handlers
-                        for handler in self.message_handlers:
-                            try:
-                                await handler(parsed_message) if asyncio.iscoroutinefunction(handler) else handler(parsed_message)
-                            except Exception as e:
-                                self.logger.error(f"Error in message handler: {e}")
+                        await self._dispatch(parsed_message)
                 except Exception as e:
                     self.logger.error(f"Error parsing message: {e}")
                     
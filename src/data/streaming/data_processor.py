@@ -3,10 +3,18 @@ Real-time data processor for handling streaming market data
 """
 import asyncio
 import logging
-from collections import defaultdict, deque
+from collections import defaultdict
 from typing import Dict, List, Callable, Optional, Any
-from datetime import datetime, timedelta
-import statistics
+from datetime import datetime
+import math
+import time
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
 
 from . import MarketDataMessage
 
@@ -15,16 +23,32 @@ class DataProcessor:
     
     def __init__(self, buffer_size: int = 1000):
         self.buffer_size = buffer_size
-        self.price_buffers: Dict[str, deque] = defaultdict(lambda: deque(maxlen=buffer_size))
-        self.volume_buffers: Dict[str, deque] = defaultdict(lambda: deque(maxlen=buffer_size))
+        # Per-symbol ring buffers stored column-wise; _head counts ticks ever written
+        self._prices: Dict[str, np.ndarray] = {}
+        self._volumes: Dict[str, np.ndarray] = {}
+        self._ts: Dict[str, np.ndarray] = {}
+        self._head: Dict[str, int] = {}
         self.message_handlers: List[Callable] = []
+        # Handlers split by kind once at registration, not per message
+        self._sync_handlers: List[Callable] = []
+        self._async_handlers: List[Callable] = []
         self.latest_prices: Dict[str, float] = {}
         self.price_changes: Dict[str, Dict[str, float]] = defaultdict(dict)
         self.logger = logging.getLogger('DataProcessor')
     
+    def register_symbols(self, symbols: List[str]):
+        """Allocate ring buffers up front so the first tick of a symbol does not"""
+        for symbol in symbols:
+            if symbol not in self._head:
+                self._prices[symbol] = np.zeros(self.buffer_size)
+                self._volumes[symbol] = np.zeros(self.buffer_size)
+                self._ts[symbol] = np.zeros(self.buffer_size, dtype=np.int64)
+                self._head[symbol] = 0
+    
     def add_handler(self, handler: Callable[[MarketDataMessage], None]):
         """Add handler for processed messages"""
         self.message_handlers.append(handler)
+        (self._async_handlers if asyncio.iscoroutinefunction(handler) else self._sync_handlers).append(handler)
     
     async def process_message(self, message: MarketDataMessage):
         """Process incoming market data message"""
@@ -47,38 +71,34 @@ class DataProcessor:
             }
             
             # Add to buffers
-            self.price_buffers[symbol].append({
-                'price': message.price,
-                'timestamp': message.timestamp
-            })
+            if symbol not in self._head:
+                # Symbols subscribed after startup still get buffers, off the common path
+                self.register_symbols([symbol])
+            i = self._head[symbol] % self.buffer_size
+            self._prices[symbol][i] = message.price
+            self._volumes[symbol][i] = message.volume
+            self._ts[symbol][i] = _to_ns(message.timestamp)
+            self._head[symbol] += 1
             
-            self.volume_buffers[symbol].append({
-                'volume': message.volume,
-                'timestamp': message.timestamp
-            })
-            
-            # Create enhanced message with calculated metrics
-            enhanced_message = MarketDataMessage(
-                symbol=symbol,
-                price=message.price,
-                volume=message.volume,
-                timestamp=message.timestamp,
-                bid=message.bid,
-                ask=message.ask,
-                change=price_change,
-                change_percent=price_change_pct,
-                provider=message.provider
-            )
+            # Attach calculated metrics to the message itself rather than copying it
+            message.change = price_change
+            message.change_percent = price_change_pct
             
-            # Notify handlers
-            for handler in self.message_handlers:
+            # Notify handlers; a failing handler does not affect the others
+            for handler in self._sync_handlers:
                 try:
-                    if asyncio.iscoroutinefunction(handler):
-                        await handler(enhanced_message)
-                    else:
-                        handler(enhanced_message)
+                    handler(message)
                 except Exception as e:
                     self.logger.error(f"Error in message handler: {e}")
+            
+            if self._async_handlers:
+                results = await asyncio.gather(
+                    *(handler(message) for handler in self._async_handlers),
+                    return_exceptions=True
+                )
+                for result in results:
+                    if isinstance(result, Exception):
+                        self.logger.error(f"Error in message handler: {result}")
                     
         except Exception as e:
             self.logger.error(f"Error processing message for {message.symbol}: {e}")
@@ -93,48 +113,54 @@ class DataProcessor:
     
     def get_price_statistics(self, symbol: str, minutes: int = 5) -> Dict[str, float]:
         """Get price statistics for the last N minutes"""
-        if symbol not in self.price_buffers:
-            return {}
-        
-        cutoff_time = datetime.now() - timedelta(minutes=minutes)
-        recent_prices = [
-            entry['price'] for entry in self.price_buffers[symbol]
-            if entry['timestamp'] >= cutoff_time
-        ]
-        
-        if not recent_prices:
+        recent_prices = self._recent(self._prices, symbol, minutes)
+        if recent_prices is None:
             return {}
         
+        min_price, max_price, avg_price, price_std = _window_stats(recent_prices)
         return {
-            'min_price': min(recent_prices),
-            'max_price': max(recent_prices),
-            'avg_price': statistics.mean(recent_prices),
-            'median_price': statistics.median(recent_prices),
-            'price_std': statistics.stdev(recent_prices) if len(recent_prices) > 1 else 0,
+            'min_price': float(min_price),
+            'max_price': float(max_price),
+            'avg_price': float(avg_price),
+            'median_price': float(np.median(recent_prices)),
+            'price_std': float(price_std),
             'sample_count': len(recent_prices)
         }
     
     def get_volume_statistics(self, symbol: str, minutes: int = 5) -> Dict[str, float]:
         """Get volume statistics for the last N minutes"""
-        if symbol not in self.volume_buffers:
-            return {}
-        
-        cutoff_time = datetime.now() - timedelta(minutes=minutes)
-        recent_volumes = [
-            entry['volume'] for entry in self.volume_buffers[symbol]
-            if entry['timestamp'] >= cutoff_time
-        ]
-        
-        if not recent_volumes:
+        recent_volumes = self._recent(self._volumes, symbol, minutes)
+        if recent_volumes is None:
             return {}
         
         return {
-            'total_volume': sum(recent_volumes),
-            'avg_volume': statistics.mean(recent_volumes),
-            'max_volume': max(recent_volumes),
+            'total_volume': float(recent_volumes.sum()),
+            'avg_volume': float(recent_volumes.mean()),
+            'max_volume': float(recent_volumes.max()),
             'sample_count': len(recent_volumes)
         }
     
+    def _recent(self, buffers: Dict[str, np.ndarray], symbol: str, minutes: int) -> Optional[np.ndarray]:
+        """Buffered values for symbol from the last N minutes, or None if there are none"""
+        if not self._head.get(symbol):
+            return None
+        
+        head, size = self._head[symbol], self.buffer_size
+        count = min(head, size)
+        # Once wrapped, [split:] holds the older ticks and [:split] the newer ones
+        split = head % size if head > size else 0
+        ts, values = self._ts[symbol], buffers[symbol]
+        cutoff_ns = time.time_ns() - minutes * 60_000_000_000
+        
+        # Ticks arrive in time order, so each segment is sorted
+        if split and cutoff_ns <= ts[count - 1]:
+            start = split + int(np.searchsorted(ts[split:count], cutoff_ns))
+            recent = np.concatenate((values[start:count], values[:split]))
+        else:
+            end = split or count
+            recent = values[int(np.searchsorted(ts[:end], cutoff_ns)):end]
+        return recent if len(recent) else None
+    
     def get_all_symbols(self) -> List[str]:
         """Get all symbols being tracked"""
         return list(self.latest_prices.keys())
@@ -150,3 +176,37 @@ class DataProcessor:
                 'volume_stats_5min': self.get_volume_statistics(symbol, 5)
             }
         return summary
+
+def _to_ns(timestamp: datetime) -> int:
+    """Nanoseconds since the Unix epoch (naive timestamps are local time, as from datetime.now())"""
+    return int(timestamp.timestamp() * 1_000_000_000)
+
+def _window_stats_kernel(values: np.ndarray):
+    """Min, max, mean and sample std (0 below two samples) in one Welford pass"""
+    low = values[0]
+    high = values[0]
+    mean = 0.0
+    m2 = 0.0
+    
+    for i in range(values.shape[0]):
+        x = values[i]
+        if x < low:
+            low = x
+        elif x > high:
+            high = x
+        delta = x - mean
+        mean += delta / (i + 1)
+        m2 += delta * (x - mean)
+    
+    n = values.shape[0]
+    return low, high, mean, math.sqrt(m2 / (n - 1)) if n > 1 else 0.0
+
+if NUMBA_AVAILABLE:
+    _window_stats_kernel = njit(cache=True)(_window_stats_kernel)
+
+def _window_stats(values: np.ndarray):
+    """Min, max, mean and sample std of a non-empty window, fused into one pass with numba"""
+    if NUMBA_AVAILABLE:
+        return _window_stats_kernel(values)
+    std = values.std(ddof=1) if len(values) > 1 else 0.0
+    return values.min(), values.max(), values.mean(), std
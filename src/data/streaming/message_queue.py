@@ -5,17 +5,18 @@ import asyncio
 import logging
 from collections import deque
 from typing import Dict, List, Optional, Any, Callable
-from datetime import datetime, timedelta
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 import json
 
 from . import MarketDataMessage
 
+MAX_BATCH_SIZE = 256  # messages handled per wake-up of the processing loop
+
 @dataclass
 class QueuedMessage:
     """Wrapper for queued messages with metadata"""
     message: MarketDataMessage
-    queue_time: datetime = field(default_factory=datetime.now)
+    queue_time: float = 0.0  # event loop (monotonic) time at enqueue
     retry_count: int = 0
     priority: int = 1  # 1 = normal, 0 = high priority
 
@@ -40,7 +41,9 @@ class MessageQueue:
     async def enqueue(self, message: MarketDataMessage, priority: int = 1) -> bool:
         """Add message to queue"""
         try:
-            queued_msg = QueuedMessage(message=message, priority=priority)
+            queued_msg = QueuedMessage(
+                message=message, priority=priority, queue_time=asyncio.get_running_loop().time()
+            )
             
             if self.queue.full():
                 self.logger.warning("Queue is full, dropping oldest message")
@@ -63,43 +66,54 @@ class MessageQueue:
         """Start processing messages from queue"""
         self.is_running = True
         self.logger.info("Message queue processing started")
+        loop = asyncio.get_running_loop()
         
         try:
             while self.is_running:
                 try:
-                    # Get message with timeout
-                    queued_msg = await asyncio.wait_for(self.queue.get(), timeout=1.0)
+                    # Wait (with timeout) for one message, then drain whatever else is queued
+                    batch = [await asyncio.wait_for(self.queue.get(), timeout=1.0)]
+                    while len(batch) < MAX_BATCH_SIZE:
+                        try:
+                            batch.append(self.queue.get_nowait())
+                        except asyncio.QueueEmpty:
+                            break
                     
                     # Check message age
-                    age = (datetime.now() - queued_msg.queue_time).total_seconds()
-                    if age > self.max_age_seconds:
-                        self.logger.warning(f"Dropping stale message (age: {age:.1f}s)")
-                        self.dropped_count += 1
-                        continue
+                    now = loop.time()
+                    fresh = [
+                        queued_msg for queued_msg in batch
+                        if now - queued_msg.queue_time <= self.max_age_seconds
+                    ]
+                    stale_count = len(batch) - len(fresh)
+                    if stale_count:
+                        self.logger.warning(f"Dropping {stale_count} stale message(s)")
+                        self.dropped_count += stale_count
                     
-                    # Process message with all handlers
-                    success = True
-                    for handler in self.handlers:
-                        try:
-                            if asyncio.iscoroutinefunction(handler):
-                                await handler(queued_msg.message)
-                            else:
-                                handler(queued_msg.message)
-                        except Exception as e:
-                            self.logger.error(f"Handler error: {e}")
-                            success = False
-                            self.error_count += 1
-                    
-                    if success:
-                        self.processed_count += 1
-                    else:
-                        # Retry logic
-                        if queued_msg.retry_count < 3:
-                            queued_msg.retry_count += 1
-                            await self.queue.put(queued_msg)
+                    for queued_msg in fresh:
+                        # Process message with all handlers
+                        success = True
+                        for handler in self.handlers:
+                            try:
+                                if asyncio.iscoroutinefunction(handler):
+                                    await handler(queued_msg.message)
+                                else:
+                                    handler(queued_msg.message)
+                            except Exception as e:
+                                self.logger.error(f"Handler error: {e}")
+                                success = False
+                                self.error_count += 1
+                        
+                        if success:
+                            self.processed_count += 1
                         else:
-                            self.logger.error("Max retries exceeded, dropping message")
-                            self.dropped_count += 1
+                            # Retry logic
+                            if queued_msg.retry_count < 3:
+                                queued_msg.retry_count += 1
+                                await self.queue.put(queued_msg)
+                            else:
+                                self.logger.error("Max retries exceeded, dropping message")
+                                self.dropped_count += 1
                             
                 except asyncio.TimeoutError:
                     # No message available, continue
@@ -158,7 +172,9 @@ class PriorityMessageQueue(MessageQueue):
     async def enqueue(self, message: MarketDataMessage, priority: int = 1) -> bool:
         """Add message to appropriate priority queue"""
         try:
-            queued_msg = QueuedMessage(message=message, priority=priority)
+            queued_msg = QueuedMessage(
+                message=message, priority=priority, queue_time=asyncio.get_running_loop().time()
+            )
             
             if priority == 0:  # High priority
                 if self.high_priority_queue.full():
@@ -187,6 +203,7 @@ class PriorityMessageQueue(MessageQueue):
         """Start processing with priority handling"""
         self.is_running = True
         self.logger.info("Priority message queue processing started")
+        loop = asyncio.get_running_loop()
         
         try:
             while self.is_running:
@@ -209,7 +226,7 @@ class PriorityMessageQueue(MessageQueue):
                     
                     if queued_msg:
                         # Process message (same logic as parent class)
-                        age = (datetime.now() - queued_msg.queue_time).total_seconds()
+                        age = loop.time() - queued_msg.queue_time
                         if age > self.max_age_seconds:
                             self.logger.warning(f"Dropping stale message (age: {age:.1f}s)")
                             self.dropped_count += 1
@@ -8,7 +8,28 @@ from typing import List, Optional
 from datetime import datetime
 import websockets
 
-from . import WebSocketClient, MarketDataMessage
+from . import WebSocketClient, MarketDataMessage, MSGSPEC_AVAILABLE
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+if MSGSPEC_AVAILABLE:
+    import msgspec
+    
+    class _BinanceTicker(msgspec.Struct):
+        """Fields of a Binance 24h ticker event used by the client"""
+        s: str
+        c: float
+        v: float = 0.0
+        b: float = 0.0
+        a: float = 0.0
+        P: float = 0.0
+        p: float = 0.0
+
+_json_loads = orjson.loads if ORJSON_AVAILABLE else json.loads
 
 class YahooFinanceWebSocket(WebSocketClient):
     """Yahoo Finance WebSocket client (simulated - Yahoo doesn't have public WS)"""
@@ -59,16 +80,8 @@ class YahooFinanceWebSocket(WebSocketClient):
                             provider=self.provider
                         )
                         
-                        # Notify handlers
-                        for handler in self.message_handlers:
-                            try:
-                                if asyncio.iscoroutinefunction(handler):
-                                    await handler(message)
-                                else:
-                                    handler(message)
-                            except Exception as e:
-                                self.logger.error(f"Error in message handler: {e}")
-                                
+                        await self._dispatch(message)
+                        
                     except Exception as e:
                         self.logger.error(f"Error fetching data for {symbol}: {e}")
                 
@@ -133,16 +146,8 @@ class AlphaVantageWebSocket(WebSocketClient):
                         provider=self.provider
                     )
                     
-                    # Notify handlers
-                    for handler in self.message_handlers:
-                        try:
-                            if asyncio.iscoroutinefunction(handler):
-                                await handler(message)
-                            else:
-                                handler(message)
-                        except Exception as e:
-                            self.logger.error(f"Error in message handler: {e}")
-                            
+                    await self._dispatch(message)
+                    
                 except Exception as e:
                     self.logger.error(f"Error fetching data for {symbol}: {e}")
                 
@@ -152,6 +157,7 @@ class AlphaVantageWebSocket(WebSocketClient):
             self.logger.error(f"Streaming error: {e}")
         finally:
             self.is_connected = False
+            await provider.aclose()
 
 class BinanceWebSocket(WebSocketClient):
     """Binance WebSocket client for crypto data"""
@@ -160,6 +166,8 @@ class BinanceWebSocket(WebSocketClient):
         super().__init__(symbols)
         self.provider = "binance"
         self.base_url = "wss://stream.binance.com:9443/ws/"
+        # Decodes ticker frames straight into typed fields (numeric strings coerced in C)
+        self._decoder = msgspec.json.Decoder(_BinanceTicker, strict=False) if MSGSPEC_AVAILABLE else None
     
     async def connect(self) -> bool:
         """Connect to Binance WebSocket"""
@@ -192,8 +200,29 @@ class BinanceWebSocket(WebSocketClient):
     
     async def parse_message(self, message: str) -> Optional[MarketDataMessage]:
         """Parse Binance ticker message"""
+        if self._decoder is not None:
+            try:
+                tick = self._decoder.decode(message)
+            except msgspec.ValidationError:
+                return None  # not a ticker event
+            except msgspec.DecodeError as e:
+                self.logger.error(f"Error parsing Binance message: {e}")
+                return None
+            
+            return MarketDataMessage(
+                symbol=tick.s.upper(),
+                price=tick.c,
+                volume=tick.v,
+                timestamp=datetime.now(),
+                bid=tick.b,
+                ask=tick.a,
+                change=tick.P,
+                change_percent=tick.p,
+                provider=self.provider
+            )
+        
         try:
-            data = json.loads(message)
+            data = _json_loads(message)
             
             if 'c' in data and 's' in data:  # Current price and symbol
                 return MarketDataMessage(
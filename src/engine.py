@@ -10,7 +10,7 @@ import pandas as pd
 from .config import config
 from .data.providers.yahoo_finance import YahooFinanceProvider
 from .data.providers.alpha_vantage import AlphaVantageProvider
-from .data.storage.database import DatabaseManager, MarketData, Trade, Portfolio as PortfolioSnapshot
+from .data.storage.database import DatabaseManager, Trade, Portfolio as PortfolioSnapshot
 from .execution.portfolio import Portfolio
 from .strategies.base import BaseStrategy
 from .strategies.technical.moving_average import MovingAverageCrossover
@@ -153,27 +153,12 @@ class QuantFlowEngine:
     
     async def _store_historical_data(self, data: pd.DataFrame):
         """Store historical data in database"""
-        session = self.db_manager.get_session()
         try:
-            for _, row in data.iterrows():
-                market_data = MarketData(
-                    symbol=row['symbol'],
-                    timestamp=row['timestamp'],
-                    open_price=row['open_price'],
-                    high_price=row['high_price'],
-                    low_price=row['low_price'],
-                    close_price=row['close_price'],
-                    volume=row['volume'],
-                    provider=row.get('provider', 'unknown')
-                )
-                session.merge(market_data)  # Use merge to handle duplicates
-            
-            session.commit()
+            columns = ['symbol', 'timestamp', 'open_price', 'high_price', 'low_price', 'close_price', 'volume']
+            rows = data[columns].assign(provider=data.get('provider', 'unknown')).to_dict('records')
+            self.db_manager.bulk_insert_market_data(rows)
         except Exception as e:
-            session.rollback()
             self.logger.error(f"Error storing historical data: {str(e)}")
-        finally:
-            session.close()
     
     async def run_backtest(
         self, 
@@ -367,6 +352,13 @@ class QuantFlowEngine:
             strategy.stop()
         self.logger.info("QuantFlow engine stopped")
     
+    async def close(self):
+        """Release provider resources such as shared HTTP sessions"""
+        for provider in self.data_providers.values():
+            aclose = getattr(provider, 'aclose', None)
+            if aclose is not None:
+                await aclose()
+    
     def get_portfolio_summary(self) -> Dict[str, Any]:
         """Get current portfolio summary"""
         return self.portfolio.to_dict()
@@ -31,6 +31,7 @@ class RealTimeTradingEngine:
         self.portfolio = Portfolio(initial_capital)
         self.message_queue = MessageQueue()
         self.data_processor = DataProcessor()
+        self.data_processor.register_symbols(symbols)
         self.risk_manager = RiskManager()
         self.dashboard = RealTimeDashboard()
         self.metrics_tracker = MetricsTracker()
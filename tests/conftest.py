@@ -0,0 +1,29 @@
+"""
+Shared fixtures for the QuantFlow test suite
+"""
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import numpy as np
+import pandas as pd
+import pytest
+
+@pytest.fixture
+def market_data() -> pd.DataFrame:
+    """Two symbols of synthetic daily OHLCV data in the provider layout"""
+    rng = np.random.default_rng(0)
+    timestamps = pd.date_range('2022-01-03', periods=160, freq='B', tz='America/New_York')
+    frames = []
+    for symbol in ('AAA', 'BBB'):
+        close = 100 * np.cumprod(1 + rng.normal(0, 0.015, len(timestamps)))
+        frames.append(pd.DataFrame({
+            'timestamp': timestamps,
+            'symbol': symbol,
+            'open_price': close,
+            'high_price': close * 1.01,
+            'low_price': close * 0.99,
+            'close_price': close,
+            'volume': 1000.0
+        }))
+    return pd.concat(frames).sort_values('timestamp').reset_index(drop=True)
@@ -0,0 +1,28 @@
+"""
+Tests for the Alpha Vantage provider
+"""
+import asyncio
+import logging
+from datetime import date
+
+import pandas as pd
+
+from src.data.providers.alpha_vantage import AlphaVantageProvider
+
+def test_batch_logs_symbols_that_fail(monkeypatch, caplog):
+    provider = AlphaVantageProvider('demo', cache_dir=None)
+    
+    async def fake_fetch(symbol, start_date, end_date, interval='1d'):
+        if symbol == 'BAD':
+            raise Exception(f"Error fetching Alpha Vantage data for {symbol}: Invalid API call")
+        return pd.DataFrame({'symbol': [symbol]})
+    
+    monkeypatch.setattr(provider, 'get_historical_data', fake_fetch)
+    with caplog.at_level(logging.WARNING):
+        result = asyncio.run(provider.get_historical_data_batch(
+            ['AAA', 'BAD', 'BBB'], date(2024, 1, 1), date(2024, 2, 1)
+        ))
+    
+    assert list(result) == ['AAA', 'BBB']
+    assert any('BAD' in record.getMessage() and 'Invalid API call' in record.getMessage()
+               for record in caplog.records)
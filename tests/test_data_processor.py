@@ -0,0 +1,121 @@
+"""
+Tests for the streaming data processor's ring buffers
+"""
+import asyncio
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+from src.data.streaming import MarketDataMessage
+from src.data.streaming import data_processor
+from src.data.streaming.data_processor import DataProcessor
+
+NOW = 1_700_000_000  # seconds since the epoch
+
+@pytest.fixture(autouse=True)
+def frozen_clock(monkeypatch):
+    monkeypatch.setattr(data_processor.time, 'time_ns', lambda: NOW * 1_000_000_000)
+
+def _feed(processor: DataProcessor, ticks, symbol: str = 'AAA'):
+    """Process (seconds ago, price) ticks in order; volume is the price times ten"""
+    async def run():
+        for seconds_ago, price in ticks:
+            await processor.process_message(MarketDataMessage(
+                symbol=symbol, price=price, volume=price * 10,
+                timestamp=datetime.fromtimestamp(NOW - seconds_ago)
+            ))
+    asyncio.run(run())
+
+def _window(processor: DataProcessor, minutes: int = 5, symbol: str = 'AAA'):
+    recent = processor._recent(processor._prices, symbol, minutes)
+    return None if recent is None else recent.tolist()
+
+def test_no_ticks_gives_empty_statistics():
+    processor = DataProcessor(buffer_size=4)
+    processor.register_symbols(['AAA'])
+    
+    assert processor.get_price_statistics('AAA') == {}
+    assert processor.get_volume_statistics('AAA') == {}
+    assert processor.get_price_statistics('BBB') == {}
+
+def test_first_tick_fills_a_preallocated_buffer():
+    processor = DataProcessor(buffer_size=4)
+    processor.register_symbols(['AAA'])
+    buffer = processor._prices['AAA']
+    
+    _feed(processor, [(10, 100.0)])
+    
+    assert processor._prices['AAA'] is buffer
+    stats = processor.get_price_statistics('AAA')
+    assert stats['sample_count'] == 1
+    assert stats['min_price'] == stats['max_price'] == stats['avg_price'] == 100.0
+    assert stats['price_std'] == 0.0
+
+def test_unregistered_symbol_gets_buffers_on_first_tick():
+    processor = DataProcessor(buffer_size=4)
+    _feed(processor, [(10, 100.0), (5, 101.0)], symbol='NEW')
+    assert _window(processor, symbol='NEW') == [100.0, 101.0]
+
+def test_partial_buffer_window_boundaries():
+    processor = DataProcessor(buffer_size=8)
+    # The cutoff for a one-minute window is exactly 60 seconds ago
+    _feed(processor, [(120, 1.0), (61, 2.0), (60, 3.0), (59, 4.0), (0, 5.0)])
+    
+    assert _window(processor, minutes=1) == [3.0, 4.0, 5.0]
+    assert _window(processor, minutes=5) == [1.0, 2.0, 3.0, 4.0, 5.0]
+
+def test_window_with_only_stale_ticks_is_empty():
+    processor = DataProcessor(buffer_size=4)
+    _feed(processor, [(600, 1.0), (400, 2.0)])
+    
+    assert _window(processor, minutes=5) is None
+    assert processor.get_volume_statistics('AAA', minutes=5) == {}
+
+def test_wrapped_buffer_keeps_the_newest_ticks_in_time_order():
+    processor = DataProcessor(buffer_size=4)
+    _feed(processor, [(100 - i, float(i)) for i in range(7)])
+    
+    assert _window(processor) == [3.0, 4.0, 5.0, 6.0]
+    stats = processor.get_volume_statistics('AAA')
+    assert stats['sample_count'] == 4
+    assert stats['total_volume'] == 180.0
+
+def test_wrapped_buffer_at_an_exact_multiple_of_its_size():
+    processor = DataProcessor(buffer_size=4)
+    _feed(processor, [(100 - i, float(i)) for i in range(8)])
+    
+    assert _window(processor) == [4.0, 5.0, 6.0, 7.0]
+
+@pytest.mark.parametrize('minutes, expected', [
+    # Cutoff inside the older segment [split:]
+    (2, [2.0, 3.0, 4.0, 5.0]),
+    # Cutoff on the newest tick of the older segment
+    (1, [3.0, 4.0, 5.0]),
+])
+def test_wrapped_buffer_cutoff_in_older_segment(minutes, expected):
+    processor = DataProcessor(buffer_size=4)
+    # Six ticks into four slots: slots hold [4, 5, 2, 3], split at 2
+    _feed(processor, [(300, 0.0), (200, 1.0), (90, 2.0), (60, 3.0), (30, 4.0), (0, 5.0)])
+    assert _window(processor, minutes=minutes) == expected
+
+def test_wrapped_buffer_cutoff_in_newer_segment():
+    processor = DataProcessor(buffer_size=4)
+    _feed(processor, [(500, 0.0), (400, 1.0), (300, 2.0), (200, 3.0), (61, 4.0), (0, 5.0)])
+    
+    assert _window(processor, minutes=1) == [5.0]
+    assert _window(processor, minutes=3) == [4.0, 5.0]
+
+def test_statistics_match_numpy_over_a_wrapped_window():
+    processor = DataProcessor(buffer_size=16)
+    prices = np.random.default_rng(0).normal(100, 2, 40)
+    _feed(processor, [(40 - i, float(p)) for i, p in enumerate(prices)])
+    
+    stats = processor.get_price_statistics('AAA')
+    window = prices[-16:]
+    assert stats['sample_count'] == 16
+    assert stats['min_price'] == window.min()
+    assert stats['max_price'] == window.max()
+    assert np.isclose(stats['avg_price'], window.mean(), rtol=1e-12)
+    assert np.isclose(stats['price_std'], window.std(ddof=1), rtol=1e-12)
+    assert stats['median_price'] == np.median(window)
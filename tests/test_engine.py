@@ -0,0 +1,25 @@
+"""
+Tests for the main QuantFlow engine
+"""
+import asyncio
+
+from src.data.providers.alpha_vantage import AlphaVantageProvider
+from src.data.providers.yahoo_finance import YahooFinanceProvider
+from src.engine import QuantFlowEngine
+
+def test_close_releases_provider_sessions():
+    # Skip __init__: only the providers matter here
+    engine = QuantFlowEngine.__new__(QuantFlowEngine)
+    engine.data_providers = {
+        'yahoo': YahooFinanceProvider(),
+        'alpha_vantage': AlphaVantageProvider('demo', cache_dir=None)
+    }
+    
+    async def run():
+        session = await engine.data_providers['alpha_vantage']._get_session()
+        await engine.close()
+        return session
+    
+    session = asyncio.run(run())
+    assert session.closed
+    assert engine.data_providers['alpha_vantage']._session is None
@@ -0,0 +1,130 @@
+"""
+Tests for performance metrics
+"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.backtesting import metrics as metrics_module
+from src.backtesting.metrics import PerformanceMetrics
+
+def _portfolio(values) -> pd.Series:
+    return pd.Series(values, index=pd.date_range('2024-01-01', periods=len(values), freq='B'))
+
+def _trades(pnl) -> pd.DataFrame:
+    dates = pd.date_range('2024-01-01', periods=len(pnl), freq='B')
+    return pd.DataFrame({'pnl': pnl, 'entry_date': dates, 'exit_date': dates + pd.Timedelta(days=3)})
+
+def test_cache_tells_apart_series_with_equal_endpoints():
+    metrics = PerformanceMetrics(cache_size=8)
+    trades = pd.DataFrame()
+    
+    smooth = metrics.calculate_all_metrics(_portfolio([100.0, 101.0, 102.0, 103.0, 104.0]), trades)
+    # Same length, dates and first/last values, but a different path
+    bumpy = metrics.calculate_all_metrics(_portfolio([100.0, 90.0, 115.0, 95.0, 104.0]), trades)
+    
+    assert bumpy['volatility'] != smooth['volatility']
+    assert bumpy == PerformanceMetrics().calculate_all_metrics(
+        _portfolio([100.0, 90.0, 115.0, 95.0, 104.0]), trades
+    )
+
+def test_cache_sees_equal_trades_in_new_objects():
+    metrics = PerformanceMetrics(cache_size=8)
+    portfolio = _portfolio(np.linspace(100.0, 110.0, 20))
+    
+    first = metrics.calculate_all_metrics(portfolio, _trades([5.0, -2.0]))
+    second = metrics.calculate_all_metrics(portfolio, _trades([-5.0, -2.0]))
+    
+    assert first['win_rate'] != second['win_rate']
+    assert len(metrics._cache) == 2
+
+def _returns(n: int = 250, seed: int = 1) -> np.ndarray:
+    return np.random.default_rng(seed).normal(0.0005, 0.01, n)
+
+def test_sortino_uses_downside_deviation_over_all_periods():
+    r = _returns()
+    metrics = PerformanceMetrics(risk_free_rate=0.02)
+    
+    result = metrics._calculate_risk_metrics(_portfolio(np.ones(2)), returns=r)
+    
+    downside_deviation = np.sqrt(np.mean(np.minimum(r, 0.0) ** 2)) * np.sqrt(252)
+    expected = (r.mean() * 252 - 0.02) / downside_deviation
+    assert np.isclose(result['sortino_ratio'], expected, rtol=1e-12)
+
+def test_sortino_is_infinite_without_losses():
+    result = PerformanceMetrics()._calculate_risk_metrics(_portfolio(np.ones(2)), returns=np.array([0.01, 0.02, 0.0]))
+    assert result['sortino_ratio'] == float('inf')
+
+def test_beta_and_tracking_error_use_sample_statistics():
+    benchmark = _portfolio(100 * np.cumprod(1 + _returns(seed=2)))
+    portfolio = _portfolio(100 * np.cumprod(1 + _returns(seed=3)))
+    
+    result = PerformanceMetrics()._calculate_benchmark_metrics(portfolio, benchmark)
+    
+    p = portfolio.pct_change().dropna().to_numpy()
+    b = benchmark.pct_change().dropna().to_numpy()
+    beta = np.cov(p, b, ddof=1)[0, 1] / np.var(b, ddof=1)
+    assert np.isclose(result['beta'], beta, rtol=1e-10)
+    assert np.isclose(result['alpha'], (p.mean() - beta * b.mean()) * 252, rtol=1e-10)
+    assert np.isclose(result['tracking_error'], np.std(p - b, ddof=1) * np.sqrt(252), rtol=1e-10)
+
+@pytest.fixture
+def pure_numpy(monkeypatch):
+    """Switch off the numba kernels and bottleneck reductions for one call"""
+    def run(func, *args):
+        with monkeypatch.context() as patch:
+            patch.setattr(metrics_module, 'NUMBA_AVAILABLE', False)
+            patch.setattr(metrics_module, 'BOTTLENECK_AVAILABLE', False)
+            return func(*args)
+    return run
+
+def _assert_same(actual, expected):
+    for a, e in zip(np.atleast_1d(actual), np.atleast_1d(expected)):
+        np.testing.assert_allclose(a, e, rtol=1e-12, atol=0)
+
+@pytest.mark.skipif(not metrics_module.BOTTLENECK_AVAILABLE, reason="bottleneck not installed")
+@pytest.mark.parametrize('reduction', ['_mean', '_std', '_max'])
+def test_bottleneck_reductions_match_numpy(pure_numpy, reduction):
+    a = _returns()
+    a[[3, 40, 41]] = np.nan
+    func = getattr(metrics_module, reduction)
+    _assert_same(func(a), pure_numpy(func, a))
+
+@pytest.mark.skipif(not metrics_module.NUMBA_AVAILABLE, reason="numba not installed")
+def test_returns_drawdown_kernel_matches_numpy(pure_numpy):
+    values = 100 * np.cumprod(1 + _returns())
+    values[[0, 50, 51, 120, -1]] = np.nan
+    
+    returns, stats = metrics_module._returns_and_drawdown(values)
+    expected_returns, expected_stats = pure_numpy(metrics_module._returns_and_drawdown, values)
+    
+    _assert_same(returns, expected_returns)
+    _assert_same(stats, expected_stats)
+
+@pytest.mark.skipif(not metrics_module.NUMBA_AVAILABLE, reason="numba not installed")
+def test_consecutive_kernel_matches_numpy(pure_numpy):
+    pnl = np.array([1.0, 2.0, np.nan, 3.0, -1.0, -2.0, -3.0, 0.0, -1.0, np.nan, np.nan, 4.0, 5.0])
+    assert metrics_module._consecutive_runs(pnl) == pure_numpy(metrics_module._consecutive_runs, pnl)
+
+@pytest.mark.skipif(not metrics_module.NUMBA_AVAILABLE, reason="numba not installed")
+@pytest.mark.parametrize('with_nan', [False, True])
+def test_mean_var_cov_kernel_matches_numpy(pure_numpy, with_nan):
+    x, y = _returns(seed=4), _returns(seed=5)
+    if with_nan:
+        x[7] = np.nan
+    _assert_same(metrics_module._mean_var_cov(x, y), pure_numpy(metrics_module._mean_var_cov, x, y))
+
+def test_all_metrics_match_pure_numpy(pure_numpy):
+    portfolio = _portfolio(100 * np.cumprod(1 + _returns()))
+    portfolio.iloc[[30, 31, 90]] = np.nan
+    benchmark = _portfolio(100 * np.cumprod(1 + _returns(seed=6)))
+    trades = _trades(list(_returns(40, seed=7) * 1000))
+    trades.loc[5, 'pnl'] = np.nan
+    metrics = PerformanceMetrics()
+    
+    actual = metrics.calculate_all_metrics(portfolio, trades, benchmark)
+    expected = pure_numpy(metrics.calculate_all_metrics, portfolio, trades, benchmark)
+    
+    assert actual.keys() == expected.keys()
+    for name, value in expected.items():
+        np.testing.assert_allclose(actual[name], value, rtol=1e-9, err_msg=name)
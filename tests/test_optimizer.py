@@ -0,0 +1,105 @@
+"""
+Tests for strategy parameter optimization
+"""
+import pytest
+
+from src.backtesting.engine import BacktestEngine, BacktestConfig
+from src.backtesting.optimizer import ParameterOptimizer, ParameterSpace
+
+class MovingAverageCrossover:
+    """Synchronous crossover strategy; workers unpickle it from this module"""
+    
+    def __init__(self, short_window: int = 5, long_window: int = 20, position_size: float = 0.3):
+        self.name = f"MA_{short_window}_{long_window}"
+        self.short_window = short_window
+        self.long_window = long_window
+        self.position_size = position_size
+    
+    def generate_signals(self, data, portfolio):
+        signals = []
+        for symbol in data['symbol'].unique():
+            close = data.loc[data['symbol'] == symbol, 'close_price']
+            if len(close) <= self.long_window:
+                continue
+            short = close.rolling(self.short_window).mean()
+            long = close.rolling(self.long_window).mean()
+            if short.iloc[-2] <= long.iloc[-2] and short.iloc[-1] > long.iloc[-1]:
+                signals.append({'symbol': symbol, 'action': 'buy', 'position_size': self.position_size})
+            elif (short.iloc[-2] >= long.iloc[-2] and short.iloc[-1] < long.iloc[-1]
+                    and symbol in portfolio['positions']):
+                signals.append({'symbol': symbol, 'action': 'sell'})
+        return signals
+
+def _parameter_space() -> ParameterSpace:
+    space = ParameterSpace()
+    space.add_parameter('short_window', 'integer', (3, 5))
+    space.add_parameter('long_window', 'choice', [10, 15])
+    return space
+
+def test_parallel_search_sees_engine_config_changes(market_data):
+    """Workers started before a config change must not serve later searches"""
+    with ParameterOptimizer(BacktestEngine(BacktestConfig(commission=0.001)), cache_size=0) as optimizer:
+        before = optimizer.grid_search(MovingAverageCrossover, _parameter_space(), market_data, n_jobs=2)
+        optimizer.engine.config.commission = 0.05
+        after = optimizer.grid_search(MovingAverageCrossover, _parameter_space(), market_data, n_jobs=2)
+    
+    with ParameterOptimizer(BacktestEngine(BacktestConfig(commission=0.05)), cache_size=0) as fresh:
+        expected = fresh.grid_search(MovingAverageCrossover, _parameter_space(), market_data, n_jobs=1)
+    
+    assert after['best_metric_value'] != before['best_metric_value']
+    assert after['best_metric_value'] == expected['best_metric_value']
+
+def test_parallel_search_reuses_pool_for_unchanged_data(market_data):
+    with ParameterOptimizer() as optimizer:
+        optimizer.grid_search(MovingAverageCrossover, _parameter_space(), market_data, n_jobs=2)
+        pool = optimizer._pool
+        optimizer.grid_search(MovingAverageCrossover, _parameter_space(), market_data, n_jobs=2)
+        assert optimizer._pool is pool
+
+def test_engine_config_change_invalidates_cached_evaluations(market_data):
+    with ParameterOptimizer(BacktestEngine(BacktestConfig(commission=0.05))) as fresh:
+        expected = fresh.grid_search(MovingAverageCrossover, _parameter_space(), market_data)
+    
+    with ParameterOptimizer(BacktestEngine(BacktestConfig(commission=0.001))) as optimizer:
+        before = optimizer.grid_search(MovingAverageCrossover, _parameter_space(), market_data)
+        optimizer.engine.config.commission = 0.05
+        after = optimizer.grid_search(MovingAverageCrossover, _parameter_space(), market_data)
+    
+    assert before['best_metric_value'] != expected['best_metric_value']
+    assert after['best_metric_value'] == expected['best_metric_value']
+
+def test_parallel_results_are_cached_under_the_workers_config(market_data):
+    with ParameterOptimizer(BacktestEngine(BacktestConfig(commission=0.05))) as fresh:
+        expected = fresh.grid_search(MovingAverageCrossover, _parameter_space(), market_data)
+    
+    with ParameterOptimizer(BacktestEngine(BacktestConfig(commission=0.001))) as optimizer:
+        optimizer.grid_search(MovingAverageCrossover, _parameter_space(), market_data, n_jobs=2)
+        optimizer.engine.config.commission = 0.05
+        parallel = optimizer.grid_search(MovingAverageCrossover, _parameter_space(), market_data, n_jobs=2)
+        # Every combination is now served from the cache filled by the workers
+        cached = optimizer.grid_search(MovingAverageCrossover, _parameter_space(), market_data)
+    
+    assert parallel['best_metric_value'] == expected['best_metric_value']
+    assert cached['best_metric_value'] == expected['best_metric_value']
+
+def test_bayesian_reports_the_calls_made_in_this_run(market_data, tmp_path):
+    pytest.importorskip('skopt')
+    checkpoint = str(tmp_path / 'bayes.pkl')
+    space = _parameter_space()
+    
+    with ParameterOptimizer() as optimizer:
+        first = optimizer.bayesian_optimization(
+            MovingAverageCrossover, space, market_data, n_calls=10, checkpoint_path=checkpoint
+        )
+        resumed = optimizer.bayesian_optimization(
+            MovingAverageCrossover, space, market_data, n_calls=3,
+            checkpoint_path=checkpoint, resume=True
+        )
+        converged = optimizer.bayesian_optimization(
+            MovingAverageCrossover, space, market_data, n_calls=30, convergence_tol=1e6
+        )
+    
+    assert first['n_iterations'] == first['n_iterations_actual'] == 10
+    assert resumed['n_iterations'] == 13
+    assert resumed['n_iterations_actual'] == 3
+    assert converged['n_iterations_actual'] < 30
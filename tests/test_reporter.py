@@ -0,0 +1,55 @@
+"""
+Tests for backtest report generation
+"""
+import os
+from datetime import date, datetime
+
+import pandas as pd
+
+from src.backtesting import reporter as reporter_module
+from src.backtesting.engine import BacktestResult
+from src.backtesting.reporter import BacktestReporter
+
+class _FrozenClock(datetime):
+    """Every report generated in the same second"""
+    
+    @classmethod
+    def now(cls, tz=None):
+        return cls(2024, 1, 2, 9, 30, 0)
+
+def _result() -> BacktestResult:
+    timestamps = pd.date_range('2024-01-01', periods=5, freq='D')
+    return BacktestResult(
+        strategy_name='MA', start_date=date(2024, 1, 1), end_date=date(2024, 1, 5),
+        initial_capital=100000.0, final_value=101000.0, total_return=1.0, annual_return=50.0,
+        volatility=10.0, sharpe_ratio=1.2, max_drawdown=-2.0, calmar_ratio=25.0,
+        win_rate=50.0, profit_factor=1.5, total_trades=2, avg_trade_duration=1.0,
+        portfolio_history=pd.DataFrame({'portfolio_value': [100000.0, 100500.0, 99800.0, 100700.0, 101000.0]},
+                                       index=timestamps),
+        trade_history=pd.DataFrame({'timestamp': timestamps[:2], 'symbol': ['AAA', 'AAA'],
+                                    'action': ['buy', 'sell'], 'quantity': [10, 10], 'price': [100.0, 110.0],
+                                    'pnl': [0.0, 100.0], 'return_pct': [0.0, 10.0]}),
+        metrics={'sharpe_ratio': 1.2}
+    )
+
+def test_reports_in_the_same_second_keep_their_own_files(tmp_path, monkeypatch):
+    monkeypatch.setattr(reporter_module, 'datetime', _FrozenClock)
+    reporter = BacktestReporter(str(tmp_path))
+    
+    first = reporter.generate_full_report(_result(), 'MA', include_plots=False, include_trades=False)
+    second = reporter.generate_full_report(_result(), 'MA', include_plots=False, include_trades=True)
+    
+    assert first['html'] != second['html']
+    assert first['metrics_json'] != second['metrics_json']
+    assert 'trades_csv' not in first and os.path.exists(second['trades_csv'])
+    assert all(os.path.exists(path) for path in first.values())
+
+def test_reports_are_regenerated_unless_reuse_is_requested(tmp_path):
+    reporter = BacktestReporter(str(tmp_path))
+    
+    reporter.generate_full_report(_result(), 'MA', include_plots=False)
+    assert not [name for name in os.listdir(tmp_path) if name.startswith('.report_')]
+    
+    reusable = reporter.generate_full_report(_result(), 'MA', include_plots=False, reuse_existing=True)
+    reused = reporter.generate_full_report(_result(), 'MA', include_plots=False, reuse_existing=True)
+    assert reused == reusable